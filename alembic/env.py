@@ -19,13 +19,14 @@ from app.core.database.database_manager import db_manager
 # 모델들을 명시적으로 import (Alembic이 테이블을 인식하도록)
 from app.users.models.user import User
 from app.auth.models.jwt_storage import JwtStorage
+from app.core.models.row_count import table_row_counts
 
 # IDE의 자동 import 정리를 방지하기 위해 명시적으로 사용
-__all__ = ["User", "JwtStorage"]
+__all__ = ["User", "JwtStorage", "table_row_counts"]
 
 # Alembic이 모델을 인식할 수 있도록 메타데이터에 등록
 # (이렇게 하면 IDE가 import를 삭제하지 않음)
-_models = [User, JwtStorage]
+_models = [User, JwtStorage, table_row_counts]
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,26 @@
+"""Refresh token fingerprint
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 10:12:41.204118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 기존 refresh_token(sha256_crypt 해시) 컬럼은 호환을 위해 유지하고,
+    # 다음 재발급 시 지문으로 교체됩니다.
+    op.add_column('jwt_storage', sa.Column('refresh_token_fingerprint', sa.CHAR(length=64), nullable=True, comment='리프레시 토큰 HMAC-SHA256 지문'))
+
+
+def downgrade() -> None:
+    op.drop_column('jwt_storage', 'refresh_token_fingerprint')
@@ -0,0 +1,33 @@
+"""Users keyset pagination index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 14:02:17.583210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_users_created_at_id',
+            'users',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_include=['email', 'profile_name', 'role', 'is_active', 'updated_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_users_created_at_id', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,81 @@
+"""Trigger-maintained users row counter
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 15:20:41.106482
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'table_row_counts',
+        sa.Column('table_name', sa.String(length=63), nullable=False),
+        sa.Column('row_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name'),
+    )
+
+    # 문장 단위 트리거: 행마다가 아니라 문장마다 한 번, 전이 테이블의 행 수만큼 증감
+    op.execute("""
+        CREATE FUNCTION users_row_count_insert() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts SET row_count = row_count + (SELECT count(*) FROM new_rows)
+            WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION users_row_count_delete() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts SET row_count = row_count - (SELECT count(*) FROM old_rows)
+            WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION users_row_count_truncate() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts SET row_count = 0 WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # 초기값 계산과 트리거 생성 사이에 쓰기가 끼어들지 않도록 잠금
+    op.execute("LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("""
+        CREATE TRIGGER users_row_count_insert AFTER INSERT ON users
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION users_row_count_insert()
+    """)
+    op.execute("""
+        CREATE TRIGGER users_row_count_delete AFTER DELETE ON users
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION users_row_count_delete()
+    """)
+    op.execute("""
+        CREATE TRIGGER users_row_count_truncate AFTER TRUNCATE ON users
+        FOR EACH STATEMENT EXECUTE FUNCTION users_row_count_truncate()
+    """)
+    op.execute("INSERT INTO table_row_counts (table_name, row_count) SELECT 'users', count(*) FROM users")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS users_row_count_truncate ON users")
+    op.execute("DROP TRIGGER IF EXISTS users_row_count_delete ON users")
+    op.execute("DROP TRIGGER IF EXISTS users_row_count_insert ON users")
+    op.execute("DROP FUNCTION IF EXISTS users_row_count_truncate()")
+    op.execute("DROP FUNCTION IF EXISTS users_row_count_delete()")
+    op.execute("DROP FUNCTION IF EXISTS users_row_count_insert()")
+    op.drop_table('table_row_counts')
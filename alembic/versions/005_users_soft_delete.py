@@ -0,0 +1,128 @@
+"""Users soft delete: partial indexes and active row counter
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 17:48:09.315724
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 카운터는 삭제되지 않은 사용자만 셉니다. deleted_at이 바뀌는 UPDATE도 반영합니다.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION users_row_count_insert() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts
+            SET row_count = row_count + (SELECT count(*) FROM new_rows WHERE deleted_at IS NULL)
+            WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION users_row_count_delete() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts
+            SET row_count = row_count - (SELECT count(*) FROM old_rows WHERE deleted_at IS NULL)
+            WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION users_row_count_update() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts
+            SET row_count = row_count + (
+                SELECT count(*) FILTER (WHERE old_rows.deleted_at IS NOT NULL AND new_rows.deleted_at IS NULL)
+                     - count(*) FILTER (WHERE old_rows.deleted_at IS NULL AND new_rows.deleted_at IS NOT NULL)
+                FROM old_rows JOIN new_rows USING (id)
+            )
+            WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("""
+        CREATE TRIGGER users_row_count_update AFTER UPDATE ON users
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION users_row_count_update()
+    """)
+    op.execute(
+        "UPDATE table_row_counts SET row_count = (SELECT count(*) FROM users WHERE deleted_at IS NULL) "
+        "WHERE table_name = 'users'"
+    )
+
+    # 운영 중인 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성/삭제 (트랜잭션 밖에서 실행)
+    # id 조회는 기본 키로 충분하므로 id 부분 인덱스는 만들지 않습니다.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_users_email_active',
+            'users',
+            ['email'],
+            unique=True,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index('idx_users_email', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_email', table_name='users', postgresql_concurrently=True)
+
+        op.create_index(
+            'idx_users_active_created_at_id',
+            'users',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_include=['email', 'profile_name', 'role', 'is_active', 'updated_at'],
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index('idx_users_created_at_id', table_name='users', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    # 삭제된 사용자와 같은 이메일로 재가입한 사용자가 있으면 유일 인덱스 생성이 실패합니다.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_users_created_at_id',
+            'users',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_include=['email', 'profile_name', 'role', 'is_active', 'updated_at'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('idx_users_active_created_at_id', table_name='users', postgresql_concurrently=True)
+
+        op.create_index('ix_users_email', 'users', ['email'], unique=True, postgresql_concurrently=True)
+        op.create_index('idx_users_email', 'users', ['email'], unique=True, postgresql_concurrently=True)
+        op.drop_index('uq_users_email_active', table_name='users', postgresql_concurrently=True)
+
+    op.execute("DROP TRIGGER IF EXISTS users_row_count_update ON users")
+    op.execute("DROP FUNCTION IF EXISTS users_row_count_update()")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION users_row_count_insert() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts SET row_count = row_count + (SELECT count(*) FROM new_rows)
+            WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION users_row_count_delete() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_row_counts SET row_count = row_count - (SELECT count(*) FROM old_rows)
+            WHERE table_name = 'users';
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("UPDATE table_row_counts SET row_count = (SELECT count(*) FROM users) WHERE table_name = 'users'")
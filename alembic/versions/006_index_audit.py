@@ -0,0 +1,32 @@
+"""Index audit: index jwt_storage.user_id, drop indexes duplicating primary keys
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 19:05:52.640118
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성/삭제 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        # 로그인/재발급/로그아웃 조회와 users 삭제 시 CASCADE 탐색
+        op.create_index('idx_jwt_storage_user_id', 'jwt_storage', ['user_id'], postgresql_concurrently=True)
+        # 기본 키 인덱스와 같은 컬럼의 인덱스
+        op.drop_index('ix_users_id', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_jwt_storage_id', table_name='jwt_storage', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_jwt_storage_id', 'jwt_storage', ['id'], postgresql_concurrently=True)
+        op.create_index('ix_users_id', 'users', ['id'], postgresql_concurrently=True)
+        op.drop_index('idx_jwt_storage_user_id', table_name='jwt_storage', postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""Backfill created_at and make it NOT NULL
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 21:12:40.118254
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+TABLES = ('users', 'jwt_storage')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        # 생성 시각을 모르는 행은 수정 시각(없으면 현재 시각)으로 채웁니다.
+        op.execute(f"UPDATE {table} SET created_at = COALESCE(updated_at, now()) WHERE created_at IS NULL")
+        op.alter_column(table, 'created_at', server_default=sa.text('now()'))
+
+    # 검증된 CHECK 제약이 있으면 SET NOT NULL이 테이블을 다시 훑지 않습니다.
+    # NOT VALID로 추가한 뒤 쓰기를 막지 않는 VALIDATE로 검증하도록, 문장마다 따로 커밋합니다.
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_created_at_not_null "
+                "CHECK (created_at IS NOT NULL) NOT VALID"
+            )
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_created_at_not_null")
+            op.alter_column(table, 'created_at', nullable=False)
+            op.drop_constraint(f'{table}_created_at_not_null', table, type_='check')
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'created_at', nullable=True, server_default=None)
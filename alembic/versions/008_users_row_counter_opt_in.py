@@ -0,0 +1,44 @@
+"""Make the users row counter opt-in: drop its triggers
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 21:47:03.552108
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+TRIGGERS = (
+    ("users_row_count_insert", "AFTER INSERT", "REFERENCING NEW TABLE AS new_rows"),
+    ("users_row_count_delete", "AFTER DELETE", "REFERENCING OLD TABLE AS old_rows"),
+    ("users_row_count_update", "AFTER UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("users_row_count_truncate", "AFTER TRUNCATE", ""),
+)
+
+
+def upgrade() -> None:
+    # 트리거가 있으면 모든 가입/삭제/수정이 카운터 행 하나를 갱신해 커밋까지 서로 기다립니다.
+    # 함수와 table_row_counts는 남겨 두고, USERS_COUNT_STRATEGY=counter를 쓸 때만
+    # scripts/users_row_counter.py enable로 트리거를 설치합니다.
+    for name, _, _ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON users")
+    # 갱신되지 않는 카운터를 읽지 않도록 행을 지웁니다. (counter 방식은 정확한 COUNT로 대체)
+    op.execute("DELETE FROM table_row_counts WHERE table_name = 'users'")
+
+
+def downgrade() -> None:
+    op.execute("LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE")
+    for name, event, referencing in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON users")
+        op.execute(f"CREATE TRIGGER {name} {event} ON users {referencing} FOR EACH STATEMENT EXECUTE FUNCTION {name}()")
+    op.execute("""
+        INSERT INTO table_row_counts (table_name, row_count)
+        SELECT 'users', count(*) FROM users WHERE deleted_at IS NULL
+        ON CONFLICT (table_name) DO UPDATE SET row_count = EXCLUDED.row_count
+    """)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 
 
 class AuthRequest(BaseModel):
@@ -14,4 +14,19 @@ class AccessTokenResponse(BaseModel):
     access_token: str
 
 class RefreshTokenRequest(BaseModel):
-    refresh_token: str = Field(..., description="리프레시 토큰") 
\ No newline at end of file
+    refresh_token: str = Field(..., description="리프레시 토큰") 
+
+class IntrospectRequest(BaseModel):
+    tokens: List[str] = Field(..., min_length=1, max_length=100, description="검사할 액세스 토큰 목록 (최대 100개)")
+
+class TokenIntrospection(BaseModel):
+    active: bool
+    id: Optional[int] = None
+    email: Optional[str] = None
+    profile_name: Optional[str] = None
+    role: Optional[str] = None
+    exp: Optional[int] = None
+    jti: Optional[str] = None
+
+class IntrospectResponse(BaseModel):
+    results: List[TokenIntrospection]
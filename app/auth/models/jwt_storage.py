@@ -1,12 +1,18 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, CHAR, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.models.base_model import BaseModel
 
 class JwtStorage(BaseModel):
     __tablename__ = "jwt_storage"
+    __table_args__ = (
+        # 로그인/재발급/로그아웃 조회와 users 삭제 시 CASCADE 탐색에 사용
+        Index('idx_jwt_storage_user_id', 'user_id'),
+    )
     
+    # 이전 방식(sha256_crypt 해시)으로 저장된 리프레시 토큰 - 호환용
     refresh_token = Column(String(255), nullable=True)
+    refresh_token_fingerprint = Column(CHAR(64), nullable=True, comment="리프레시 토큰 HMAC-SHA256 지문")
     refresh_token_expired_at = Column(Integer, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
@@ -1,47 +1,49 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, bindparam
 from typing import Optional
 from app.auth.models.jwt_storage import JwtStorage
 
+# 로그인/재발급/로그아웃마다 실행되는 쿼리는 모듈 로드 시 한 번만 구성합니다.
+_SELECT_JWT_STORAGE_BY_USER_ID = select(JwtStorage).where(JwtStorage.user_id == bindparam("target_user_id"))
+_UPDATE_REFRESH_TOKEN = (
+    update(JwtStorage)
+    .where(JwtStorage.user_id == bindparam("target_user_id"))
+    .values(
+        refresh_token=None,
+        refresh_token_fingerprint=bindparam("fingerprint"),
+        refresh_token_expired_at=bindparam("expired_at"),
+    )
+    .returning(JwtStorage.id)
+)
+_REMOVE_REFRESH_TOKEN = (
+    update(JwtStorage)
+    .where(JwtStorage.user_id == bindparam("target_user_id"))
+    .values(refresh_token=None, refresh_token_fingerprint=None, refresh_token_expired_at=None)
+    .returning(JwtStorage.id)
+)
+
 class JwtRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
     
     async def get_jwt_storage_by_user_id(self, user_id: int) -> Optional[JwtStorage]:
         """사용자 ID로 JWT 저장소를 조회합니다."""
-        result = await self.db.execute(
-            select(JwtStorage).where(JwtStorage.user_id == user_id)
-        )
+        result = await self.db.execute(_SELECT_JWT_STORAGE_BY_USER_ID, {"target_user_id": user_id})
         return result.scalar_one_or_none()
     
-    async def create_jwt_storage(self, user_id: int) -> JwtStorage:
-        """JWT 저장소를 생성합니다."""
-        jwt_storage = JwtStorage(user_id=user_id)
-        self.db.add(jwt_storage)
-        await self.db.commit()
-        await self.db.refresh(jwt_storage)
-        return jwt_storage
-    
-    async def update_refresh_token(self, user_id: int, refresh_token: str, expired_at: int) -> None:
-        """리프레시 토큰을 업데이트합니다."""
-        await self.db.execute(
-            update(JwtStorage)
-            .where(JwtStorage.user_id == user_id)
-            .values(
-                refresh_token=refresh_token,
-                refresh_token_expired_at=expired_at
-            )
+    async def update_refresh_token(self, user_id: int, refresh_token_fingerprint: str, expired_at: int) -> bool:
+        """리프레시 토큰 지문을 업데이트합니다. JWT 저장소가 없으면 False를 반환합니다."""
+        result = await self.db.execute(
+            _UPDATE_REFRESH_TOKEN,
+            {"target_user_id": user_id, "fingerprint": refresh_token_fingerprint, "expired_at": expired_at},
         )
+        updated = result.scalar_one_or_none() is not None
         await self.db.commit()
+        return updated
     
-    async def remove_refresh_token(self, user_id: int) -> None:
-        """리프레시 토큰을 제거합니다."""
-        await self.db.execute(
-            update(JwtStorage)
-            .where(JwtStorage.user_id == user_id)
-            .values(
-                refresh_token=None,
-                refresh_token_expired_at=None
-            )
-        )
-        await self.db.commit() 
\ No newline at end of file
+    async def remove_refresh_token(self, user_id: int) -> bool:
+        """리프레시 토큰을 제거합니다. JWT 저장소가 없으면 False를 반환합니다."""
+        result = await self.db.execute(_REMOVE_REFRESH_TOKEN, {"target_user_id": user_id})
+        removed = result.scalar_one_or_none() is not None
+        await self.db.commit()
+        return removed 
\ No newline at end of file
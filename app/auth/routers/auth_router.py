@@ -1,20 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database.database import get_db
 from app.auth.services.auth_service import AuthService
-from app.auth.dto.auth import AuthRequest, TokenResponse, AccessTokenResponse, RefreshTokenRequest
-from app.core.dependencies import get_current_user
+from app.auth.services.login_throttle import login_throttle
+from app.auth.dto.auth import AuthRequest, TokenResponse, AccessTokenResponse, RefreshTokenRequest, IntrospectRequest, IntrospectResponse
+from app.core.dependencies import get_current_user, get_access_token_payload
 from app.dto.base_response import BaseResponse
-from app.users.models.user import User
+from app.core.principal_cache import AuthenticatedUser
+from app.core.config import settings
+from app.core.errors import AppError, AUTH_ERRORS
 
 auth_router = APIRouter()
 
 @auth_router.post("/sign-in", response_model=TokenResponse)
 async def sign_in(
+    request: Request,
     auth_request: AuthRequest,
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 로그인"""
+    # 해싱/조회 전에 시도 횟수 제한
+    await login_throttle.check(login_throttle.client_ip(request), auth_request.email)
+    
     auth_service = AuthService(db)
     return await auth_service.login(auth_request)
 
@@ -29,10 +38,29 @@ async def refresh_token(
 
 @auth_router.delete("/sign-out", response_model=BaseResponse)
 async def sign_out(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    token_payload: dict = Depends(get_access_token_payload),
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 로그아웃"""
     auth_service = AuthService(db)
-    await auth_service.logout(current_user)
-    return BaseResponse(message="success") 
\ No newline at end of file
+    await auth_service.logout(current_user, token_payload)
+    return BaseResponse(message="success")
+
+@auth_router.post("/introspect", response_model=IntrospectResponse)
+async def introspect(
+    introspect_request: IntrospectRequest,
+    introspection_key: Optional[str] = Header(None, alias="X-Introspection-Key"),
+    db: AsyncSession = Depends(get_db)
+):
+    """액세스 토큰 일괄 검사 (게이트웨이용)"""
+    # 키가 설정되지 않았으면 누구나 사용자 정보를 조회할 수 없도록 비활성화
+    if not settings.INTROSPECTION_API_KEY:
+        raise AppError(AUTH_ERRORS["INTROSPECTION_DISABLED"])
+    if not hmac.compare_digest(
+        (introspection_key or "").encode("utf-8"), settings.INTROSPECTION_API_KEY.encode("utf-8")
+    ):
+        raise AppError(AUTH_ERRORS["INVALID_INTROSPECTION_KEY"])
+    
+    auth_service = AuthService(db)
+    return await auth_service.introspect_tokens(introspect_request.tokens)
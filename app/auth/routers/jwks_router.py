@@ -0,0 +1,22 @@
+import hashlib
+import json
+from fastapi import APIRouter, Request, Response
+from app.core.config import settings
+from app.core.security import access_token_codec
+
+jwks_router = APIRouter()
+
+# 공개키는 프로세스 수명 동안 바뀌지 않으므로 응답 본문과 ETag를 미리 계산
+_JWKS_BODY = json.dumps(access_token_codec.jwks(), separators=(",", ":")).encode("utf-8")
+_JWKS_ETAG = '"' + hashlib.sha256(_JWKS_BODY).hexdigest()[:32] + '"'
+_JWKS_HEADERS = {
+    "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE}, stale-while-revalidate={settings.JWKS_CACHE_MAX_AGE}",
+    "ETag": _JWKS_ETAG,
+}
+
+@jwks_router.get("/jwks.json")
+async def get_jwks(request: Request):
+    """액세스 토큰 검증용 공개키 목록 (HS256 사용 시 빈 목록)"""
+    if _JWKS_ETAG in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=_JWKS_HEADERS)
+    return Response(content=_JWKS_BODY, media_type="application/json", headers=_JWKS_HEADERS)
@@ -1,15 +1,45 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.users.repositories.user_repository import UserRepository
 from app.auth.repositories.jwt_repository import JwtRepository
 from app.users.models.user import User
-from app.auth.dto.auth import AuthRequest, TokenResponse, AccessTokenResponse
+from app.auth.dto.auth import AuthRequest, TokenResponse, AccessTokenResponse, IntrospectResponse, TokenIntrospection
 from app.users.dto.user_dto import UserResponseDto
-from app.core.security import verify_password, hash_password, create_access_token, create_refresh_token, verify_token
+from app.core.database.database import AsyncSessionLocal
+from app.core.security import (
+    needs_rehash,
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+    create_refresh_token_with_exp,
+    verify_token,
+    verify_access_token,
+    fingerprint_refresh_token,
+    verify_refresh_token_fingerprint,
+)
 from app.core.errors import AppError, AUTH_ERRORS, USERS_ERRORS
 from app.core.config import settings
+from app.core.principal_cache import AuthenticatedUser, principal_cache
+from app.core.token_denylist import token_denylist
+import asyncio
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
+# 실행 중인 백그라운드 재해시 작업 (GC 방지용 참조)
+_rehash_tasks = set()
+
+
+async def _rehash_password(user_id: int, password: str, old_hash: str) -> None:
+    """현재 해시 정책으로 비밀번호를 다시 해시해 저장합니다."""
+    try:
+        new_hash = await hash_password_async(password)
+        async with AsyncSessionLocal() as session:
+            if await UserRepository(session).update_password(user_id, new_hash, old_hash):
+                logger.info(f"[RehashPassword] Success: user_id={user_id}")
+    except Exception as e:
+        logger.warning(f"[RehashPassword] Error: user_id={user_id} {str(e)}")
 
 
 class AuthService:
@@ -24,9 +54,15 @@ class AuthService:
         if not user:
             return None
         
-        if not verify_password(password, user.password):
+        if not await verify_password_async(password, user.password):
             return None
         
+        # 해시 정책이 바뀐 경우 응답을 지연시키지 않도록 백그라운드에서 재해시
+        if needs_rehash(user.password):
+            task = asyncio.create_task(_rehash_password(user.id, password, user.password))
+            _rehash_tasks.add(task)
+            task.add_done_callback(_rehash_tasks.discard)
+        
         return user
     
     async def login(self, auth_request: AuthRequest) -> TokenResponse:
@@ -37,32 +73,30 @@ class AuthService:
         
         # 토큰 생성
         access_token = create_access_token({"id": user.id, "profile_name": user.profile_name})
-        refresh_token = create_refresh_token({"id": user.id})
+        refresh_token, expired_at = create_refresh_token_with_exp({"id": user.id})
         
         # 리프레시 토큰 저장
-        await self.update_refresh_token(user, refresh_token)
+        await self.update_refresh_token(user, refresh_token, expired_at)
         
         return TokenResponse(
             access_token=access_token,
             refresh_token=refresh_token,
         )
     
-    async def update_refresh_token(self, user: User, refresh_token: str) -> None:
+    async def update_refresh_token(self, user: User, refresh_token: str, expired_at: Optional[int] = None) -> None:
         """리프레시 토큰을 업데이트합니다."""
-        jwt_storage = await self.jwt_repo.get_jwt_storage_by_user_id(user.id)
+        # 직접 발급한 토큰이 아니면 exp를 파싱
+        if expired_at is None:
+            payload = verify_token(refresh_token, settings.JWT_REFRESH_SECRET)
+            if not payload:
+                raise AppError(AUTH_ERRORS["INVALID_REFRESH_TOKEN"])
+            expired_at = payload.get("exp")
         
-        if not jwt_storage:
-            raise AppError(AUTH_ERRORS["NOT_EXIST_JWT_STORAGE"])
+        fingerprint = fingerprint_refresh_token(refresh_token)
         
-        # 토큰 정보 파싱
-        payload = verify_token(refresh_token, settings.JWT_REFRESH_SECRET)
-        if not payload:
-            raise AppError(AUTH_ERRORS["INVALID_REFRESH_TOKEN"])
-        
-        expired_at = payload.get("exp")
-        hashed_token = hash_password(refresh_token)
-        
-        await self.jwt_repo.update_refresh_token(user.id, hashed_token, expired_at)
+        # UPDATE ... RETURNING 으로 존재 여부 확인과 갱신을 한 번에 처리
+        if not await self.jwt_repo.update_refresh_token(user.id, fingerprint, expired_at):
+            raise AppError(AUTH_ERRORS["NOT_EXIST_JWT_STORAGE"])
     
     async def refresh_access_token(self, refresh_token: str) -> AccessTokenResponse:
         """액세스 토큰을 재발급합니다."""
@@ -91,19 +125,80 @@ class AuthService:
         if not user or not user.jwt_storage:
             return None
         
-        if not user.jwt_storage.refresh_token:
+        jwt_storage = user.jwt_storage
+        
+        # 토큰 검증 (HMAC 지문 비교)
+        if jwt_storage.refresh_token_fingerprint:
+            if verify_refresh_token_fingerprint(refresh_token, jwt_storage.refresh_token_fingerprint):
+                return user
             return None
         
-        # 토큰 검증
-        if verify_password(refresh_token, user.jwt_storage.refresh_token):
+        # 이전 방식(sha256_crypt)으로 저장된 토큰은 한 번 검증 후 지문으로 교체
+        if jwt_storage.refresh_token and await verify_password_async(refresh_token, jwt_storage.refresh_token):
+            await self.jwt_repo.update_refresh_token(
+                user.id,
+                fingerprint_refresh_token(refresh_token),
+                jwt_storage.refresh_token_expired_at,
+            )
             return user
         
         return None
     
-    async def logout(self, user: User) -> None:
-        """사용자 로그아웃을 처리합니다."""
-        jwt_storage = await self.jwt_repo.get_jwt_storage_by_user_id(user.id)
-        if not jwt_storage:
-            raise AppError(AUTH_ERRORS["NOT_EXIST_JWT_STORAGE"])
+    async def logout(self, user: AuthenticatedUser, token_payload: Optional[Dict[str, Any]] = None) -> None:
+        """사용자 로그아웃을 처리합니다. 사용 중인 액세스 토큰도 함께 폐기합니다."""
+        if token_payload:
+            await token_denylist.revoke(token_payload.get("jti"), token_payload.get("exp"))
         
-        await self.jwt_repo.remove_refresh_token(user.id) 
\ No newline at end of file
+        if not await self.jwt_repo.remove_refresh_token(user.id):
+            raise AppError(AUTH_ERRORS["NOT_EXIST_JWT_STORAGE"])
+    
+    async def introspect_tokens(self, tokens: List[str]) -> IntrospectResponse:
+        """액세스 토큰을 일괄 검사합니다.
+        
+        캐시에 없는 사용자만 모아 한 번의 쿼리로 조회하므로, 배치 크기와 관계없이 쿼리는 최대 1회입니다.
+        """
+        payloads = []
+        for token in tokens:
+            payload = verify_access_token(token)
+            if payload and (
+                not isinstance(payload.get("id"), int)
+                or token_denylist.is_revoked(payload.get("jti"), payload.get("exp"))
+            ):
+                payload = None
+            payloads.append(payload)
+        
+        # 사용자 스냅샷 조회 (캐시 우선, 나머지는 WHERE id = ANY(...) 1회)
+        principals: Dict[int, AuthenticatedUser] = {}
+        missing_ids = set()
+        for payload in payloads:
+            if payload is None or payload["id"] in principals:
+                continue
+            principal = principal_cache.get(payload["id"])
+            if principal is None:
+                missing_ids.add(payload["id"])
+            else:
+                principals[payload["id"]] = principal
+        
+        if missing_ids:
+            for user in await self.user_repo.get_users_by_ids(sorted(missing_ids)):
+                principal = AuthenticatedUser.from_user(user)
+                principal_cache.put(principal)
+                principals[principal.id] = principal
+        
+        results = []
+        for payload in payloads:
+            principal = principals.get(payload["id"]) if payload else None
+            if principal is None:
+                results.append(TokenIntrospection(active=False))
+                continue
+            results.append(TokenIntrospection(
+                active=True,
+                id=principal.id,
+                email=principal.email,
+                profile_name=principal.profile_name,
+                role=principal.role,
+                exp=payload.get("exp"),
+                jti=payload.get("jti"),
+            ))
+        
+        return IntrospectResponse(results=results)
@@ -0,0 +1,117 @@
+import ipaddress
+import logging
+from typing import List, Optional, Sequence, Union
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.errors import AppError, AUTH_ERRORS
+from app.core.rate_limit import RateLimitBackend, create_rate_limit_backend
+
+logger = logging.getLogger(__name__)
+
+
+class LoginThrottle:
+    """로그인 시도를 IP/이메일 단위로 제한합니다.
+
+    비밀번호 해싱이나 DB 조회 전에 호출되어, 한도를 넘은 요청은 바로 거절됩니다.
+    저장소 오류 시에는 로그인을 막지 않도록 요청을 허용합니다.
+    trusted_proxies(IP/CIDR)에서 온 요청은 X-Forwarded-For의 클라이언트 IP로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[RateLimitBackend],
+        policy: str,
+        ip_limit: int,
+        email_limit: int,
+        window_seconds: float,
+        enabled: bool = True,
+        trusted_proxies: Sequence[str] = (),
+    ):
+        self.backend = backend
+        self.policy = policy
+        self.ip_limit = ip_limit
+        self.email_limit = email_limit
+        self.window_seconds = window_seconds
+        self.enabled = enabled and backend is not None
+        self.trusted_proxies: List[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]] = [
+            ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies
+        ]
+
+        self.allowed = 0
+        self.rejected_by_ip = 0
+        self.rejected_by_email = 0
+        self.backend_errors = 0
+
+    def _is_trusted_proxy(self, address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    def client_ip(self, request: Request) -> Optional[str]:
+        """제한에 사용할 클라이언트 IP를 구합니다.
+
+        신뢰하는 프록시를 거친 요청은 X-Forwarded-For를 오른쪽부터 따라가 신뢰하지 않는 첫 주소를 사용합니다.
+        (클라이언트가 왼쪽에 임의의 주소를 넣어도 우회할 수 없음)
+        """
+        address = request.client.host if request.client else None
+        if not address or not self._is_trusted_proxy(address):
+            return address
+        forwarded = ",".join(request.headers.getlist("x-forwarded-for"))
+        for hop in reversed([hop.strip() for hop in forwarded.split(",") if hop.strip()]):
+            address = hop
+            if not self._is_trusted_proxy(hop):
+                break
+        return address
+
+    async def _hit(self, key: str, limit: int) -> bool:
+        try:
+            return await self.backend.hit(key, limit, self.window_seconds, self.policy)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning(f"[LoginThrottle] Backend error: {str(e)}")
+            return True
+
+    async def check(self, ip: Optional[str], email: str) -> None:
+        """로그인 시도 1회를 기록하고, 한도를 넘으면 AppError를 발생시킵니다."""
+        if not self.enabled:
+            return
+
+        if ip and not await self._hit(f"login:ip:{ip}", self.ip_limit):
+            self.rejected_by_ip += 1
+            raise AppError(AUTH_ERRORS["TOO_MANY_LOGIN_ATTEMPTS"])
+
+        if not await self._hit(f"login:email:{email.strip().lower()}", self.email_limit):
+            self.rejected_by_email += 1
+            raise AppError(AUTH_ERRORS["TOO_MANY_LOGIN_ATTEMPTS"])
+
+        self.allowed += 1
+
+    def get_stats(self) -> dict:
+        """허용/거절 카운터를 반환합니다."""
+        return {
+            "enabled": self.enabled,
+            "policy": self.policy,
+            "allowed": self.allowed,
+            "rejected_by_ip": self.rejected_by_ip,
+            "rejected_by_email": self.rejected_by_email,
+            "rejected": self.rejected_by_ip + self.rejected_by_email,
+            "backend_errors": self.backend_errors,
+        }
+
+
+# 전역 로그인 제한 인스턴스
+login_throttle = LoginThrottle(
+    backend=create_rate_limit_backend(
+        settings.LOGIN_THROTTLE_BACKEND, settings.redis_url, key_prefix="login_throttle"
+    ) if settings.LOGIN_THROTTLE_ENABLED else None,
+    policy=settings.LOGIN_THROTTLE_POLICY,
+    ip_limit=settings.LOGIN_THROTTLE_IP_LIMIT,
+    email_limit=settings.LOGIN_THROTTLE_EMAIL_LIMIT,
+    window_seconds=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+    enabled=settings.LOGIN_THROTTLE_ENABLED,
+    trusted_proxies=settings.LOGIN_THROTTLE_TRUSTED_PROXIES,
+)
@@ -1,15 +1,19 @@
-from .security import hash_password, verify_password, create_access_token, create_refresh_token, verify_token
+from .security import hash_password, verify_password, hash_password_async, verify_password_async, create_access_token, create_refresh_token, verify_token, verify_access_token
 from .errors import AppError, AUTH_ERRORS, USERS_ERRORS
-from .dependencies import get_current_user
+from .dependencies import get_current_user, get_access_token_payload
 
 __all__ = [
     "hash_password",
     "verify_password", 
+    "hash_password_async",
+    "verify_password_async",
     "create_access_token",
     "create_refresh_token",
     "verify_token",
+    "verify_access_token",
     "AppError",
     "AUTH_ERRORS",
     "USERS_ERRORS",
-    "get_current_user"
+    "get_current_user",
+    "get_access_token_payload"
 ] 
\ No newline at end of file
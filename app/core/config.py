@@ -1,7 +1,7 @@
 import os
 import logging
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic import ConfigDict
 import re
 from dotenv import load_dotenv
@@ -40,6 +40,48 @@ class Settings(BaseSettings):
     db_username: Optional[str] = None
     db_password: Optional[str] = None
 
+    # 읽기 레플리카 설정 (쉼표로 구분한 URL 목록)
+    # 지연이 replica_max_lag_seconds를 넘으면 프라이머리로 읽고,
+    # 쓰기가 있던 클라이언트는 replica_sticky_seconds 동안 프라이머리에서 읽습니다.
+    database_replica_urls: Optional[str] = None
+    replica_max_lag_seconds: float = 5.0
+    replica_check_interval_seconds: float = 5.0
+    replica_sticky_seconds: int = 5
+
+    # 커넥션 풀 설정 (비동기/동기 엔진 공통)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 300
+    db_pool_pre_ping: bool = True
+    db_pool_use_lifo: bool = False
+    # 문장 캐시 크기 (0이면 비활성화; PgBouncer transaction 모드에서는 prepared/statement 캐시를 0으로)
+    # query_cache_size: SQLAlchemy 컴파일 캐시(엔진당), prepared_statement_cache_size: SQLAlchemy asyncpg
+    # 어댑터의 연결당 prepared statement LRU, statement_cache_size: asyncpg 자체 연결당 캐시
+    db_query_cache_size: int = 500
+    db_prepared_statement_cache_size: int = 100
+    db_statement_cache_size: int = 100
+    # 연결 시 PostgreSQL 세션 설정 (application_name 미설정 시 app_name 사용, jit 미설정 시 서버 기본값)
+    db_application_name: Optional[str] = None
+    db_jit: Optional[bool] = None
+
+    # DB 헬스 프로브 설정 (백그라운드 측정 주기, 타임아웃, 결과 유효 시간)
+    health_probe_interval_seconds: float = 5.0
+    health_probe_timeout_seconds: float = 2.0
+    health_probe_max_staleness_seconds: float = 15.0
+
+    # SQL 계측 (요청별 문장 수/DB 시간/느린 문장, N+1·지연 로딩 감지, 쿼리 예산)
+    # mode: off | warn(로그) | raise(QueryGuardError; 테스트/CI용), 예산 0은 제한 없음
+    # 미지정 시 local/dev/test 환경은 warn, 그 외(staging/prod)는 off (off면 엔진/세션 이벤트도 등록하지 않음)
+    # 라우트별 예산은 "메서드 경로 템플릿=문장 수"를 쉼표로 구분 (예: "GET /api/v1/users/=3,GET /api/v1/users/{user_id}=2")
+    # server_timing_header: 응답에 Server-Timing(DB 시간/문장 수) 헤더 추가 (클라이언트에 노출되므로 운영에서는 끔)
+    db_instrumentation_mode: Optional[str] = None
+    db_server_timing_header: bool = False
+    db_slow_query_ms: float = 200.0
+    db_n_plus_one_threshold: int = 5
+    db_query_budget_default: int = 0
+    db_query_budgets: Optional[str] = None
+
     # Redis 설정
     redis_host: Optional[str] = None
     redis_port: Optional[int] = None
@@ -52,6 +94,81 @@ class Settings(BaseSettings):
     jwt_refresh_expiration_time: Optional[str] = None
     jwt_admin_access_secret: Optional[str] = None
     jwt_admin_access_expiration_time: Optional[str] = None
+    jwt_refresh_token_hmac_secret: Optional[str] = None
+
+    # 액세스 토큰 서명 알고리즘 (HS256 | RS256 | EdDSA)
+    # 비대칭 알고리즘은 개인키(PEM 문자열 또는 파일 경로)가 필요하며, 공개키는 JWKS로 제공됩니다.
+    jwt_access_algorithm: str = "HS256"
+    jwt_access_private_key: Optional[str] = None
+    jwt_access_key_id: Optional[str] = None
+    # 키 교체 시 계속 검증할 이전 공개키 (쉼표 구분 PEM 파일 경로)
+    jwt_access_verification_keys: Optional[str] = None
+    jwks_cache_max_age: int = 3600
+
+    # 토큰 일괄 검사(introspect) API 키 (X-Introspection-Key 헤더로 전달, 미설정 시 API 비활성화)
+    introspection_api_key: Optional[str] = None
+
+    # 검증된 액세스 토큰 캐시 크기 (0이면 비활성화)
+    access_token_cache_size: int = 10000
+
+    # 인증 사용자(principal) 캐시 설정
+    principal_cache_enabled: bool = True
+    principal_cache_ttl_seconds: int = 30
+    principal_cache_max_size: int = 10000
+
+    # 로그인 시도 제한 설정 (policy: sliding_window | token_bucket, backend: memory | redis)
+    # redis 백엔드는 redis 패키지가 필요합니다. (선택 의존성: pip install ".[redis]")
+    # IP 한도는 접속한 주소 기준입니다. 로드밸런서/프록시 뒤에서는 login_throttle_trusted_proxies에 프록시 주소
+    # (IP 또는 CIDR, 쉼표 구분)를 넣어야 X-Forwarded-For의 실제 클라이언트 IP를 사용합니다. (미설정 시 모든 사용자가 프록시 IP 한도를 공유)
+    # 이메일 한도는 누구나 다른 사람의 이메일로 시도해 window 동안 그 계정의 로그인을 막을 수 있으므로 너무 낮게 잡지 않습니다.
+    login_throttle_enabled: bool = True
+    login_throttle_policy: str = "sliding_window"
+    login_throttle_backend: str = "memory"
+    login_throttle_ip_limit: int = 30
+    login_throttle_email_limit: int = 10
+    login_throttle_window_seconds: int = 60
+    login_throttle_trusted_proxies: Optional[str] = None
+
+    # 액세스 토큰 폐기 목록 설정 (backend: memory | redis)
+    # redis는 워커 간 폐기 내역을 동기화하며 redis 패키지가 필요합니다. (선택 의존성: pip install ".[redis]")
+    token_denylist_bucket_seconds: int = 60
+    token_denylist_backend: str = "memory"
+
+    # 사용자 목록 total_count 집계 방식 (exact | cached | estimated | counter)
+    # counter는 scripts/users_row_counter.py enable로 트리거를 설치해야 하며(미설치 시 exact로 대체),
+    # 설치하면 동시 가입/삭제가 카운터 행 잠금에서 직렬화됩니다.
+    users_count_strategy: str = "exact"
+    users_count_cache_ttl_seconds: float = 30.0
+    # 목록/COUNT 실행 방식 (sequential | concurrent: 별도 커넥션에서 동시 실행 | window: count(*) OVER () 단일 쿼리)
+    # concurrent는 목록 요청마다 풀 커넥션을 2개 사용하므로, 동시 목록 요청 수의 2배 이상으로
+    # db_pool_size + db_max_overflow를 잡아야 합니다. (부족하면 커넥션을 기다리다 db_pool_timeout으로 실패)
+    users_list_query_mode: str = "sequential"
+    # 사용자 일괄 가져오기 (배치당 COPY/병합 1회, 응답에 담을 행 오류 수 상한)
+    users_import_batch_size: int = 1000
+    users_import_max_errors: int = 1000
+    # 사용자 내보내기 (서버 측 커서에서 한 번에 가져와 응답 청크 하나로 쓰는 행 수)
+    users_export_chunk_rows: int = 1000
+    # 삭제된 사용자 정리 (보존 기간이 지난 행을 배치 단위로 실제 삭제, 배치 사이에 쉬어 부하 제한)
+    # 보존 기간(일) 동안은 삭제 처리된 사용자를 복구할 수 있습니다.
+    user_purge_enabled: bool = True
+    user_purge_retention_days: int = 30
+    user_purge_interval_seconds: float = 60.0
+    user_purge_batch_size: int = 500
+    user_purge_batch_pause_seconds: float = 0.5
+    user_purge_max_batches: int = 20
+
+    # 비밀번호 해시 정책 (scripts/calibrate_password_hash.py로 측정)
+    password_hash_scheme: str = "sha256_crypt"
+    password_hash_rounds: Optional[int] = None
+
+    # 비밀번호 해싱 풀 설정
+    password_hash_workers: Optional[int] = None
+    password_hash_max_concurrency: Optional[int] = None
+    password_hash_max_queue: int = 64
+    # 일괄 가져오기 전용 해싱 풀 (로그인/가입과 슬롯을 나누지 않도록 분리, 0이면 스레드 1개)
+    # 비밀번호 slice_size개씩 작업을 나눠 제출합니다.
+    password_hash_bulk_workers: int = 1
+    password_hash_bulk_slice_size: int = 16
 
     # AWS S3 설정
     aws_region: str = "ap-northeast-2"
@@ -150,6 +267,109 @@ class Settings(BaseSettings):
             raise ValueError("DATABASE_URL이 설정되지 않았습니다.")
         return self.database_url
 
+    @property
+    def DATABASE_REPLICA_URLS(self) -> List[str]:
+        return [url.strip() for url in (self.database_replica_urls or "").split(",") if url.strip()]
+
+    @property
+    def REPLICA_MAX_LAG_SECONDS(self) -> float:
+        return self.replica_max_lag_seconds
+
+    @property
+    def REPLICA_CHECK_INTERVAL_SECONDS(self) -> float:
+        return self.replica_check_interval_seconds
+
+    @property
+    def REPLICA_STICKY_SECONDS(self) -> int:
+        return self.replica_sticky_seconds
+
+    @property
+    def DB_POOL_SIZE(self) -> int:
+        return self.db_pool_size
+
+    @property
+    def DB_MAX_OVERFLOW(self) -> int:
+        return self.db_max_overflow
+
+    @property
+    def DB_POOL_TIMEOUT(self) -> float:
+        return self.db_pool_timeout
+
+    @property
+    def DB_POOL_RECYCLE(self) -> int:
+        return self.db_pool_recycle
+
+    @property
+    def DB_POOL_PRE_PING(self) -> bool:
+        return self.db_pool_pre_ping
+
+    @property
+    def DB_POOL_USE_LIFO(self) -> bool:
+        return self.db_pool_use_lifo
+
+    @property
+    def DB_QUERY_CACHE_SIZE(self) -> int:
+        return self.db_query_cache_size
+
+    @property
+    def DB_PREPARED_STATEMENT_CACHE_SIZE(self) -> int:
+        return self.db_prepared_statement_cache_size
+
+    @property
+    def DB_STATEMENT_CACHE_SIZE(self) -> int:
+        return self.db_statement_cache_size
+
+    @property
+    def DB_APPLICATION_NAME(self) -> str:
+        return self.db_application_name or self.app_name
+
+    @property
+    def DB_JIT(self) -> Optional[bool]:
+        return self.db_jit
+
+    @property
+    def HEALTH_PROBE_INTERVAL_SECONDS(self) -> float:
+        return self.health_probe_interval_seconds
+
+    @property
+    def HEALTH_PROBE_TIMEOUT_SECONDS(self) -> float:
+        return self.health_probe_timeout_seconds
+
+    @property
+    def HEALTH_PROBE_MAX_STALENESS_SECONDS(self) -> float:
+        return self.health_probe_max_staleness_seconds
+
+    @property
+    def DB_INSTRUMENTATION_MODE(self) -> str:
+        if self.db_instrumentation_mode:
+            return self.db_instrumentation_mode
+        return "warn" if self.environment in ("local", "dev", "test") else "off"
+
+    @property
+    def DB_SERVER_TIMING_HEADER(self) -> bool:
+        return self.db_server_timing_header
+
+    @property
+    def DB_SLOW_QUERY_MS(self) -> float:
+        return self.db_slow_query_ms
+
+    @property
+    def DB_N_PLUS_ONE_THRESHOLD(self) -> int:
+        return self.db_n_plus_one_threshold
+
+    @property
+    def DB_QUERY_BUDGET_DEFAULT(self) -> int:
+        return self.db_query_budget_default
+
+    @property
+    def DB_QUERY_BUDGETS(self) -> Dict[str, int]:
+        budgets = {}
+        for item in (self.db_query_budgets or "").split(","):
+            route, _, budget = item.rpartition("=")
+            if route.strip():
+                budgets[" ".join(route.split())] = int(budget)
+        return budgets
+
     @property
     def REDIS_URL(self) -> str:
         if not self.redis_url:
@@ -236,6 +456,166 @@ class Settings(BaseSettings):
     def JWT_ADMIN_ACCESS_EXPIRATION_TIME(self) -> Optional[str]:
         return self.jwt_admin_access_expiration_time
 
+    @property
+    def JWT_REFRESH_TOKEN_HMAC_SECRET(self) -> str:
+        # 전용 키가 없으면 리프레시 토큰 서명 키를 사용 (둘 다 없으면 빈 키로 지문을 만들지 않도록 실패)
+        secret = self.jwt_refresh_token_hmac_secret or self.jwt_refresh_secret
+        if not secret:
+            raise ValueError("JWT_REFRESH_TOKEN_HMAC_SECRET이 설정되지 않았습니다.")
+        return secret
+
+    @property
+    def JWT_ACCESS_ALGORITHM(self) -> str:
+        return self.jwt_access_algorithm
+
+    @property
+    def JWT_ACCESS_PRIVATE_KEY(self) -> Optional[str]:
+        return self.jwt_access_private_key
+
+    @property
+    def JWT_ACCESS_KEY_ID(self) -> Optional[str]:
+        return self.jwt_access_key_id
+
+    @property
+    def JWT_ACCESS_VERIFICATION_KEYS(self) -> Optional[str]:
+        return self.jwt_access_verification_keys
+
+    @property
+    def JWKS_CACHE_MAX_AGE(self) -> int:
+        return self.jwks_cache_max_age
+
+    @property
+    def INTROSPECTION_API_KEY(self) -> Optional[str]:
+        return self.introspection_api_key
+
+    @property
+    def ACCESS_TOKEN_CACHE_SIZE(self) -> int:
+        return self.access_token_cache_size
+
+    @property
+    def PRINCIPAL_CACHE_ENABLED(self) -> bool:
+        return self.principal_cache_enabled
+
+    @property
+    def PRINCIPAL_CACHE_TTL_SECONDS(self) -> int:
+        return self.principal_cache_ttl_seconds
+
+    @property
+    def PRINCIPAL_CACHE_MAX_SIZE(self) -> int:
+        return self.principal_cache_max_size
+
+    @property
+    def LOGIN_THROTTLE_ENABLED(self) -> bool:
+        return self.login_throttle_enabled
+
+    @property
+    def LOGIN_THROTTLE_POLICY(self) -> str:
+        return self.login_throttle_policy
+
+    @property
+    def LOGIN_THROTTLE_BACKEND(self) -> str:
+        return self.login_throttle_backend
+
+    @property
+    def LOGIN_THROTTLE_IP_LIMIT(self) -> int:
+        return self.login_throttle_ip_limit
+
+    @property
+    def LOGIN_THROTTLE_EMAIL_LIMIT(self) -> int:
+        return self.login_throttle_email_limit
+
+    @property
+    def LOGIN_THROTTLE_WINDOW_SECONDS(self) -> int:
+        return self.login_throttle_window_seconds
+
+    @property
+    def LOGIN_THROTTLE_TRUSTED_PROXIES(self) -> List[str]:
+        return [proxy.strip() for proxy in (self.login_throttle_trusted_proxies or "").split(",") if proxy.strip()]
+
+    @property
+    def TOKEN_DENYLIST_BUCKET_SECONDS(self) -> int:
+        return self.token_denylist_bucket_seconds
+
+    @property
+    def TOKEN_DENYLIST_BACKEND(self) -> str:
+        return self.token_denylist_backend
+
+    @property
+    def USERS_COUNT_STRATEGY(self) -> str:
+        return self.users_count_strategy
+
+    @property
+    def USERS_COUNT_CACHE_TTL_SECONDS(self) -> float:
+        return self.users_count_cache_ttl_seconds
+
+    @property
+    def USERS_LIST_QUERY_MODE(self) -> str:
+        return self.users_list_query_mode
+
+    @property
+    def USERS_IMPORT_BATCH_SIZE(self) -> int:
+        return self.users_import_batch_size
+
+    @property
+    def USERS_IMPORT_MAX_ERRORS(self) -> int:
+        return self.users_import_max_errors
+
+    @property
+    def USERS_EXPORT_CHUNK_ROWS(self) -> int:
+        return self.users_export_chunk_rows
+
+    @property
+    def USER_PURGE_ENABLED(self) -> bool:
+        return self.user_purge_enabled
+
+    @property
+    def USER_PURGE_RETENTION_DAYS(self) -> int:
+        return self.user_purge_retention_days
+
+    @property
+    def USER_PURGE_INTERVAL_SECONDS(self) -> float:
+        return self.user_purge_interval_seconds
+
+    @property
+    def USER_PURGE_BATCH_SIZE(self) -> int:
+        return self.user_purge_batch_size
+
+    @property
+    def USER_PURGE_BATCH_PAUSE_SECONDS(self) -> float:
+        return self.user_purge_batch_pause_seconds
+
+    @property
+    def USER_PURGE_MAX_BATCHES(self) -> int:
+        return self.user_purge_max_batches
+
+    @property
+    def PASSWORD_HASH_SCHEME(self) -> str:
+        return self.password_hash_scheme
+
+    @property
+    def PASSWORD_HASH_ROUNDS(self) -> Optional[int]:
+        return self.password_hash_rounds
+
+    @property
+    def PASSWORD_HASH_WORKERS(self) -> Optional[int]:
+        return self.password_hash_workers
+
+    @property
+    def PASSWORD_HASH_MAX_CONCURRENCY(self) -> Optional[int]:
+        return self.password_hash_max_concurrency
+
+    @property
+    def PASSWORD_HASH_MAX_QUEUE(self) -> int:
+        return self.password_hash_max_queue
+
+    @property
+    def PASSWORD_HASH_BULK_WORKERS(self) -> int:
+        return self.password_hash_bulk_workers
+
+    @property
+    def PASSWORD_HASH_BULK_SLICE_SIZE(self) -> int:
+        return self.password_hash_bulk_slice_size
+
     @property
     def AWS_REGION(self) -> str:
         return self.aws_region
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Tuple
+
+from .config import settings
+
+
+class CountCache:
+    """집계 결과(COUNT 등)를 TTL 동안 보관하는 캐시
+
+    만료 직후 여러 요청이 동시에 들어와도 키마다 한 요청만 집계 쿼리를 실행하고,
+    나머지는 그 결과를 기다려 함께 사용합니다. (single-flight)
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, int]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.hits = 0
+        self.loads = 0
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[int]]) -> int:
+        """캐시된 값을 반환하거나, 없으면 loader로 한 번만 집계합니다."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # 대기하는 동안 다른 요청이 이미 갱신했는지 확인
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+
+            value = await loader()
+            self.loads += 1
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            return value
+
+    def invalidate(self, key: str) -> None:
+        """키의 캐시를 제거합니다."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        return {"size": len(self._entries), "hits": self.hits, "loads": self.loads, "ttl_seconds": self.ttl_seconds}
+
+
+# 전역 집계 캐시 인스턴스
+count_cache = CountCache(ttl_seconds=settings.USERS_COUNT_CACHE_TTL_SECONDS)
@@ -2,6 +2,9 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from ..config import settings
 from .database_manager import db_manager, Base
+from .pool import InstrumentedAsyncPool, asyncpg_connect_args, engine_pool_kwargs
+from .query_stats import query_guard
+from .routing import RoutingSession
 
 # DatabaseManager를 통한 동기 엔진 및 세션
 sync_engine = db_manager.engine
@@ -20,11 +23,18 @@ def get_async_database_url():
 async_engine = create_async_engine(
     get_async_database_url(),
     echo=True if settings.NODE_ENV == "dev" else False,
+    poolclass=InstrumentedAsyncPool,
+    connect_args=asyncpg_connect_args(),
+    **engine_pool_kwargs(),
 )
 
+# 요청별 SQL 통계(문장 수/DB 시간/N+1)와 지연 로딩 감지
+query_guard.instrument_engine(async_engine.sync_engine)
+query_guard.instrument_session(RoutingSession)
+
 # Session makers
 AsyncSessionLocal = sessionmaker(
-    async_engine, class_=AsyncSession, expire_on_commit=False
+    async_engine, class_=AsyncSession, sync_session_class=RoutingSession, expire_on_commit=False
 )
 
 # Dependency to get DB session
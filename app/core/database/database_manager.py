@@ -7,6 +7,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.core.config import settings
+from app.core.database.pool import InstrumentedSyncPool, engine_pool_kwargs, psycopg2_connect_args
 
 logger = logging.getLogger(__name__)
 
@@ -113,7 +114,10 @@ class DatabaseManager:
 
             # 데이터베이스 엔진 생성
             self.engine = create_engine(
-                database_url, pool_pre_ping=True, pool_recycle=300
+                database_url,
+                poolclass=InstrumentedSyncPool,
+                connect_args=psycopg2_connect_args(),
+                **engine_pool_kwargs(),
             )
 
             # 세션 팩토리 생성
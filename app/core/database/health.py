@@ -0,0 +1,136 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core.config import settings
+from .database import async_engine, get_async_database_url
+from .database_manager import db_manager
+from .pool import async_pool_stats, pool_status, server_settings
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseHealthProbe:
+    """백그라운드에서 주기적으로 DB 왕복 시간을 측정하고 결과를 캐시합니다.
+
+    전용 엔진(커넥션 1개)을 사용하므로 프로브가 서비스 트래픽의 커넥션을 점유하지 않으며,
+    헬스 체크 요청은 캐시된 결과만 읽어 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(self, interval_seconds: float, timeout_seconds: float, max_staleness_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+        self._engine: Optional[AsyncEngine] = None
+        self._task: Optional[asyncio.Task] = None
+        self._result: Dict[str, Any] = {"status": "starting", "message": "아직 확인되지 않았습니다."}
+        self._checked_at: Optional[float] = None
+        self.failures = 0
+
+    def _get_engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(
+                get_async_database_url(),
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=self.timeout_seconds,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                connect_args={
+                    "server_settings": {
+                        **server_settings(),
+                        "application_name": f"{settings.DB_APPLICATION_NAME}-health",
+                    },
+                    "timeout": self.timeout_seconds,
+                },
+            )
+        return self._engine
+
+    async def _ping(self) -> None:
+        async with self._get_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    async def probe_once(self) -> Dict[str, Any]:
+        """DB에 한 번 질의하고 결과를 캐시합니다."""
+        started_at = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._ping(), timeout=self.timeout_seconds)
+            self._result = {
+                "status": "connected",
+                "message": "데이터베이스 연결이 정상입니다.",
+                "latency_ms": round((time.perf_counter() - started_at) * 1000, 3),
+            }
+            self.failures = 0
+        except Exception as e:
+            self.failures += 1
+            self._result = {
+                "status": "error",
+                "message": f"데이터베이스 연결 오류: {str(e) or type(e).__name__}",
+                "latency_ms": round((time.perf_counter() - started_at) * 1000, 3),
+            }
+            logger.warning(f"[DatabaseHealthProbe] {self._result['message']}")
+        self._checked_at = time.time()
+        return self._result
+
+    async def _run(self) -> None:
+        while True:
+            await self.probe_once()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """백그라운드 프로브를 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 프로브를 중지하고 전용 엔진을 정리합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+    def is_ready(self) -> bool:
+        """최근 프로브가 성공했고 결과가 오래되지 않았는지 확인합니다."""
+        return (
+            self._result.get("status") == "connected"
+            and self._checked_at is not None
+            and time.time() - self._checked_at <= self.max_staleness_seconds
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        """캐시된 프로브 결과와 풀/터널 상태를 반환합니다. (DB에 질의하지 않음)"""
+        connection_type = "SSH 터널" if db_manager.ssh_tunnel_active else "직접 연결"
+        pool = pool_status(async_engine, async_pool_stats)
+        return {
+            **self._result,
+            "ready": self.is_ready(),
+            "checked_at": (
+                datetime.fromtimestamp(self._checked_at, timezone.utc).isoformat() if self._checked_at else None
+            ),
+            "consecutive_failures": self.failures,
+            "connection_type": connection_type,
+            "ssh_tunnel_active": db_manager.ssh_tunnel_active,
+            "pool": {
+                "size": pool.get("size"),
+                "checked_out": pool.get("checked_out"),
+                "overflow": pool.get("overflow"),
+                "utilization": pool.get("utilization"),
+                "saturated": pool.get("utilization", 0) >= 1,
+                "timeouts": pool["timeouts"],
+            },
+        }
+
+
+# 전역 DB 헬스 프로브 인스턴스
+database_health_probe = DatabaseHealthProbe(
+    interval_seconds=settings.HEALTH_PROBE_INTERVAL_SECONDS,
+    timeout_seconds=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+    max_staleness_seconds=settings.HEALTH_PROBE_MAX_STALENESS_SECONDS,
+)
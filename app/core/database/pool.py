@@ -0,0 +1,151 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+
+
+class PoolStats:
+    """커넥션 풀 체크아웃 대기 시간과 타임아웃 횟수를 집계합니다.
+
+    풀이 dispose()로 재생성되어도 같은 풀 클래스를 사용하므로 통계는 유지됩니다.
+    """
+
+    def __init__(self, name: str, sample_size: int = 1024):
+        self.name = name
+        self._lock = threading.Lock()
+        self._samples: deque = deque(maxlen=sample_size)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += wait_seconds
+            self.wait_max = max(self.wait_max, wait_seconds)
+            self._samples.append(wait_seconds)
+
+    def _percentile(self, samples: list, ratio: float) -> float:
+        if not samples:
+            return 0.0
+        return samples[min(len(samples) - 1, int(len(samples) * ratio))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms": {
+                    "avg": round(self.wait_total / attempts * 1000, 3) if attempts else 0.0,
+                    "max": round(self.wait_max * 1000, 3),
+                    "p50": round(self._percentile(samples, 0.50) * 1000, 3),
+                    "p95": round(self._percentile(samples, 0.95) * 1000, 3),
+                    "p99": round(self._percentile(samples, 0.99) * 1000, 3),
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+
+def instrumented_pool_class(base: Type[QueuePool], stats: PoolStats) -> Type[QueuePool]:
+    """connect() 소요 시간(체크아웃 대기 + 연결 생성)을 stats에 기록하는 풀 클래스를 만듭니다."""
+
+    class InstrumentedPool(base):
+        pool_stats = stats
+
+        def connect(self):
+            started_at = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                self.pool_stats.record(time.perf_counter() - started_at, timed_out=True)
+                raise
+            self.pool_stats.record(time.perf_counter() - started_at)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    InstrumentedPool.__qualname__ = InstrumentedPool.__name__
+    return InstrumentedPool
+
+
+async_pool_stats = PoolStats("async")
+sync_pool_stats = PoolStats("sync")
+
+InstrumentedAsyncPool = instrumented_pool_class(AsyncAdaptedQueuePool, async_pool_stats)
+InstrumentedSyncPool = instrumented_pool_class(QueuePool, sync_pool_stats)
+
+
+def engine_pool_kwargs() -> Dict[str, Any]:
+    """Settings의 풀/컴파일 캐시 설정을 create_engine 인자로 변환합니다."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+    }
+
+
+def server_settings() -> Dict[str, str]:
+    """연결 시 적용할 PostgreSQL 세션 설정"""
+    values = {"application_name": settings.DB_APPLICATION_NAME}
+    if settings.DB_JIT is not None:
+        values["jit"] = "on" if settings.DB_JIT else "off"
+    return values
+
+
+def asyncpg_connect_args() -> Dict[str, Any]:
+    return {
+        "server_settings": server_settings(),
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+
+
+def psycopg2_connect_args() -> Dict[str, Any]:
+    values = server_settings()
+    connect_args: Dict[str, Any] = {"application_name": values.pop("application_name")}
+    if values:
+        connect_args["options"] = " ".join(f"-c {name}={value}" for name, value in values.items())
+    return connect_args
+
+
+def pool_status(engine: Optional[Any], stats: PoolStats) -> Dict[str, Any]:
+    """풀의 현재 상태(사용 중/유휴/오버플로)와 누적 통계를 반환합니다."""
+    if engine is None:
+        return {"initialized": False, **stats.snapshot()}
+
+    pool = engine.pool
+    status: Dict[str, Any] = {"initialized": True, "pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        checked_out = pool.checkedout()
+        status.update({
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "checked_in": pool.checkedin(),
+            "checked_out": checked_out,
+            "overflow": max(0, pool.overflow()),
+            "utilization": round(checked_out / max(1, pool.size() + max(0, pool._max_overflow)), 3),
+        })
+    status.update(stats.snapshot())
+    return status
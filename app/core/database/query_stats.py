@@ -0,0 +1,282 @@
+import heapq
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENTATION_MODES = ("off", "warn", "raise")
+
+
+class QueryGuardError(Exception):
+    """raise 모드에서 쿼리 예산 초과, N+1, 지연 로딩이 감지되었을 때 발생하는 예외"""
+
+
+def _shorten(statement: str, length: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= length else statement[:length] + "..."
+
+
+class QueryStats:
+    """요청 하나에서 실행된 SQL 문장 통계
+
+    같은 SQL 문장(파라미터 제외)의 실행 횟수를 세어 N+1 패턴을 찾고,
+    가장 오래 걸린 문장 slowest_size개를 보관합니다.
+    """
+
+    def __init__(self, slowest_size: int = 5):
+        self.slowest_size = slowest_size
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements: Counter = Counter()
+        self.lazy_loads: List[str] = []
+        self._slowest: List[Tuple[float, int, str]] = []  # 최소 힙 (seconds, 순번, statement)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.statements[statement] += 1
+        item = (seconds, self.count, statement)
+        if len(self._slowest) < self.slowest_size:
+            heapq.heappush(self._slowest, item)
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, item)
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        return [(seconds, statement) for seconds, _, statement in sorted(self._slowest, reverse=True)]
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번 이상 반복된 문장 (N+1 의심)"""
+        if threshold <= 0:
+            return []
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "slowest": [
+                {"ms": round(seconds * 1000, 3), "statement": _shorten(statement)}
+                for seconds, statement in self.slowest
+            ],
+            "lazy_loads": list(self.lazy_loads),
+        }
+
+
+# 현재 요청의 통계 (미들웨어 또는 track_queries가 설정; 요청 밖의 문장은 집계하지 않음)
+# 비동기 세션의 동기 실행부(greenlet)와 요청에서 만든 태스크는 같은 컨텍스트를 공유합니다.
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 SQL 문장을 집계합니다. (테스트/스크립트용)
+
+        with track_queries() as stats:
+            await service.get_users_list(0, 20)
+        assert stats.count <= 2
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryGuard:
+    """SQL 계측 설정과 검사
+
+    - 모든 문장: slow_query_seconds를 넘으면 바로 로그를 남깁니다.
+    - 요청 단위: 쿼리 예산 초과, N+1(같은 문장 반복), 지연 로딩을 검사합니다.
+      warn 모드는 로그만 남기고, raise 모드는 QueryGuardError를 발생시킵니다.
+      (지연 로딩은 raise 모드에서 로딩 시점에 바로 실패합니다)
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        slow_query_seconds: float,
+        n_plus_one_threshold: int,
+        default_budget: int = 0,
+        budgets: Optional[Dict[str, int]] = None,
+        server_timing: bool = False,
+    ):
+        if mode not in INSTRUMENTATION_MODES:
+            raise ValueError(f"Unknown instrumentation mode: {mode}")
+        self.mode = mode
+        self.slow_query_seconds = slow_query_seconds
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.default_budget = default_budget
+        self.budgets = budgets or {}
+        self.server_timing = server_timing
+
+        # 메트릭 (요청 태스크와 동기 엔진 스레드에서 갱신)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.slow_queries = 0
+        self.budget_exceeded = 0
+        self.n_plus_one = 0
+        self.lazy_loads = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def budget_for(self, label: str) -> int:
+        """라우트 라벨("GET /api/v1/users/")의 쿼리 예산. 0이면 제한 없음"""
+        return self.budgets.get(label, self.default_budget)
+
+    def _count(self, metric: str) -> None:
+        with self._lock:
+            setattr(self, metric, getattr(self, metric) + 1)
+
+    # 엔진/세션 이벤트
+
+    def instrument_engine(self, engine: Engine) -> None:
+        """엔진의 모든 문장 실행 시간을 측정합니다. (비동기 엔진은 sync_engine을 전달, off 모드에서는 등록하지 않음)"""
+        if not self.enabled:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def instrument_session(self, session_class: Type[Session]) -> None:
+        """세션 클래스에서 발생하는 지연 로딩(lazy load)을 감지합니다. (off 모드에서는 등록하지 않음)"""
+        if not self.enabled:
+            return
+        event.listen(session_class, "do_orm_execute", self._do_orm_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get("query_started_at")
+        if not started:
+            return
+        seconds = time.perf_counter() - started.pop()
+        if not self.enabled:
+            return
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, seconds)
+        if seconds >= self.slow_query_seconds:
+            self._count("slow_queries")
+            logger.warning(f"[SlowQuery] {seconds * 1000:.1f}ms {_shorten(statement)}")
+
+    def _do_orm_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if not self.enabled or orm_execute_state.lazy_loaded_from is None:
+            return
+        # 지연 로딩은 요청마다 위치가 같으므로 관계 경로로 보고합니다. (예: User.jwt_storage)
+        path = orm_execute_state.loader_strategy_path
+        relationship = path[-1] if path is not None and len(path) else None
+        name = str(relationship) if relationship is not None else "unknown relationship"
+        self._count("lazy_loads")
+        if self.mode == "raise":
+            raise QueryGuardError(f"Lazy load of {name}; load it eagerly (selectinload/joinedload)")
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.lazy_loads.append(name)
+        else:
+            logger.warning(f"[LazyLoad] {name}")
+
+    # 요청 단위 검사
+
+    def check(self, stats: QueryStats, label: str, budget: Optional[int] = None) -> List[str]:
+        """요청 통계를 검사하고 발견한 문제 목록을 반환합니다. (raise 모드에서는 예외)"""
+        if not self.enabled:
+            return []
+        with self._lock:
+            self.requests += 1
+
+        problems: List[str] = []
+        budget = self.budget_for(label) if budget is None else budget
+        if budget and stats.count > budget:
+            self._count("budget_exceeded")
+            problems.append(f"{stats.count} queries exceed budget of {budget}")
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            self._count("n_plus_one")
+            problems.append(f"N+1 suspected, {count}x: {_shorten(statement)}")
+        for name in stats.lazy_loads:
+            problems.append(f"lazy load of {name}")
+
+        if not problems:
+            return problems
+        summary = f"{label} ({stats.count} queries, {stats.total_seconds * 1000:.1f}ms): " + "; ".join(problems)
+        if self.mode == "raise":
+            raise QueryGuardError(summary)
+        logger.warning(f"[QueryGuard] {summary}")
+        return problems
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "requests": self.requests,
+            "slow_queries": self.slow_queries,
+            "budget_exceeded": self.budget_exceeded,
+            "n_plus_one": self.n_plus_one,
+            "lazy_loads": self.lazy_loads,
+        }
+
+
+class QueryStatsMiddleware:
+    """요청마다 SQL 통계를 모으고 응답 후 쿼리 예산/N+1/지연 로딩을 검사하는 ASGI 미들웨어
+
+    guard.server_timing이 켜져 있으면 Server-Timing 헤더에 응답 시작 시점까지의 DB 시간과 문장 수를 담습니다.
+    라우트 라벨은 "메서드 경로 템플릿" 형식입니다. (예: "GET /api/v1/users/{user_id}")
+    """
+
+    def __init__(self, app, guard: "QueryGuard"):
+        self.app = app
+        self.guard = guard
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.guard.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and self.guard.server_timing:
+                timing = f'db;dur={stats.total_seconds * 1000:.1f};desc="{stats.count} queries"'
+                message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+
+        # 응답이 끝난 뒤 검사하므로 raise 모드의 예외는 서버 오류로 기록됩니다. (테스트에서는 그대로 전파)
+        route = scope.get("route")
+        path = getattr(route, "path", None) or scope.get("path", "")
+        self.guard.check(stats, f"{scope.get('method', '')} {path}")
+
+
+# 전역 SQL 계측 인스턴스
+query_guard = QueryGuard(
+    mode=settings.DB_INSTRUMENTATION_MODE,
+    slow_query_seconds=settings.DB_SLOW_QUERY_MS / 1000,
+    n_plus_one_threshold=settings.DB_N_PLUS_ONE_THRESHOLD,
+    default_budget=settings.DB_QUERY_BUDGET_DEFAULT,
+    budgets=settings.DB_QUERY_BUDGETS,
+    server_timing=settings.DB_SERVER_TIMING_HEADER,
+)
@@ -0,0 +1,255 @@
+import asyncio
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select, visitors
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.selectable import CTE
+
+from app.core.config import settings
+from .pool import asyncpg_connect_args, engine_pool_kwargs
+from .query_stats import query_guard
+
+logger = logging.getLogger(__name__)
+
+# 레플리카로 보내도 되는 SELECT에 붙이는 실행 옵션
+#   select(User).execution_options(**REPLICA_READ)
+REPLICA_READ = {"use_replica": True}
+
+# 요청 단위 라우팅 상태 ({"sticky": bool, "wrote": bool}); 미들웨어가 요청마다 새로 설정
+_routing_state: ContextVar[Optional[Dict[str, bool]]] = ContextVar("db_routing_state", default=None)
+
+# SELECT별 데이터 변경 CTE 포함 여부 (모듈 수준에서 재사용되는 문장은 한 번만 순회)
+_dml_cte_cache: "WeakKeyDictionary[Select, bool]" = WeakKeyDictionary()
+
+_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class Replica:
+    """읽기 전용 레플리카 하나의 엔진과 최근 상태"""
+
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = False
+        self.lag_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class ReplicaSet:
+    """레플리카 목록과 주기적인 지연(lag) 측정
+
+    측정 전이거나 오류/지연 초과인 레플리카는 사용하지 않으며,
+    사용할 수 있는 레플리카가 없으면 읽기도 프라이머리로 보냅니다.
+    """
+
+    def __init__(self, urls: List[str], max_lag_seconds: float, check_interval_seconds: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.replicas = [
+            Replica(f"replica-{index}", self._create_engine(url)) for index, url in enumerate(urls)
+        ]
+        self._round_robin = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+
+    @staticmethod
+    def _create_engine(url: str) -> AsyncEngine:
+        engine = create_async_engine(
+            url.replace("postgresql://", "postgresql+asyncpg://", 1),
+            connect_args=asyncpg_connect_args(),
+            **engine_pool_kwargs(),
+        )
+        query_guard.instrument_engine(engine.sync_engine)
+        return engine
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[Replica]:
+        """사용 가능한 레플리카를 라운드 로빈으로 고릅니다. 없으면 None"""
+        candidates = [replica for replica in self.replicas if replica.healthy]
+        if not candidates:
+            self.primary_fallbacks += 1
+            return None
+        self.replica_reads += 1
+        return candidates[next(self._round_robin) % len(candidates)]
+
+    async def check(self, replica: Replica) -> None:
+        try:
+            async with replica.engine.connect() as connection:
+                lag = float((await connection.execute(_LAG_QUERY)).scalar() or 0)
+            replica.lag_seconds = lag
+            replica.error = None
+            replica.healthy = lag <= self.max_lag_seconds
+        except Exception as e:
+            replica.healthy = False
+            replica.error = str(e) or type(e).__name__
+            logger.warning(f"[ReplicaSet] {replica.name} check failed: {replica.error}")
+
+    async def check_all(self) -> None:
+        await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self.check_interval_seconds)
+
+    def start(self) -> None:
+        """백그라운드 지연 측정을 시작합니다."""
+        if self.replicas and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "replica_reads": self.replica_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+            "max_lag_seconds": self.max_lag_seconds,
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "lag_seconds": replica.lag_seconds,
+                    "error": replica.error,
+                }
+                for replica in self.replicas
+            ],
+        }
+
+
+def has_dml_cte(stmt: Select) -> bool:
+    """INSERT/UPDATE/DELETE를 CTE로 포함한 SELECT인지 확인합니다. (WITH ... INSERT ... RETURNING을 감싼 SELECT는 쓰기)"""
+    cached = _dml_cte_cache.get(stmt)
+    if cached is None:
+        cached = any(
+            isinstance(element, CTE) and isinstance(element.element, UpdateBase)
+            for element in visitors.iterate(stmt)
+        )
+        _dml_cte_cache[stmt] = cached
+    return cached
+
+
+def mark_primary_write() -> None:
+    """현재 요청에서 쓰기가 발생했음을 기록합니다. 이후 읽기는 프라이머리로 갑니다."""
+    state = _routing_state.get()
+    if state is not None:
+        state["wrote"] = True
+
+
+def primary_required() -> bool:
+    """현재 요청(또는 클라이언트 세션)이 프라이머리에서 읽어야 하는지 확인합니다."""
+    state = _routing_state.get()
+    return state is not None and (state["sticky"] or state["wrote"])
+
+
+class RoutingSession(Session):
+    """REPLICA_READ 옵션이 붙은 SELECT만 레플리카로 보내는 세션
+
+    세션이나 요청에서 쓰기가 한 번이라도 발생했다면(read-your-writes)
+    또는 사용할 수 있는 레플리카가 없으면 프라이머리를 사용합니다.
+    SELECT가 아닌 문장과 데이터 변경 CTE를 포함한 SELECT는 쓰기로 기록합니다.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if replica_set and self._can_use_replica(clause):
+            replica = replica_set.choose()
+            if replica is not None:
+                return replica.engine.sync_engine
+
+        if self._is_write(clause):
+            self.info["wrote"] = True
+            mark_primary_write()
+        return super().get_bind(mapper, clause=clause, **kw)
+
+    def _is_write(self, clause) -> bool:
+        if self._flushing:
+            return True
+        if clause is None:
+            return False
+        return not isinstance(clause, Select) or has_dml_cte(clause)
+
+    def _can_use_replica(self, clause) -> bool:
+        return (
+            isinstance(clause, Select)
+            and clause.get_execution_options().get("use_replica", False)
+            and clause._for_update_arg is None
+            and not self._flushing
+            and not self.info.get("wrote")
+            and not primary_required()
+            and not has_dml_cte(clause)
+        )
+
+
+class ReadYourWritesMiddleware:
+    """쓰기가 발생한 클라이언트를 잠시 프라이머리에 고정하는 ASGI 미들웨어
+
+    쓰기가 있던 응답에 쿠키를 남기고, 쿠키가 유효한 동안의 요청은 프라이머리에서 읽습니다.
+    """
+
+    COOKIE_NAME = "db_primary_until"
+
+    def __init__(self, app, sticky_seconds: int):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+
+    def _is_sticky(self, scope) -> bool:
+        for name, value in scope.get("headers", ()):
+            if name != b"cookie":
+                continue
+            for cookie in value.decode("latin-1").split(";"):
+                key, _, until = cookie.strip().partition("=")
+                if key == self.COOKIE_NAME:
+                    try:
+                        return float(until) > time.time()
+                    except ValueError:
+                        return False
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not replica_set:
+            await self.app(scope, receive, send)
+            return
+
+        state = {"sticky": self._is_sticky(scope), "wrote": False}
+        token = _routing_state.set(state)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and state["wrote"] and self.sticky_seconds > 0:
+                cookie = (
+                    f"{self.COOKIE_NAME}={int(time.time()) + self.sticky_seconds}; "
+                    f"Max-Age={self.sticky_seconds}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _routing_state.reset(token)
+
+
+# 전역 레플리카 목록 (DATABASE_REPLICA_URLS 미설정 시 비어 있음)
+replica_set = ReplicaSet(
+    settings.DATABASE_REPLICA_URLS,
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.REPLICA_CHECK_INTERVAL_SECONDS,
+)
@@ -0,0 +1,56 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+# users 행 수 카운터 트리거 (함수는 alembic 004/005, 트리거 설치는 선택 사항: alembic 008)
+# 모든 INSERT/DELETE/UPDATE 문장이 table_row_counts의 'users' 행 하나를 갱신하므로,
+# 설치하면 동시 가입/삭제가 커밋 시점까지 그 행 잠금에서 직렬화됩니다.
+# USERS_COUNT_STRATEGY=counter를 쓸 때만 scripts/users_row_counter.py enable로 설치합니다.
+USERS_ROW_COUNT_TRIGGERS = (
+    ("users_row_count_insert", "AFTER INSERT", "REFERENCING NEW TABLE AS new_rows"),
+    ("users_row_count_delete", "AFTER DELETE", "REFERENCING OLD TABLE AS old_rows"),
+    ("users_row_count_update", "AFTER UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("users_row_count_truncate", "AFTER TRUNCATE", ""),
+)
+
+_SELECT_INSTALLED_TRIGGERS = text(
+    "SELECT tgname FROM pg_trigger WHERE tgrelid = 'users'::regclass AND tgname = ANY(:names)"
+)
+
+
+def _drop_triggers(connection: Connection) -> None:
+    for name, _, _ in USERS_ROW_COUNT_TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {name} ON users"))
+
+
+def enable_users_row_counter(connection: Connection) -> int:
+    """카운터 트리거를 설치하고 현재 삭제되지 않은 사용자 수로 카운터를 맞춥니다. 맞춘 값을 반환합니다.
+
+    호출한 트랜잭션이 커밋될 때까지 users 쓰기가 잠깁니다.
+    """
+    # 초기값 계산과 트리거 생성 사이에 쓰기가 끼어들지 않도록 잠금
+    connection.execute(text("LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE"))
+    _drop_triggers(connection)
+    for name, event, referencing in USERS_ROW_COUNT_TRIGGERS:
+        connection.execute(text(
+            f"CREATE TRIGGER {name} {event} ON users {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {name}()"
+        ))
+    return connection.execute(text("""
+        INSERT INTO table_row_counts (table_name, row_count)
+        SELECT 'users', count(*) FROM users WHERE deleted_at IS NULL
+        ON CONFLICT (table_name) DO UPDATE SET row_count = EXCLUDED.row_count
+        RETURNING row_count
+    """)).scalar_one()
+
+
+def disable_users_row_counter(connection: Connection) -> None:
+    """카운터 트리거를 제거합니다. 카운터 행도 지워 counter 방식이 정확한 COUNT로 대체되도록 합니다."""
+    _drop_triggers(connection)
+    connection.execute(text("DELETE FROM table_row_counts WHERE table_name = 'users'"))
+
+
+def users_row_counter_enabled(connection: Connection) -> bool:
+    """카운터 트리거가 모두 설치되어 있는지 확인합니다."""
+    names = [name for name, _, _ in USERS_ROW_COUNT_TRIGGERS]
+    installed = connection.execute(_SELECT_INSTALLED_TRIGGERS, {"names": names}).scalars().all()
+    return len(installed) == len(names)
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import Column, MetaData, PrimaryKeyConstraint, Table, UniqueConstraint, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Connection
+
+_DIALECT = postgresql.dialect()
+
+
+@dataclass(frozen=True)
+class SchemaIssue:
+    """스키마 린트 결과 항목"""
+
+    rule: str
+    table: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"[{self.rule}] {self.table}: {self.message}"
+
+
+@dataclass(frozen=True)
+class _IndexInfo:
+    name: str
+    keys: Tuple[str, ...]
+    unique: bool
+    where: Optional[str]
+    kind: str  # index | primary key | unique constraint
+
+
+def _expression_key(expression, table: Table) -> str:
+    """인덱스 요소를 비교용 문자열로 바꿉니다. (컬럼은 이름, 식은 테이블 접두어를 뺀 SQL)"""
+    if isinstance(expression, Column):
+        return expression.name
+    return str(expression.compile(dialect=_DIALECT)).replace(f"{table.name}.", "")
+
+
+def _table_indexes(table: Table) -> List[_IndexInfo]:
+    """기본 키/유일 제약(암시적 인덱스)과 명시적 인덱스를 같은 형태로 모읍니다."""
+    indexes: List[_IndexInfo] = []
+    for constraint in table.constraints:
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)) and constraint.columns:
+            if isinstance(constraint, PrimaryKeyConstraint):
+                kind, default_name = "primary key", f"{table.name}_pkey"
+            else:
+                kind, default_name = "unique constraint", f"{table.name}_{'_'.join(constraint.columns.keys())}_key"
+            name = constraint.name or default_name
+            indexes.append(_IndexInfo(name, tuple(c.name for c in constraint.columns), True, None, kind))
+
+    # table.indexes는 set이므로 결과 순서가 일정하도록 이름순으로 봅니다.
+    for index in sorted(table.indexes, key=lambda index: index.name or ""):
+        keys = tuple(_expression_key(expression, table) for expression in index.expressions)
+        where = index.dialect_options["postgresql"].get("where")
+        where_sql = _expression_key(where, table) if where is not None else None
+        indexes.append(_IndexInfo(index.name or "(unnamed)", keys, bool(index.unique), where_sql, "index"))
+    return indexes
+
+
+def _leading_column(key: str) -> str:
+    return key.split(" ")[0]
+
+
+def _check_foreign_keys(table: Table, indexes: List[_IndexInfo]) -> Iterable[SchemaIssue]:
+    """외래 키 컬럼으로 시작하는 (부분 인덱스가 아닌) 인덱스가 있는지 확인합니다.
+
+    없으면 참조 테이블의 삭제/키 변경 시 이 테이블을 순차 탐색하고, 조인/조회도 느려집니다.
+    """
+    for fk in table.foreign_key_constraints:
+        columns = {column.name for column in fk.columns}
+        covered = any(
+            index.where is None
+            and {_leading_column(key) for key in index.keys[: len(columns)]} == columns
+            for index in indexes
+        )
+        if not covered:
+            yield SchemaIssue(
+                "unindexed-fk",
+                table.name,
+                f"foreign key ({', '.join(sorted(columns))}) -> {fk.referred_table.name} has no index",
+            )
+
+
+def _check_redundant(table: Table, indexes: List[_IndexInfo]) -> Iterable[SchemaIssue]:
+    """같은 키의 인덱스(중복)와, 다른 인덱스로 대신할 수 있는 일반 인덱스(불필요)를 찾습니다.
+
+    제약(기본 키/유일 제약)은 유지하고 명시적 인덱스만 보고합니다.
+    같은 명시적 인덱스가 둘이면 이름순으로 뒤쪽을 보고합니다.
+    """
+    for position, index in enumerate(indexes):
+        if index.kind != "index":
+            continue
+        for other_position, other in enumerate(indexes):
+            if other_position == position or other.where != index.where:
+                continue
+            if other.keys == index.keys and other.unique == index.unique:
+                if other.kind == "index" and other_position > position:
+                    continue
+                yield SchemaIssue(
+                    "duplicate-index",
+                    table.name,
+                    f"{index.name} ({', '.join(index.keys)}) duplicates {other.kind} {other.name}",
+                )
+                break
+            if not index.unique and other.keys[: len(index.keys)] == index.keys:
+                yield SchemaIssue(
+                    "redundant-index",
+                    table.name,
+                    f"{index.name} ({', '.join(index.keys)}) is covered by {other.kind} {other.name}",
+                )
+                break
+
+
+def lint_metadata(metadata: MetaData) -> List[SchemaIssue]:
+    """모델 메타데이터에서 인덱스 없는 외래 키, 중복/불필요 인덱스를 찾습니다."""
+    issues: List[SchemaIssue] = []
+    for table in metadata.sorted_tables:
+        indexes = _table_indexes(table)
+        issues.extend(_check_foreign_keys(table, indexes))
+        issues.extend(_check_redundant(table, indexes))
+    return issues
+
+
+_INDEX_DIFFS = ("add_index", "remove_index", "add_constraint", "remove_constraint")
+# 기본 키/유일 제약이 아니고 통계 초기화 이후 한 번도 사용되지 않은 인덱스
+_UNUSED_INDEXES = text("""
+    SELECT s.relname AS table_name, s.indexrelname AS index_name, s.idx_scan
+    FROM pg_stat_user_indexes AS s
+    JOIN pg_index AS i ON i.indexrelid = s.indexrelid
+    WHERE s.idx_scan = 0 AND NOT i.indisunique AND NOT i.indisprimary
+    ORDER BY s.relname, s.indexrelname
+""")
+
+
+def lint_database(connection: Connection, metadata: MetaData) -> List[SchemaIssue]:
+    """실제 DB와 메타데이터를 비교합니다.
+
+    - schema-drift: Alembic autogenerate 기준으로 모델과 DB의 인덱스가 다른 경우
+    - unused-index: 사용 통계(pg_stat_user_indexes)상 한 번도 사용되지 않은 인덱스
+    """
+    issues: List[SchemaIssue] = []
+    context = MigrationContext.configure(connection)
+    for diff in compare_metadata(context, metadata):
+        # 인덱스/유일 제약 변경만 대상 (그 외 차이는 마이그레이션 검토에서 다룸)
+        if not isinstance(diff, tuple) or diff[0] not in _INDEX_DIFFS:
+            continue
+        action, target = diff[0], diff[1]
+        table_name = target.table.name if getattr(target, "table", None) is not None else "?"
+        issues.append(SchemaIssue("schema-drift", table_name, f"{action} {target.name}"))
+
+    for row in connection.execute(_UNUSED_INDEXES):
+        if row.table_name in metadata.tables:
+            issues.append(SchemaIssue("unused-index", row.table_name, f"{row.index_name} has never been scanned"))
+    return issues
@@ -1,20 +1,21 @@
+from typing import Any, Dict
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from .database.database import get_db
-from app.users.models.user import User
 from app.users.repositories.user_repository import UserRepository
-from .security import verify_token
+from .security import verify_access_token
 from .errors import AppError, AUTH_ERRORS
 from .config import settings
+from .principal_cache import AuthenticatedUser, principal_cache
+from .token_denylist import token_denylist
 
 security = HTTPBearer()
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """현재 사용자 정보를 가져옵니다."""
+async def get_access_token_payload(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Dict[str, Any]:
+    """액세스 토큰을 검증하고 페이로드를 반환합니다."""
     
     if not credentials:
         raise AppError(AUTH_ERRORS["MISSING_AUTHORIZATION_HEADER"])
@@ -23,15 +24,32 @@ async def get_current_user(
     if not token:
         raise AppError(AUTH_ERRORS["MISSING_JWT_TOKEN"])
     
-    # 토큰 검증
-    payload = verify_token(token, settings.JWT_ACCESS_SECRET)
+    # 토큰 검증 (검증된 토큰은 캐시에서 조회)
+    payload = verify_access_token(token)
     if not payload:
         raise AppError(AUTH_ERRORS["INVALID_ACCESS_TOKEN"])
     
+    # 폐기된 토큰 확인 (캐시 적중 여부와 관계없이 매 요청 확인)
+    if token_denylist.is_revoked(payload.get("jti"), payload.get("exp")):
+        raise AppError(AUTH_ERRORS["INVALID_ACCESS_TOKEN"])
+    
+    return payload
+
+async def get_current_user(
+    payload: Dict[str, Any] = Depends(get_access_token_payload),
+    db: AsyncSession = Depends(get_db)
+) -> AuthenticatedUser:
+    """현재 사용자 정보를 가져옵니다."""
+    
     user_id = payload.get("id")
     if not user_id:
         raise AppError(AUTH_ERRORS["INVALID_ACCESS_TOKEN"])
     
+    # 캐시된 사용자 스냅샷 조회
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    
     # 사용자 정보 조회
     user_repository = UserRepository(db)
     user = await user_repository.get_user_by_id(user_id)
@@ -39,4 +57,6 @@ async def get_current_user(
     if not user:
         raise AppError(AUTH_ERRORS["INVALID_ACCESS_TOKEN"])
     
-    return user 
\ No newline at end of file
+    principal = AuthenticatedUser.from_user(user)
+    principal_cache.put(principal)
+    return principal 
\ No newline at end of file
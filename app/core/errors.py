@@ -59,6 +59,26 @@ AUTH_ERRORS = {
         "message": "JWT 토큰이 누락되었습니다",
         "status": 401
     },
+    "PASSWORD_HASHING_BUSY": {
+        "errorCode": 200009,
+        "message": "요청이 많아 잠시 후 다시 시도해주세요",
+        "status": 503
+    },
+    "TOO_MANY_LOGIN_ATTEMPTS": {
+        "errorCode": 200010,
+        "message": "로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요",
+        "status": 429
+    },
+    "INVALID_INTROSPECTION_KEY": {
+        "errorCode": 200011,
+        "message": "유효하지 않은 토큰 검사 키입니다",
+        "status": 401
+    },
+    "INTROSPECTION_DISABLED": {
+        "errorCode": 200012,
+        "message": "토큰 검사 API가 설정되지 않았습니다",
+        "status": 503
+    },
 }
 
 # 사용자 관련 에러들
@@ -93,4 +113,19 @@ USERS_ERRORS = {
         "status": 400,
         "message": "사용자 삭제에 실패했습니다",
     },
+    "INVALID_CURSOR": {
+        "errorCode": 100007,
+        "status": 400,
+        "message": "유효하지 않은 커서입니다",
+    },
+    "INVALID_IMPORT_FORMAT": {
+        "errorCode": 100008,
+        "status": 400,
+        "message": "지원하지 않는 가져오기 형식입니다",
+    },
+    "FAILED_IMPORT_USERS": {
+        "errorCode": 100009,
+        "status": 400,
+        "message": "사용자 일괄 가져오기에 실패했습니다",
+    },
 } 
\ No newline at end of file
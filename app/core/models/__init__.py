@@ -1,3 +1,4 @@
 from .base_model import BaseModel
+from .row_count import table_row_counts
 
-__all__ = ["BaseModel"]
+__all__ = ["BaseModel", "table_row_counts"]
@@ -9,9 +9,13 @@ class BaseModel(Base):
 
     __abstract__ = True
 
-    id = Column(Integer, primary_key=True, index=True)
+    # 기본 키가 이미 인덱스이므로 별도 인덱스(index=True)를 만들지 않습니다.
+    id = Column(Integer, primary_key=True)
 
-    created_at = Column(DateTime(timezone=True), default=func.now(), comment="생성 시간")
+    # 키셋 페이지네이션 정렬 키 (created_at, id)로 쓰이므로 NULL을 허용하지 않습니다. (alembic 007)
+    created_at = Column(
+        DateTime(timezone=True), default=func.now(), server_default=func.now(), nullable=False, comment="생성 시간"
+    )
     updated_at = Column(
         DateTime(timezone=True), default=func.now(), onupdate=func.now(), comment="수정 시간"
     )
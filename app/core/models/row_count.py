@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, Column, String, Table
+from app.core.database.database_manager import Base
+
+# 테이블별 행 수 (트리거로 유지, app/core/database/row_counter.py 참고)
+# 트리거를 설치하지 않았으면(기본값) 행이 비어 있으며, 이 경우 정확한 COUNT로 대체합니다.
+table_row_counts = Table(
+    "table_row_counts",
+    Base.metadata,
+    Column("table_name", String(63), primary_key=True),
+    Column("row_count", BigInteger, nullable=False),
+)
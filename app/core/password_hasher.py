@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusy(Exception):
+    """해싱 대기열이 가득 찼을 때 발생하는 예외"""
+
+
+class PasswordHasher:
+    """비밀번호 해싱/검증을 이벤트 루프 밖의 프로세스 풀에서 실행합니다.
+
+    - max_workers: 프로세스 풀 크기 (0이면 스레드 풀을 사용)
+    - max_concurrency: 동시에 풀에 제출되는 작업 수 상한
+    - max_queue: 상한을 넘어 대기할 수 있는 요청 수 (초과 시 즉시 실패)
+    """
+
+    def __init__(self, max_workers: int, max_concurrency: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 메트릭
+        self._in_flight = 0
+        self._waiting = 0
+        self._max_waiting = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_time = 0.0
+        self._total_run_time = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers > 0:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="password-hasher"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """함수를 풀에서 실행합니다. 대기열이 가득 차면 PasswordHasherBusy를 발생시킵니다."""
+        semaphore = self._get_semaphore()
+
+        if semaphore.locked() and self._waiting >= self.max_queue:
+            self._rejected += 1
+            raise PasswordHasherBusy("비밀번호 해싱 대기열이 가득 찼습니다.")
+
+        self._waiting += 1
+        self._max_waiting = max(self._max_waiting, self._waiting)
+        queued_at = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        started_at = time.perf_counter()
+        self._total_wait_time += started_at - queued_at
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+            self._total_run_time += time.perf_counter() - started_at
+            semaphore.release()
+
+    def get_stats(self) -> dict:
+        """대기열 및 처리량 메트릭을 반환합니다."""
+        completed = self._completed or 1
+        return {
+            "executor": "process" if self.max_workers > 0 else "thread",
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "max_queue_depth": self._max_waiting,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(self._total_wait_time / completed * 1000, 3),
+            "avg_run_ms": round(self._total_run_time / completed * 1000, 3),
+        }
+
+    def shutdown(self):
+        """풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("비밀번호 해싱 풀이 종료되었습니다.")
+
+
+def _default_workers() -> int:
+    return settings.PASSWORD_HASH_WORKERS if settings.PASSWORD_HASH_WORKERS is not None else (os.cpu_count() or 1)
+
+
+# 전역 비밀번호 해싱 풀 인스턴스 (로그인/가입/재해시)
+password_hasher = PasswordHasher(
+    max_workers=_default_workers(),
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY or _default_workers() or 1,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+# 일괄 가져오기 전용 해싱 풀 (가져오기가 password_hasher의 슬롯을 차지하지 않도록 분리)
+bulk_password_hasher = PasswordHasher(
+    max_workers=max(0, settings.PASSWORD_HASH_BULK_WORKERS),
+    max_concurrency=max(1, settings.PASSWORD_HASH_BULK_WORKERS),
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+from .config import settings
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """인증된 사용자의 세션과 분리된(detached) 스냅샷"""
+
+    id: int
+    email: str
+    profile_name: str
+    role: str
+    is_active: bool
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_user(cls, user) -> "AuthenticatedUser":
+        """User 엔티티에서 스냅샷을 생성합니다."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            profile_name=user.profile_name,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class PrincipalCache:
+    """사용자 ID별 AuthenticatedUser 스냅샷을 보관하는 TTL + LRU 캐시
+
+    프로세스 단위 캐시이므로 다른 워커의 변경은 TTL이 지난 뒤에 반영됩니다.
+    """
+
+    def __init__(self, enabled: bool, ttl_seconds: float, max_size: int):
+        self.enabled = enabled and ttl_seconds > 0 and max_size > 0
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[float, AuthenticatedUser]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id: int) -> Optional[AuthenticatedUser]:
+        """캐시된 스냅샷을 반환합니다. 없거나 TTL이 지났으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return principal
+
+    def put(self, principal: AuthenticatedUser) -> None:
+        """스냅샷을 저장합니다."""
+        if not self.enabled:
+            return
+
+        self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(principal.id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자 스냅샷을 캐시에서 제거합니다."""
+        if self._entries.pop(user_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """캐시 적중 메트릭을 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 전역 인증 사용자 캐시 인스턴스
+principal_cache = PrincipalCache(
+    enabled=settings.PRINCIPAL_CACHE_ENABLED,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+)
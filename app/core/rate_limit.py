@@ -0,0 +1,149 @@
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Optional
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis는 선택 의존성
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+SLIDING_WINDOW = "sliding_window"
+TOKEN_BUCKET = "token_bucket"
+RATE_LIMIT_POLICIES = (SLIDING_WINDOW, TOKEN_BUCKET)
+
+
+class RateLimitBackend:
+    """요청 허용 여부를 판단하는 저장소 인터페이스"""
+
+    async def hit(self, key: str, limit: int, window_seconds: float, policy: str) -> bool:
+        """요청 1회를 기록하고 허용되면 True를 반환합니다."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """리소스를 정리합니다."""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """프로세스 메모리 기반 저장소 (워커별로 독립적으로 동작)
+
+    키 수는 max_keys로 제한되며 가장 오래 사용되지 않은 키부터 제거됩니다.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._windows: "OrderedDict[str, deque]" = OrderedDict()
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    @staticmethod
+    def _touch(store: OrderedDict, key: str, max_keys: int) -> None:
+        store.move_to_end(key)
+        while len(store) > max_keys:
+            store.popitem(last=False)
+
+    def _sliding_window(self, key: str, limit: int, window_seconds: float, now: float) -> bool:
+        timestamps = self._windows.get(key)
+        if timestamps is None:
+            timestamps = self._windows[key] = deque()
+        self._touch(self._windows, key, self.max_keys)
+
+        while timestamps and timestamps[0] <= now - window_seconds:
+            timestamps.popleft()
+
+        if len(timestamps) >= limit:
+            return False
+        timestamps.append(now)
+        return True
+
+    def _token_bucket(self, key: str, limit: int, window_seconds: float, now: float) -> bool:
+        rate = limit / window_seconds
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(limit), now]
+        self._touch(self._buckets, key, self.max_keys)
+
+        tokens = min(float(limit), bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
+        return True
+
+    async def hit(self, key: str, limit: int, window_seconds: float, policy: str) -> bool:
+        now = time.monotonic()
+        if policy == TOKEN_BUCKET:
+            return self._token_bucket(key, limit, window_seconds, now)
+        return self._sliding_window(key, limit, window_seconds, now)
+
+
+_SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return 1
+"""
+
+_TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local rate = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return allowed
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Redis 기반 저장소 (모든 워커가 한도를 공유)"""
+
+    def __init__(self, redis_url: str, key_prefix: str = "rate_limit"):
+        if aioredis is None:
+            raise RuntimeError("Redis 백엔드를 사용하려면 redis 패키지를 설치해야 합니다. (pip install \".[redis]\")")
+        self.key_prefix = key_prefix
+        self._client = aioredis.from_url(redis_url)
+        self._sliding_window = self._client.register_script(_SLIDING_WINDOW_SCRIPT)
+        self._token_bucket = self._client.register_script(_TOKEN_BUCKET_SCRIPT)
+
+    async def hit(self, key: str, limit: int, window_seconds: float, policy: str) -> bool:
+        now = time.time()
+        redis_key = f"{self.key_prefix}:{policy}:{key}"
+        if policy == TOKEN_BUCKET:
+            allowed = await self._token_bucket(
+                keys=[redis_key], args=[now, limit, limit / window_seconds]
+            )
+        else:
+            allowed = await self._sliding_window(
+                keys=[redis_key], args=[now, window_seconds, limit, uuid.uuid4().hex]
+            )
+        return bool(allowed)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def create_rate_limit_backend(backend: str, redis_url: Optional[str] = None, key_prefix: str = "rate_limit") -> RateLimitBackend:
+    """설정값에 맞는 저장소를 생성합니다."""
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("REDIS_URL이 설정되지 않았습니다.")
+        return RedisRateLimitBackend(redis_url, key_prefix=key_prefix)
+    return MemoryRateLimitBackend()
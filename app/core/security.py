@@ -1,11 +1,44 @@
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from datetime import datetime, timedelta, timezone
+from jose.utils import base64url_encode, base64url_decode
+from calendar import timegm
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519, padding, rsa
+    _cryptography_import_error = None
+except ImportError as e:  # cryptography는 비대칭 서명 사용 시에만 필요
+    _cryptography_import_error = e
+from datetime import datetime
 from .config import settings
-from typing import Optional, Dict, Any
+from .errors import AppError, AUTH_ERRORS
+from .password_hasher import PasswordHasher, bulk_password_hasher, password_hasher, PasswordHasherBusy
+from .token_cache import access_token_cache
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+import binascii
+import hashlib
+import hmac
+import json
+import time
+import uuid
+
+# 검증을 지원하는 비밀번호 해시 스킴 (기본 스킴 외에는 deprecated 처리되어 로그인 시 재해시)
+SUPPORTED_PASSWORD_SCHEMES = ("sha256_crypt", "bcrypt")
+
+def _build_pwd_context() -> CryptContext:
+    """설정된 스킴과 라운드로 CryptContext를 생성합니다."""
+    scheme = settings.PASSWORD_HASH_SCHEME
+    schemes = [scheme] + [s for s in SUPPORTED_PASSWORD_SCHEMES if s != scheme]
+    options = {}
+    if settings.PASSWORD_HASH_ROUNDS:
+        # 라운드가 다른 기존 해시도 needs_update 대상이 되도록 min/max를 고정
+        for key in ("default_rounds", "min_rounds", "max_rounds"):
+            options[f"{scheme}__{key}"] = settings.PASSWORD_HASH_ROUNDS
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
+pwd_context = _build_pwd_context()
 
 def hash_password(password: str) -> str:
     """비밀번호를 해시화합니다."""
@@ -15,6 +48,76 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호를 검증합니다."""
     return pwd_context.verify(plain_password, hashed_password)
 
+def needs_rehash(hashed_password: str) -> bool:
+    """저장된 해시가 현재 스킴/라운드 정책과 다른지 확인합니다."""
+    try:
+        return pwd_context.needs_update(hashed_password)
+    except ValueError:
+        return False
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호를 해싱 풀에서 해시화합니다."""
+    try:
+        return await password_hasher.run(hash_password, password)
+    except PasswordHasherBusy:
+        raise AppError(AUTH_ERRORS["PASSWORD_HASHING_BUSY"])
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호를 해싱 풀에서 검증합니다."""
+    try:
+        return await password_hasher.run(verify_password, plain_password, hashed_password)
+    except PasswordHasherBusy:
+        raise AppError(AUTH_ERRORS["PASSWORD_HASHING_BUSY"])
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    """여러 비밀번호를 순서대로 해시화합니다. (해싱 풀 작업 1건으로 실행하기 위한 묶음 함수)"""
+    return [hash_password(password) for password in passwords]
+
+async def hash_passwords_async(
+    passwords: List[str],
+    hasher: Optional[PasswordHasher] = None,
+    slice_size: Optional[int] = None,
+) -> List[str]:
+    """여러 비밀번호를 일괄 해싱 풀(bulk_password_hasher)에서 해시화합니다. (입력 순서 유지)
+
+    slice_size개씩 나눈 작업을 풀의 동시 실행 상한만큼만 제출하므로 대기열이 쌓이지 않고,
+    로그인/가입이 쓰는 password_hasher의 슬롯은 사용하지 않습니다.
+    한 작업이 실패하면 남은 작업은 제출하지 않고 취소합니다.
+    """
+    if not passwords:
+        return []
+    hasher = hasher or bulk_password_hasher
+    slice_size = max(1, slice_size or settings.PASSWORD_HASH_BULK_SLICE_SIZE)
+    slices = [passwords[index:index + slice_size] for index in range(0, len(passwords), slice_size)]
+    results: List[Optional[List[str]]] = [None] * len(slices)
+    pending = iter(range(len(slices)))
+
+    async def worker() -> None:
+        for index in pending:
+            results[index] = await hasher.run(hash_passwords, slices[index])
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(hasher.max_concurrency, len(slices)))]
+    try:
+        await asyncio.gather(*workers)
+    except PasswordHasherBusy:
+        raise AppError(AUTH_ERRORS["PASSWORD_HASHING_BUSY"])
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    return [hashed for chunk in results for hashed in chunk]
+
+def _refresh_token_hmac_key() -> bytes:
+    return settings.JWT_REFRESH_TOKEN_HMAC_SECRET.encode("utf-8")
+
+def fingerprint_refresh_token(refresh_token: str) -> str:
+    """리프레시 토큰의 HMAC-SHA256 지문(64자 hex)을 생성합니다."""
+    return hmac.new(_refresh_token_hmac_key(), refresh_token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+def verify_refresh_token_fingerprint(refresh_token: str, fingerprint: str) -> bool:
+    """리프레시 토큰을 저장된 지문과 상수 시간으로 비교합니다."""
+    return hmac.compare_digest(fingerprint_refresh_token(refresh_token), fingerprint)
+
 import re
 
 def _parse_expiration_time(time_str: str) -> int:
@@ -28,30 +131,348 @@ def _parse_expiration_time(time_str: str) -> int:
         return int(match.group(1))
     return 3600
 
+class HS256Codec:
+    """HS256 전용 JWT 인코더/디코더
+
+    python-jose와 바이트 단위로 동일한 토큰을 생성하며, 서명 키(HMAC 객체)와
+    헤더 세그먼트, 만료 시간을 생성 시점에 미리 계산해 둡니다.
+    표준 헤더가 아니거나 aud/at_hash 클레임이 있는 토큰은 python-jose로 검증합니다.
+    """
+
+    HEADER_SEGMENT = base64url_encode(
+        json.dumps({"typ": "JWT", "alg": "HS256"}, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    )
+    _FALLBACK_CLAIMS = ("aud", "at_hash")
+
+    def __init__(self, secret: Optional[str], expires_in: int = 3600):
+        self.secret = secret
+        self.expires_in = expires_in
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256) if secret else None
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any], expires_in: Optional[int] = None) -> str:
+        """클레임에 exp를 추가해 토큰을 생성합니다."""
+        return self.encode_with_exp(claims, expires_in)[0]
+
+    def encode_with_exp(self, claims: Dict[str, Any], expires_in: Optional[int] = None) -> Tuple[str, int]:
+        """토큰과 함께 exp 값을 반환합니다. (발급 직후 토큰을 다시 파싱할 필요가 없도록)"""
+        if self._mac is None:
+            raise JWTError("서명 키가 설정되지 않았습니다.")
+
+        to_encode = claims.copy()
+        exp = to_encode["exp"] = int(time.time()) + (self.expires_in if expires_in is None else expires_in)
+        for time_claim in ("iat", "nbf"):
+            if isinstance(to_encode.get(time_claim), datetime):
+                to_encode[time_claim] = timegm(to_encode[time_claim].utctimetuple())
+
+        payload_segment = base64url_encode(json.dumps(to_encode, separators=(",", ":")).encode("utf-8"))
+        signing_input = self.HEADER_SEGMENT + b"." + payload_segment
+        return (signing_input + b"." + base64url_encode(self._sign(signing_input))).decode("utf-8"), exp
+
+    def decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """토큰을 검증하고 페이로드를 반환합니다. 유효하지 않으면 None을 반환합니다."""
+        if self._mac is None or not isinstance(token, str):
+            return None
+
+        try:
+            raw = token.encode("utf-8")
+            signing_input, signature_segment = raw.rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".", 1)
+        except ValueError:
+            return None
+
+        if header_segment != self.HEADER_SEGMENT:
+            return self._decode_with_jose(token)
+
+        try:
+            signature = base64url_decode(signature_segment)
+            if not hmac.compare_digest(signature, self._sign(signing_input)):
+                return None
+            payload = json.loads(base64url_decode(payload_segment))
+        except (ValueError, TypeError, binascii.Error):
+            return None
+
+        if not isinstance(payload, dict):
+            return None
+        if any(claim in payload for claim in self._FALLBACK_CLAIMS):
+            return self._decode_with_jose(token)
+
+        if not self._validate_claims(payload):
+            return None
+        return payload
+
+    @staticmethod
+    def _validate_claims(payload: Dict[str, Any]) -> bool:
+        """python-jose의 기본 클레임 검증(exp, nbf, iat, sub, jti)과 동일하게 검사합니다."""
+        now = int(time.time())
+        try:
+            if "iat" in payload:
+                int(payload["iat"])
+            if "nbf" in payload and int(payload["nbf"]) > now:
+                return False
+            if "exp" in payload and int(payload["exp"]) < now:
+                return False
+        except (ValueError, TypeError):
+            return False
+
+        if "sub" in payload and not isinstance(payload["sub"], str):
+            return False
+        if "jti" in payload and not isinstance(payload["jti"], str):
+            return False
+        return True
+
+    def _decode_with_jose(self, token: str) -> Optional[Dict[str, Any]]:
+        try:
+            return jwt.decode(token, self.secret, algorithms=["HS256"])
+        except JWTError:
+            return None
+
+    def jwks(self) -> Dict[str, List[Dict[str, str]]]:
+        """대칭키는 공개할 수 없으므로 빈 JWKS를 반환합니다."""
+        return {"keys": []}
+
+
+def _b64url_uint(value: int) -> str:
+    return base64url_encode(value.to_bytes((value.bit_length() + 7) // 8 or 1, "big")).decode("ascii")
+
+
+def _public_jwk(public_key: Any) -> Dict[str, str]:
+    """공개키를 JWK(kid 제외)로 변환합니다."""
+    if isinstance(public_key, rsa.RSAPublicKey):
+        numbers = public_key.public_numbers()
+        return {"kty": "RSA", "n": _b64url_uint(numbers.n), "e": _b64url_uint(numbers.e)}
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        raw = public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        return {"kty": "OKP", "crv": "Ed25519", "x": base64url_encode(raw).decode("ascii")}
+    raise ValueError("지원하지 않는 공개키 형식입니다.")
+
+
+def _jwk_thumbprint(jwk: Dict[str, str]) -> str:
+    """RFC 7638 JWK thumbprint (kid 기본값)"""
+    required = ("crv", "kty", "x") if jwk["kty"] == "OKP" else ("e", "kty", "n")
+    canonical = json.dumps({name: jwk[name] for name in required}, separators=(",", ":"), sort_keys=True)
+    return base64url_encode(hashlib.sha256(canonical.encode("utf-8")).digest()).decode("ascii")
+
+
+def _load_pem(value: str) -> bytes:
+    """PEM 문자열 또는 PEM 파일 경로를 읽습니다."""
+    if "-----BEGIN" in value:
+        return value.replace("\\n", "\n").encode("utf-8")
+    with open(value, "rb") as pem_file:
+        return pem_file.read()
+
+
+class AsymmetricJWTCodec:
+    """RS256/EdDSA JWT 인코더/디코더
+
+    개인키/공개키 객체와 헤더 세그먼트를 생성 시점에 미리 준비하고, 헤더의 kid로
+    검증 키를 찾습니다. 키 교체 중에는 이전 공개키를 verification_keys로 함께 등록하면
+    기존 토큰도 만료 시까지 검증됩니다.
+    """
+
+    ALGORITHMS = ("RS256", "EdDSA")
+
+    def __init__(
+        self,
+        algorithm: str,
+        private_key: Any,
+        expires_in: int = 3600,
+        kid: Optional[str] = None,
+        verification_keys: Optional[List[Any]] = None,
+    ):
+        if _cryptography_import_error is not None:
+            raise RuntimeError("비대칭 서명을 사용하려면 cryptography 패키지를 설치해야 합니다.")
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"지원하지 않는 알고리즘입니다: {algorithm}")
+
+        expected = rsa.RSAPrivateKey if algorithm == "RS256" else ed25519.Ed25519PrivateKey
+        if not isinstance(private_key, expected):
+            raise ValueError(f"{algorithm}에 맞지 않는 개인키입니다.")
+
+        self.algorithm = algorithm
+        self.expires_in = expires_in
+        self._private_key = private_key
+
+        self._public_keys: Dict[str, Any] = {}
+        self._jwks: List[Dict[str, str]] = []
+        for index, public_key in enumerate([private_key.public_key(), *(verification_keys or [])]):
+            jwk = _public_jwk(public_key)
+            key_id = kid if index == 0 and kid else _jwk_thumbprint(jwk)
+            if index == 0:
+                self.kid = key_id
+            if key_id in self._public_keys:
+                continue
+            self._public_keys[key_id] = public_key
+            self._jwks.append({**jwk, "kid": key_id, "use": "sig", "alg": algorithm})
+
+        self.header_segment = base64url_encode(
+            json.dumps(
+                {"alg": algorithm, "kid": self.kid, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+            ).encode("utf-8")
+        )
+        # 헤더 세그먼트 -> 검증 키 (대부분 같은 헤더가 반복되므로 파싱 결과를 캐시)
+        self._keys_by_header: Dict[bytes, Any] = {}
+
+    @classmethod
+    def from_pem(
+        cls,
+        algorithm: str,
+        private_key_pem: str,
+        expires_in: int = 3600,
+        kid: Optional[str] = None,
+        verification_key_pems: Optional[List[str]] = None,
+    ) -> "AsymmetricJWTCodec":
+        """PEM 문자열 또는 파일 경로에서 키를 읽어 코덱을 생성합니다."""
+        if _cryptography_import_error is not None:
+            raise RuntimeError("비대칭 서명을 사용하려면 cryptography 패키지를 설치해야 합니다.")
+        private_key = serialization.load_pem_private_key(_load_pem(private_key_pem), password=None)
+        verification_keys = [
+            serialization.load_pem_public_key(_load_pem(pem)) for pem in verification_key_pems or []
+        ]
+        return cls(algorithm, private_key, expires_in, kid, verification_keys)
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        if self.algorithm == "RS256":
+            return self._private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+        return self._private_key.sign(signing_input)
+
+    def _verify(self, public_key: Any, signature: bytes, signing_input: bytes) -> bool:
+        try:
+            if self.algorithm == "RS256":
+                public_key.verify(signature, signing_input, padding.PKCS1v15(), hashes.SHA256())
+            else:
+                public_key.verify(signature, signing_input)
+        except InvalidSignature:
+            return False
+        return True
+
+    def encode(self, claims: Dict[str, Any], expires_in: Optional[int] = None) -> str:
+        """클레임에 exp를 추가해 토큰을 생성합니다."""
+        return self.encode_with_exp(claims, expires_in)[0]
+
+    def encode_with_exp(self, claims: Dict[str, Any], expires_in: Optional[int] = None) -> Tuple[str, int]:
+        """토큰과 함께 exp 값을 반환합니다."""
+        to_encode = claims.copy()
+        exp = to_encode["exp"] = int(time.time()) + (self.expires_in if expires_in is None else expires_in)
+        for time_claim in ("iat", "nbf"):
+            if isinstance(to_encode.get(time_claim), datetime):
+                to_encode[time_claim] = timegm(to_encode[time_claim].utctimetuple())
+
+        payload_segment = base64url_encode(json.dumps(to_encode, separators=(",", ":")).encode("utf-8"))
+        signing_input = self.header_segment + b"." + payload_segment
+        return (signing_input + b"." + base64url_encode(self._sign(signing_input))).decode("utf-8"), exp
+
+    def _key_for_header(self, header_segment: bytes) -> Optional[Any]:
+        public_key = self._keys_by_header.get(header_segment)
+        if public_key is not None:
+            return public_key
+
+        header = json.loads(base64url_decode(header_segment))
+        if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+            return None
+        public_key = self._public_keys.get(header.get("kid"))
+        if public_key is not None and len(self._keys_by_header) < 64:
+            self._keys_by_header[header_segment] = public_key
+        return public_key
+
+    def decode(self, token: str) -> Optional[Dict[str, Any]]:
+        """토큰을 검증하고 페이로드를 반환합니다. 유효하지 않으면 None을 반환합니다."""
+        if not isinstance(token, str):
+            return None
+
+        try:
+            raw = token.encode("utf-8")
+            signing_input, signature_segment = raw.rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".", 1)
+            public_key = self._key_for_header(header_segment)
+            if public_key is None:
+                return None
+            if not self._verify(public_key, base64url_decode(signature_segment), signing_input):
+                return None
+            payload = json.loads(base64url_decode(payload_segment))
+        except (ValueError, TypeError, binascii.Error):
+            return None
+
+        if not isinstance(payload, dict) or not HS256Codec._validate_claims(payload):
+            return None
+        return payload
+
+    def jwks(self) -> Dict[str, List[Dict[str, str]]]:
+        """공개키 목록을 JWKS 형식으로 반환합니다."""
+        return {"keys": [dict(jwk) for jwk in self._jwks]}
+
+
+def _create_access_token_codec():
+    """설정된 알고리즘에 맞는 액세스 토큰 코덱을 생성합니다."""
+    expires_in = _parse_expiration_time(settings.JWT_ACCESS_EXPIRATION_TIME)
+    if settings.JWT_ACCESS_ALGORITHM == "HS256":
+        return HS256Codec(settings.JWT_ACCESS_SECRET, expires_in)
+
+    if not settings.JWT_ACCESS_PRIVATE_KEY:
+        raise ValueError("JWT_ACCESS_PRIVATE_KEY가 설정되지 않았습니다.")
+    verification_keys = [
+        value.strip() for value in (settings.JWT_ACCESS_VERIFICATION_KEYS or "").split(",") if value.strip()
+    ]
+    return AsymmetricJWTCodec.from_pem(
+        settings.JWT_ACCESS_ALGORITHM,
+        settings.JWT_ACCESS_PRIVATE_KEY,
+        expires_in,
+        kid=settings.JWT_ACCESS_KEY_ID,
+        verification_key_pems=verification_keys,
+    )
+
+
+# 시작 시점에 키와 만료 시간을 미리 계산한 코덱
+access_token_codec = _create_access_token_codec()
+refresh_token_codec = HS256Codec(
+    settings.JWT_REFRESH_SECRET, _parse_expiration_time(settings.JWT_REFRESH_EXPIRATION_TIME)
+)
+_codecs_by_secret: Dict[str, HS256Codec] = {
+    codec.secret: codec
+    for codec in (access_token_codec, refresh_token_codec)
+    if isinstance(codec, HS256Codec) and codec.secret
+}
+
+def _get_codec(secret_key: str) -> HS256Codec:
+    codec = _codecs_by_secret.get(secret_key)
+    if codec is None:
+        codec = HS256Codec(secret_key)
+        if len(_codecs_by_secret) < 16:
+            _codecs_by_secret[secret_key] = codec
+    return codec
+
 def create_access_token(data: Dict[str, Any]) -> str:
-    """액세스 토큰을 생성합니다."""
-    to_encode = data.copy()
-    expiration_time = _parse_expiration_time(settings.JWT_ACCESS_EXPIRATION_TIME)
-    expire = datetime.now(timezone.utc) + timedelta(seconds=expiration_time)
-    to_encode.update({"exp": expire})
-    
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_ACCESS_SECRET, algorithm="HS256")
-    return encoded_jwt
+    """액세스 토큰을 생성합니다. 폐기할 수 있도록 토큰마다 고유한 jti를 부여합니다."""
+    return access_token_codec.encode({**data, "jti": uuid.uuid4().hex})
 
 def create_refresh_token(data: Dict[str, Any]) -> str:
     """리프레시 토큰을 생성합니다."""
-    to_encode = data.copy()
-    expiration_time = _parse_expiration_time(settings.JWT_REFRESH_EXPIRATION_TIME)
-    expire = datetime.now(timezone.utc) + timedelta(seconds=expiration_time)
-    to_encode.update({"exp": expire})
-    
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_REFRESH_SECRET, algorithm="HS256")
-    return encoded_jwt
+    return refresh_token_codec.encode(data)
+
+def create_refresh_token_with_exp(data: Dict[str, Any]) -> Tuple[str, int]:
+    """리프레시 토큰과 만료 시각(exp)을 함께 생성합니다."""
+    return refresh_token_codec.encode_with_exp(data)
 
 def verify_token(token: str, secret_key: str) -> Optional[Dict[str, Any]]:
     """토큰을 검증하고 페이로드를 반환합니다."""
-    try:
-        payload = jwt.decode(token, secret_key, algorithms=["HS256"])
+    if not secret_key:
+        return None
+    return _get_codec(secret_key).decode(token)
+
+def verify_access_token(token: str) -> Optional[Dict[str, Any]]:
+    """액세스 토큰을 검증합니다. 검증에 성공한 토큰은 만료 시각까지 캐시됩니다."""
+    if not token:
+        return None
+
+    payload = access_token_cache.get(token)
+    if payload is not None:
         return payload
-    except JWTError:
-        return None 
\ No newline at end of file
+
+    payload = access_token_codec.decode(token)
+    if payload is not None:
+        access_token_cache.put(token, payload)
+    return payload 
\ No newline at end of file
@@ -0,0 +1,86 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .config import settings
+
+
+class VerifiedTokenCache:
+    """검증이 끝난 토큰의 페이로드를 토큰 만료 시각까지 보관하는 LRU 캐시
+
+    키는 토큰 원문이 아닌 SHA-256 다이제스트이며, 검증에 성공한 토큰만 저장합니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """캐시된 페이로드를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        if self.max_size <= 0:
+            return None
+
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(payload)
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        """검증된 토큰의 페이로드를 exp 클레임 시각까지 저장합니다."""
+        if self.max_size <= 0:
+            return
+
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (expires_at, dict(payload))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, token: str) -> None:
+        """토큰을 캐시에서 제거합니다."""
+        self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """캐시 적중 메트릭을 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 전역 액세스 토큰 캐시 인스턴스
+access_token_cache = VerifiedTokenCache(max_size=settings.ACCESS_TOKEN_CACHE_SIZE)
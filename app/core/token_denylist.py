@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Set
+
+from .config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis는 선택 의존성
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+
+class TokenDenylist:
+    """폐기된 액세스 토큰(jti)을 만료 시각 버킷별로 보관하는 목록
+
+    토큰은 exp가 속한 버킷에 저장되므로 조회는 버킷 하나만 확인하면 되고(O(1)),
+    버킷 안의 토큰이 모두 만료되면 버킷 단위로 통째로 제거됩니다.
+    sync가 설정되면 폐기 내역을 다른 워커와 공유합니다.
+    """
+
+    def __init__(self, bucket_seconds: int = 60, sync: Optional["RedisDenylistSync"] = None):
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.sync = sync
+        self._buckets: Dict[int, Set[str]] = {}
+        self._current_bucket = 0
+        self.revoked = 0
+
+    def _bucket(self, exp: float) -> int:
+        return int(exp) // self.bucket_seconds
+
+    def _evict_expired(self, now: float) -> None:
+        current = self._bucket(now)
+        if current == self._current_bucket:
+            return
+        self._current_bucket = current
+        # 버킷 b에는 exp < (b + 1) * bucket_seconds 인 토큰만 있으므로 b < current면 모두 만료
+        for bucket in [bucket for bucket in self._buckets if bucket < current]:
+            del self._buckets[bucket]
+
+    def add(self, jti: str, exp: float) -> bool:
+        """로컬 목록에만 추가합니다. 이미 만료된 토큰이면 False를 반환합니다."""
+        now = time.time()
+        if not jti or exp is None or exp <= now:
+            return False
+        self._evict_expired(now)
+        self._buckets.setdefault(self._bucket(exp), set()).add(jti)
+        return True
+
+    async def revoke(self, jti: Optional[str], exp: Optional[float]) -> None:
+        """토큰을 폐기합니다. (jti가 없는 이전 토큰은 폐기할 수 없습니다)"""
+        if not self.add(jti, exp):
+            return
+        self.revoked += 1
+        if self.sync is not None:
+            try:
+                await self.sync.publish(jti, exp)
+            except Exception as e:
+                logger.warning(f"[TokenDenylist] Sync publish error: {str(e)}")
+
+    def is_revoked(self, jti: Optional[str], exp: Optional[float]) -> bool:
+        """폐기된 토큰인지 확인합니다."""
+        if not jti or exp is None or not self._buckets:
+            return False
+        self._evict_expired(time.time())
+        bucket = self._buckets.get(self._bucket(exp))
+        return bucket is not None and jti in bucket
+
+    def clear(self) -> None:
+        """목록을 비웁니다."""
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def get_stats(self) -> dict:
+        """폐기 목록 통계를 반환합니다."""
+        return {
+            "size": len(self),
+            "buckets": len(self._buckets),
+            "bucket_seconds": self.bucket_seconds,
+            "revoked": self.revoked,
+            "synced": self.sync is not None,
+            "sync": self.sync.get_stats() if self.sync is not None else None,
+        }
+
+
+class RedisDenylistSync:
+    """Redis 키 + pub/sub으로 워커 간 폐기 목록을 동기화합니다.
+
+    폐기 시 토큰 만료 시각까지 유지되는 키를 저장하고 채널로 알립니다.
+    시작 시 기존 키를 읽어 들이고, 이후에는 채널 메시지로 로컬 목록을 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        key_prefix: str = "token_denylist",
+        reconnect_min_seconds: float = 0.5,
+        reconnect_max_seconds: float = 30.0,
+    ):
+        if aioredis is None:
+            raise RuntimeError("Redis 동기화를 사용하려면 redis 패키지를 설치해야 합니다. (pip install \".[redis]\")")
+        self.key_prefix = key_prefix
+        self.channel = f"{key_prefix}:events"
+        self.reconnect_min_seconds = reconnect_min_seconds
+        self.reconnect_max_seconds = reconnect_max_seconds
+        self._client = aioredis.from_url(redis_url, decode_responses=True)
+        self._listener: Optional[asyncio.Task] = None
+
+        self.connected = False
+        self.reconnects = 0
+        self.malformed_messages = 0
+        self.last_error: Optional[str] = None
+
+    async def publish(self, jti: str, exp: float) -> None:
+        ttl = max(1, int(exp - time.time()))
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(f"{self.key_prefix}:{jti}", int(exp), ex=ttl)
+            pipe.publish(self.channel, f"{jti}:{int(exp)}")
+            await pipe.execute()
+
+    async def _load(self, denylist: TokenDenylist) -> None:
+        async for key in self._client.scan_iter(match=f"{self.key_prefix}:*", count=1000):
+            if key == self.channel:
+                continue
+            exp = await self._client.get(key)
+            if exp is not None:
+                denylist.add(key[len(self.key_prefix) + 1:], int(exp))
+
+    async def start(self, denylist: TokenDenylist) -> None:
+        """기존 폐기 내역을 불러오고 채널 구독을 시작합니다."""
+        await self._load(denylist)
+        self._listener = asyncio.create_task(self._listen(denylist))
+
+    def _apply(self, denylist: TokenDenylist, data) -> None:
+        try:
+            jti, _, exp = data.rpartition(":")
+            denylist.add(jti, int(exp))
+        except (AttributeError, TypeError, ValueError):
+            self.malformed_messages += 1
+            logger.warning(f"[TokenDenylist] Ignoring malformed sync message: {data!r}")
+
+    async def _listen(self, denylist: TokenDenylist) -> None:
+        """채널을 구독합니다. 연결 오류 시 지수 백오프로 다시 구독하고, 끊긴 동안의 폐기 내역을 다시 불러옵니다."""
+        delay = self.reconnect_min_seconds
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if self.reconnects:
+                    await self._load(denylist)
+                self.connected = True
+                self.last_error = None
+                delay = self.reconnect_min_seconds
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply(denylist, message["data"])
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                self.last_error = str(e) or type(e).__name__
+                logger.error(f"[TokenDenylist] Sync listener error, resubscribing in {delay}s: {self.last_error}")
+            finally:
+                self.connected = False
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.reconnect_max_seconds)
+
+    def get_stats(self) -> dict:
+        """구독 상태를 반환합니다."""
+        return {
+            "listening": self._listener is not None and not self._listener.done(),
+            "connected": self.connected,
+            "reconnects": self.reconnects,
+            "malformed_messages": self.malformed_messages,
+            "last_error": self.last_error,
+        }
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+        await self._client.aclose()
+
+
+def _create_sync() -> Optional[RedisDenylistSync]:
+    if settings.TOKEN_DENYLIST_BACKEND != "redis":
+        return None
+    if not settings.redis_url:
+        raise ValueError("REDIS_URL이 설정되지 않았습니다.")
+    return RedisDenylistSync(settings.redis_url)
+
+
+# 전역 액세스 토큰 폐기 목록
+token_denylist = TokenDenylist(
+    bucket_seconds=settings.TOKEN_DENYLIST_BUCKET_SECONDS,
+    sync=_create_sync(),
+)
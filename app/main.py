@@ -8,8 +8,17 @@ from app.core.database.database import async_engine
 from app.core.errors import AppError
 from app.core.config import settings
 from app.core.database.database_manager import db_manager, Base
+from app.core.database.pool import async_pool_stats, sync_pool_stats, pool_status
+from app.core.database.health import database_health_probe
+from app.core.database.query_stats import QueryStatsMiddleware, query_guard
+from app.core.database.routing import ReadYourWritesMiddleware, replica_set
+from app.core.password_hasher import bulk_password_hasher, password_hasher
+from app.auth.services.login_throttle import login_throttle
+from app.core.token_denylist import token_denylist
 from app.auth.routers.auth_router import auth_router
+from app.auth.routers.jwks_router import jwks_router
 from app.users.routers.user_router import users_router
+from app.users.services.user_purger import user_purger
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -33,6 +42,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 레플리카 사용 시 쓰기 직후 읽기를 프라이머리로 고정
+app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=settings.REPLICA_STICKY_SECONDS)
+
+# 요청별 SQL 통계 수집, 쿼리 예산/N+1/지연 로딩 검사
+app.add_middleware(QueryStatsMiddleware, guard=query_guard)
+
 # 글로벌 예외 처리
 @app.exception_handler(AppError)
 async def app_error_handler(request: Request, exc: AppError):
@@ -77,6 +92,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 # 라우터 등록
 app.include_router(auth_router, prefix="/api/v1/auth")
 app.include_router(users_router, prefix="/api/v1/users")
+app.include_router(jwks_router, prefix="/.well-known")
 
 
 # 헬스 체크 엔드포인트
@@ -84,16 +100,63 @@ app.include_router(users_router, prefix="/api/v1/users")
 async def health_check():
     return {"status": "OK", "message": "Service is running"}
 
-# 데이터베이스 상태 확인 엔드포인트
+# 데이터베이스 상태 확인 엔드포인트 (캐시된 프로브 결과, DB에 직접 질의하지 않음)
 @app.get("/health-check/database")
 async def database_health_check():
-    return db_manager.health_check()
+    return database_health_probe.get_status()
+
+# Liveness: 프로세스가 요청을 처리할 수 있는지만 확인
+@app.get("/health-check/live")
+async def liveness_check():
+    return {"status": "OK"}
+
+# Readiness: 최근 DB 프로브 결과로 트래픽 수신 가능 여부 판단
+@app.get("/health-check/ready")
+async def readiness_check():
+    status = database_health_probe.get_status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+# 커넥션 풀 상태 확인 엔드포인트
+@app.get("/health-check/database/pool")
+async def database_pool_stats():
+    return {
+        "async": pool_status(async_engine, async_pool_stats),
+        "sync": pool_status(db_manager.engine, sync_pool_stats),
+        "replicas": replica_set.get_stats(),
+    }
+
+# SQL 계측 상태 확인 엔드포인트 (느린 문장, 예산 초과, N+1, 지연 로딩 누적 횟수)
+@app.get("/health-check/database/queries")
+async def database_query_stats():
+    return query_guard.get_stats()
+
+# 인증 처리 상태 확인 엔드포인트 (비밀번호 해싱 대기열/처리량, 로그인 시도 제한 거절 횟수, 폐기 목록 동기화 상태)
+@app.get("/health-check/auth")
+async def auth_stats():
+    return {
+        "password_hasher": password_hasher.get_stats(),
+        "bulk_password_hasher": bulk_password_hasher.get_stats(),
+        "login_throttle": login_throttle.get_stats(),
+        "token_denylist": token_denylist.get_stats(),
+    }
 
 # 애플리케이션 시작 시 실행
 @app.on_event("startup")
 async def startup_event():
     logger.info("FastAPI 애플리케이션이 시작됩니다.")
     
+    # 액세스 토큰 폐기 목록 워커 간 동기화
+    if token_denylist.sync:
+        await token_denylist.sync.start(token_denylist)
+    
+    # DB 헬스 프로브 시작 (백그라운드)
+    database_health_probe.start()
+    # 레플리카 지연 측정 시작 (레플리카 설정 시)
+    replica_set.start()
+    # 삭제된 사용자 정리 시작 (백그라운드)
+    if settings.USER_PURGE_ENABLED:
+        user_purger.start()
+    
     # DatabaseManager 초기화
     if not db_manager.initialize_database():
         logger.error("데이터베이스 초기화에 실패했습니다.")
@@ -110,6 +173,21 @@ async def shutdown_event():
     logger.info("FastAPI 애플리케이션이 종료됩니다.")
     # DatabaseManager 리소스 정리
     db_manager.cleanup()
+    # 비밀번호 해싱 풀 종료
+    password_hasher.shutdown()
+    bulk_password_hasher.shutdown()
+    # 로그인 제한 저장소 정리
+    if login_throttle.backend:
+        await login_throttle.backend.close()
+    # DB 헬스 프로브 중지
+    await database_health_probe.stop()
+    # 레플리카 엔진 정리
+    await replica_set.stop()
+    # 삭제된 사용자 정리 중지
+    await user_purger.stop()
+    # 폐기 목록 동기화 종료
+    if token_denylist.sync:
+        await token_denylist.sync.close()
 
 if __name__ == "__main__":
     import uvicorn
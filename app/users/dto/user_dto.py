@@ -1,8 +1,16 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime
 from app.users.models.user import UserRole
 
+# 목록 total_count 집계 방식
+# exact: COUNT(*) / cached: TTL 캐시된 COUNT / estimated: pg_class.reltuples / counter: 트리거 카운터 테이블
+CountStrategy = Literal["exact", "cached", "estimated", "counter"]
+# 사용자 일괄 가져오기 입력 형식
+UserImportFormat = Literal["ndjson", "csv"]
+# 사용자 내보내기 출력 형식
+UserExportFormat = Literal["ndjson", "csv"]
+
 # Request DTOs
 class UserCreateDto(BaseModel):
     """사용자 생성 요청 DTO"""
@@ -49,5 +57,23 @@ class UserListResponseDto(BaseModel):
     """사용자 목록 응답 DTO"""
     users: List[UserResponseDto]
     total_count: int
+    total_count_exact: bool = Field(True, description="total_count가 정확한 값인지 여부 (cached/estimated는 false)")
     skip: int
-    limit: int 
\ No newline at end of file
+    limit: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+class UserImportErrorDto(BaseModel):
+    """일괄 가져오기 행 오류 DTO"""
+    line: int = Field(..., description="입력 데이터의 줄 번호 (1부터, CSV는 헤더 포함)")
+    email: Optional[str] = None
+    message: str
+
+class UserImportResultDto(BaseModel):
+    """일괄 가져오기 결과 DTO"""
+    total: int = Field(..., description="처리한 행 수")
+    created: int
+    failed: int
+    errors: List[UserImportErrorDto]
+    errors_truncated: bool = Field(False, description="오류가 상한을 넘어 일부만 포함되었는지 여부")
+    elapsed_seconds: float
+    rows_per_second: float
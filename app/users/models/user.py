@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum
@@ -13,14 +13,24 @@ class User(BaseModel):
     """사용자 모델"""
     __tablename__ = "users"
     __table_args__ = (
-        Index('idx_users_email', 'email', unique=True),
+        # 삭제되지 않은 사용자 사이에서만 이메일이 유일합니다. (삭제된 사용자의 이메일로 재가입 가능)
+        Index('uq_users_email_active', 'email', unique=True, postgresql_where=text('deleted_at IS NULL')),
     )
     
-    email = Column(String(50), unique=True, index=True, nullable=False)
+    email = Column(String(50), nullable=False)
     password = Column(String(100), nullable=False)
     profile_name = Column(String(30), nullable=False)
     role = Column(String(20), default=UserRole.COMMON, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     
     # Relationships
-    jwt_storage = relationship("JwtStorage", back_populates="user", uselist=False) 
\ No newline at end of file
+    jwt_storage = relationship("JwtStorage", back_populates="user", uselist=False) 
+
+# 목록 조회(created_at DESC, id DESC) 키셋 페이지네이션용 커버링 인덱스 (삭제되지 않은 사용자만)
+Index(
+    'idx_users_active_created_at_id',
+    User.created_at.desc(),
+    User.id.desc(),
+    postgresql_include=['email', 'profile_name', 'role', 'is_active', 'updated_at'],
+    postgresql_where=text('deleted_at IS NULL'),
+)
@@ -1,8 +1,172 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
-from typing import Optional, List
-from app.users.models.user import User
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy import select, insert, update, delete, exists, func, any_, bindparam, tuple_, cast, column, table, BigInteger, Integer, Interval, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import joinedload
+from datetime import datetime, timedelta
+from typing import Optional, List, Sequence, Tuple
+from app.users.models.user import User, UserRole
+from app.auth.models.jwt_storage import JwtStorage  # 모듈 로드 시 joinedload(User.jwt_storage)를 구성하기 위해 매퍼 등록
+from app.core.database.routing import REPLICA_READ
+from app.core.models.row_count import table_row_counts
+
+# 자주 호출되는 쿼리는 모듈 로드 시 한 번만 구성합니다.
+# 문장 객체를 재사용하면 구성 비용이 없고, SQLAlchemy 캐시 키도 객체에 메모이즈되어 재계산되지 않습니다.
+# 모든 조회는 삭제되지 않은 사용자만 대상으로 하며, 부분 인덱스(WHERE deleted_at IS NULL)와 조건이 일치합니다.
+ACTIVE_USER = User.deleted_at.is_(None)
+_SELECT_USER_BY_ID = select(User).where(User.id == bindparam("user_id"), ACTIVE_USER)
+_SELECT_USER_BY_ID_REPLICA = _SELECT_USER_BY_ID.execution_options(**REPLICA_READ)
+_SELECT_USER_BY_ID_WITH_JWT = (
+    select(User)
+    .options(joinedload(User.jwt_storage))
+    .where(User.id == bindparam("user_id"), ACTIVE_USER)
+)
+_SELECT_USERS_BY_IDS = (
+    select(User)
+    .where(User.id == any_(bindparam("user_ids", type_=ARRAY(Integer))), ACTIVE_USER)
+    .execution_options(**REPLICA_READ)
+)
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"), ACTIVE_USER)
+# 가입 전 이메일 중복 확인: 유일 인덱스만 확인하는 EXISTS (엔티티/비밀번호 해시를 읽지 않음)
+_EMAIL_EXISTS = (
+    select(exists().where(User.email == bindparam("email"), ACTIVE_USER))
+    .execution_options(**REPLICA_READ)
+)
+# 가입: 사용자와 JWT 저장소를 한 문장(데이터 변경 CTE)으로 생성하고, 생성된 컬럼은 RETURNING으로 받습니다.
+_INSERT_USER = (
+    insert(User)
+    .values(
+        email=bindparam("email"),
+        password=bindparam("password"),
+        profile_name=bindparam("profile_name"),
+        role=UserRole.COMMON.value,
+        is_active=True,
+        created_at=func.now(),
+        updated_at=func.now(),
+    )
+    .returning(User.id, User.created_at)
+    .cte("inserted_user")
+)
+_INSERT_JWT_STORAGE = (
+    insert(JwtStorage)
+    .from_select(
+        [JwtStorage.user_id, JwtStorage.created_at, JwtStorage.updated_at],
+        select(_INSERT_USER.c.id, func.now(), func.now()),
+    )
+    .cte("inserted_jwt_storage")
+)
+_CREATE_USER_WITH_JWT_STORAGE = select(_INSERT_USER.c.id, _INSERT_USER.c.created_at).add_cte(_INSERT_JWT_STORAGE)
+# 목록 응답(UserResponseDto)에 필요한 컬럼만 조회합니다. 엔티티를 만들지 않고, 비밀번호 해시는 읽지 않습니다.
+# 모두 idx_users_active_created_at_id의 키/INCLUDE 컬럼이라 index-only scan이 가능합니다.
+USER_LIST_COLUMNS = (
+    User.id,
+    User.email,
+    User.profile_name,
+    User.role,
+    User.is_active,
+    User.created_at,
+    User.updated_at,
+)
+_SELECT_USERS_PAGE = (
+    select(*USER_LIST_COLUMNS)
+    .where(ACTIVE_USER)
+    .order_by(User.created_at.desc(), User.id.desc())
+    .offset(bindparam("skip", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+    .execution_options(**REPLICA_READ)
+)
+# idx_users_active_created_at_id (created_at DESC, id DESC)를 그대로 따라가는 행 값 비교
+_SELECT_USERS_AFTER = (
+    select(*USER_LIST_COLUMNS)
+    .where(
+        tuple_(User.created_at, User.id)
+        < tuple_(bindparam("cursor_created_at", type_=User.created_at.type), bindparam("cursor_id", type_=Integer)),
+        ACTIVE_USER,
+    )
+    .order_by(User.created_at.desc(), User.id.desc())
+    .limit(bindparam("limit", type_=Integer))
+    .execution_options(**REPLICA_READ)
+)
+# 페이지와 전체 개수를 한 번에 조회 (윈도 함수는 LIMIT 전에 계산되므로 전체 행을 훑지만 왕복은 1회)
+_SELECT_USERS_PAGE_WITH_COUNT = (
+    select(*USER_LIST_COLUMNS, func.count().over().label("total_count"))
+    .where(ACTIVE_USER)
+    .order_by(User.created_at.desc(), User.id.desc())
+    .offset(bindparam("skip", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+    .execution_options(**REPLICA_READ)
+)
+# 내보내기: id 순으로 전체 사용자를 서버 측 커서로 읽습니다.
+_SELECT_USERS_EXPORT = (
+    select(*USER_LIST_COLUMNS)
+    .where(ACTIVE_USER)
+    .order_by(User.id)
+    .execution_options(**REPLICA_READ)
+)
+# 일괄 가져오기: 트랜잭션마다 임시 스테이징 테이블에 COPY한 뒤 집합 단위로 병합합니다.
+IMPORT_STAGING_TABLE = "users_import_staging"
+IMPORT_STAGING_COLUMNS = ("line", "email", "password", "profile_name")
+_CREATE_IMPORT_STAGING = text(f"""
+    CREATE TEMP TABLE {IMPORT_STAGING_TABLE} (
+        line integer NOT NULL,
+        email varchar(50) NOT NULL,
+        password varchar(100) NOT NULL,
+        profile_name varchar(30) NOT NULL
+    ) ON COMMIT DROP
+""")
+# 이미 존재하는 이메일은 ON CONFLICT로 건너뛰고, 새로 생성된 사용자에 대해서만 jwt_storage 행을 만듭니다.
+_MERGE_IMPORT_STAGING = text(f"""
+    WITH inserted AS (
+        INSERT INTO users (email, password, profile_name, role, is_active, created_at, updated_at)
+        SELECT email, password, profile_name, :role, true, now(), now()
+        FROM {IMPORT_STAGING_TABLE}
+        ORDER BY line
+        ON CONFLICT (email) WHERE deleted_at IS NULL DO NOTHING
+        RETURNING id, email
+    ), jwt_storage_rows AS (
+        INSERT INTO jwt_storage (user_id, created_at, updated_at)
+        SELECT id, now(), now() FROM inserted
+    )
+    SELECT staging.line, staging.email, inserted.id AS user_id
+    FROM {IMPORT_STAGING_TABLE} AS staging
+    LEFT JOIN inserted ON inserted.email = staging.email
+    ORDER BY staging.line
+""")
+_COUNT_USERS = select(func.count(User.id)).where(ACTIVE_USER).execution_options(**REPLICA_READ)
+# 플래너 통계 기반 추정치 (ANALYZE/autovacuum 이후 갱신, 한 번도 분석되지 않았으면 -1)
+# 테이블 전체 행 수이므로 아직 정리되지 않은 삭제 사용자도 포함됩니다.
+# text()는 라우팅 세션이 쓰기로 취급하므로 Select로 구성해 레플리카에서 읽습니다.
+_PG_CLASS = table("pg_class", column("oid"), column("reltuples"))
+_ESTIMATE_USERS = (
+    select(cast(_PG_CLASS.c.reltuples, BigInteger))
+    .where(_PG_CLASS.c.oid == func.to_regclass(bindparam("table_name", User.__tablename__)))
+    .execution_options(**REPLICA_READ)
+)
+# 트리거로 유지되는 삭제되지 않은 사용자 수 (선택 설치: scripts/users_row_counter.py, 미설치 시 행 없음)
+_SELECT_USERS_ROW_COUNT = select(table_row_counts.c.row_count).where(
+    table_row_counts.c.table_name == User.__tablename__
+)
+# 삭제는 deleted_at만 기록하고, 실제 행 삭제(jwt_storage는 FK CASCADE)는 백그라운드 정리 작업이 배치로 수행합니다.
+_SOFT_DELETE_USER = (
+    update(User)
+    .where(User.id == bindparam("target_user_id"), ACTIVE_USER)
+    .values(deleted_at=func.now())
+    .returning(User.id)
+)
+# 동시에 실행되는 다른 정리 작업과 겹치지 않도록 SKIP LOCKED로 배치를 고릅니다.
+_SELECT_PURGEABLE_USER_IDS = (
+    select(User.id)
+    .where(User.deleted_at < func.now() - bindparam("retention", type_=Interval))
+    .order_by(User.id)
+    .limit(bindparam("limit", type_=Integer))
+    .with_for_update(skip_locked=True)
+)
+_PURGE_DELETED_USERS = (
+    delete(User)
+    .where(User.id.in_(_SELECT_PURGEABLE_USER_IDS.scalar_subquery()))
+    .execution_options(synchronize_session=False)
+)
 
 
 class UserRepository:
@@ -11,43 +175,55 @@ class UserRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
     
-    async def get_user_by_id(self, user_id: int) -> Optional[User]:
-        """ID로 사용자를 조회합니다."""
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
+    async def get_user_by_id(self, user_id: int, use_replica: bool = True) -> Optional[User]:
+        """ID로 사용자를 조회합니다. 조회 후 수정할 때는 use_replica=False로 프라이머리에서 읽습니다."""
+        stmt = _SELECT_USER_BY_ID_REPLICA if use_replica else _SELECT_USER_BY_ID
+        result = await self.db.execute(stmt, {"user_id": user_id})
         return result.scalar_one_or_none()
     
     async def get_user_by_id_with_jwt(self, user_id: int) -> Optional[User]:
-        """ID로 사용자를 JWT 정보와 함께 조회합니다."""
-        result = await self.db.execute(
-            select(User)
-            .options(selectinload(User.jwt_storage))
-            .where(User.id == user_id)
-        )
+        """ID로 사용자를 JWT 정보와 함께 조회합니다. (LEFT JOIN 단일 쿼리)"""
+        result = await self.db.execute(_SELECT_USER_BY_ID_WITH_JWT, {"user_id": user_id})
         return result.scalar_one_or_none()
     
+    async def get_users_by_ids(self, user_ids: List[int]) -> List[User]:
+        """여러 ID의 사용자를 한 번에 조회합니다. (WHERE id = ANY(:ids), 배열 파라미터 1개)"""
+        if not user_ids:
+            return []
+        result = await self.db.execute(_SELECT_USERS_BY_IDS, {"user_ids": list(user_ids)})
+        return result.scalars().all()
+    
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자를 조회합니다."""
-        result = await self.db.execute(
-            select(User).where(User.email == email)
-        )
+        result = await self.db.execute(_SELECT_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
     
+    async def email_exists(self, email: str) -> bool:
+        """삭제되지 않은 사용자가 이메일을 사용 중인지 확인합니다. (복제 지연이 있을 수 있어 최종 확인은 유일 인덱스)"""
+        result = await self.db.execute(_EMAIL_EXISTS, {"email": email})
+        return bool(result.scalar())
+    
     async def get_user_by_email_with_password(self, email: str) -> Optional[User]:
         """이메일로 사용자를 비밀번호와 함께 조회합니다."""
-        result = await self.db.execute(
-            select(User).where(User.email == email)
-        )
+        result = await self.db.execute(_SELECT_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
     
-    async def create_user(self, user_data: dict) -> User:
-        """사용자를 생성합니다."""
-        user = User(**user_data)
-        self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
-        return user
+    async def create_user_with_jwt_storage(self, email: str, password: str, profile_name: str) -> Row:
+        """사용자와 JWT 저장소를 한 트랜잭션(단일 문장)으로 생성하고 커밋합니다. (id, created_at) 행을 반환합니다.
+        
+        이메일이 이미 사용 중이면 롤백 후 IntegrityError를 다시 발생시킵니다.
+        """
+        try:
+            result = await self.db.execute(
+                _CREATE_USER_WITH_JWT_STORAGE,
+                {"email": email, "password": password, "profile_name": profile_name},
+            )
+            row = result.one()
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise
+        return row
     
     async def update_user(self, user: User) -> User:
         """사용자 정보를 업데이트합니다."""
@@ -55,24 +231,83 @@ class UserRepository:
         await self.db.refresh(user)
         return user
     
-    async def delete_user(self, user: User) -> None:
-        """사용자를 삭제합니다."""
-        await self.db.delete(user)
+    async def update_password(self, user_id: int, new_password: str, old_password: str) -> bool:
+        """비밀번호 해시를 교체합니다. 그 사이 비밀번호가 바뀌었다면 교체하지 않습니다."""
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id, User.password == old_password, ACTIVE_USER)
+            .values(password=new_password)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+    
+    async def import_users(self, records: List[tuple]) -> Sequence[Row]:
+        """(line, email, password, profile_name) 레코드를 COPY로 적재해 한 번에 생성하고 커밋합니다.
+        
+        레코드별 (line, email, user_id) 행을 반환하며, 이미 존재하는 이메일은 user_id가 None입니다.
+        """
+        await self.db.execute(_CREATE_IMPORT_STAGING)
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            IMPORT_STAGING_TABLE, records=records, columns=IMPORT_STAGING_COLUMNS
+        )
+        result = await self.db.execute(_MERGE_IMPORT_STAGING, {"role": UserRole.COMMON.value})
+        rows = result.all()
+        await self.db.commit()
+        return rows
+    
+    async def soft_delete_user(self, user_id: int) -> bool:
+        """사용자를 삭제 처리(deleted_at 기록)합니다. 대상이 없거나 이미 삭제되었으면 False를 반환합니다."""
+        result = await self.db.execute(_SOFT_DELETE_USER, {"target_user_id": user_id})
+        deleted = result.scalar_one_or_none() is not None
+        await self.db.commit()
+        return deleted
+    
+    async def purge_deleted_users(self, retention: timedelta, limit: int) -> int:
+        """삭제 후 retention이 지난 사용자를 최대 limit명 실제로 삭제하고 커밋합니다. 삭제한 행 수를 반환합니다."""
+        result = await self.db.execute(_PURGE_DELETED_USERS, {"retention": retention, "limit": limit})
         await self.db.commit()
+        return result.rowcount
     
-    async def get_users_list(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """사용자 목록을 조회합니다."""
+    async def get_users_list(self, skip: int = 0, limit: int = 100) -> Sequence[Row]:
+        """사용자 목록을 USER_LIST_COLUMNS 행으로 조회합니다. (OFFSET 방식, 뒤 페이지일수록 느려짐)"""
+        result = await self.db.execute(_SELECT_USERS_PAGE, {"skip": skip, "limit": limit})
+        return result.all()
+    
+    async def get_users_list_with_count(self, skip: int = 0, limit: int = 100) -> Tuple[Sequence[Row], Optional[int]]:
+        """사용자 목록(USER_LIST_COLUMNS 행)과 전체 사용자 수를 단일 쿼리로 조회합니다. 페이지가 비어 있으면 개수는 None입니다."""
+        result = await self.db.execute(_SELECT_USERS_PAGE_WITH_COUNT, {"skip": skip, "limit": limit})
+        rows = result.all()
+        if not rows:
+            return [], None
+        return rows, rows[0].total_count
+    
+    async def get_users_after(self, created_at: datetime, user_id: int, limit: int = 100) -> Sequence[Row]:
+        """(created_at, id) 키 다음 사용자 목록을 USER_LIST_COLUMNS 행으로 조회합니다. (키셋 방식, 페이지 위치와 무관하게 일정한 비용)"""
         result = await self.db.execute(
-            select(User)
-            .offset(skip)
-            .limit(limit)
-            .order_by(User.created_at.desc())
+            _SELECT_USERS_AFTER, {"cursor_created_at": created_at, "cursor_id": user_id, "limit": limit}
         )
-        return result.scalars().all()
+        return result.all()
+    
+    async def stream_users_for_export(self, chunk_rows: int) -> AsyncResult:
+        """전체 사용자를 USER_LIST_COLUMNS 행으로 스트리밍합니다. (서버 측 커서, chunk_rows개씩 fetch)"""
+        return await self.db.stream(_SELECT_USERS_EXPORT, execution_options={"yield_per": chunk_rows})
     
     async def get_users_count(self) -> int:
         """전체 사용자 수를 조회합니다."""
-        result = await self.db.execute(
-            select(func.count(User.id))
-        )
-        return result.scalar() 
\ No newline at end of file
+        result = await self.db.execute(_COUNT_USERS)
+        return result.scalar()
+    
+    async def get_users_count_estimate(self) -> Optional[int]:
+        """pg_class.reltuples로 사용자 수를 추정합니다. 통계가 없으면 None을 반환합니다."""
+        result = await self.db.execute(_ESTIMATE_USERS)
+        estimate = result.scalar()
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+    
+    async def get_users_count_from_counter(self) -> Optional[int]:
+        """카운터 테이블에서 사용자 수를 조회합니다. 카운터가 없으면 None을 반환합니다."""
+        result = await self.db.execute(_SELECT_USERS_ROW_COUNT)
+        return result.scalar_one_or_none() 
\ No newline at end of file
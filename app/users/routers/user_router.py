@@ -1,12 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database.database import get_db
 from app.core.dependencies import get_current_user
 from app.dto.base_response import BaseIdResponse, BaseResponse
-from app.users.models.user import User
+from app.core.principal_cache import AuthenticatedUser
 
+from app.users.models.user import UserRole
 from app.users.services.user_service import UserService
-from app.users.dto.user_dto import UserCreateDto, UserUpdateDto, UserResponseDto, UserListResponseDto
+from app.users.services.user_import_service import UserImportService, resolve_import_format
+from app.users.services.user_export_service import EXPORT_MEDIA_TYPES, UserExportService
+from app.users.dto.user_dto import (
+    CountStrategy,
+    UserCreateDto,
+    UserUpdateDto,
+    UserResponseDto,
+    UserListResponseDto,
+    UserImportFormat,
+    UserExportFormat,
+    UserImportResultDto,
+)
 
 users_router = APIRouter()
 
@@ -19,21 +33,63 @@ async def create_user(
     user_service = UserService(db)
     return await user_service.create_user(user_create)
 
+@users_router.post("/import", response_model=UserImportResultDto)
+async def import_users(
+    request: Request,
+    format: Optional[UserImportFormat] = Query(None, description="입력 형식 (미지정 시 Content-Type으로 판단)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """사용자 일괄 가져오기 (관리자 전용, NDJSON 또는 CSV 스트림)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="권한이 없습니다"
+        )
+    
+    import_format = resolve_import_format(format, request.headers.get("content-type"))
+    return await UserImportService(db).import_users(request.stream(), import_format)
+
 @users_router.get("/", response_model=UserListResponseDto)
 async def get_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 skip 무시)"),
+    count: Optional[CountStrategy] = Query(None, description="total_count 집계 방식 (미지정 시 설정값)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 목록 조회"""
     user_service = UserService(db)
-    return await user_service.get_users_list(skip, limit)
+    return await user_service.get_users_list(skip, limit, cursor, count)
+
+# "/{user_id}"보다 먼저 선언해야 export가 user_id로 해석되지 않습니다.
+@users_router.get("/export")
+async def export_users(
+    format: UserExportFormat = Query("ndjson", description="출력 형식"),
+    gzip: bool = Query(False, description="gzip 압축 (Content-Encoding: gzip)"),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """사용자 전체 내보내기 (관리자 전용, NDJSON 또는 CSV 스트림)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="권한이 없습니다"
+        )
+    
+    headers = {"Content-Disposition": f'attachment; filename="users.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        UserExportService().export_users(format, compress=gzip),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
+    )
 
 @users_router.get("/{user_id}", response_model=UserResponseDto)
 async def get_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 상세 조회"""
@@ -44,7 +100,7 @@ async def get_user(
 async def update_user(
     user_id: int,
     user_update: UserUpdateDto,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 정보 업데이트"""
@@ -62,7 +118,7 @@ async def update_user(
 @users_router.delete("/{user_id}", response_model=BaseResponse)
 async def delete_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """사용자 삭제"""
@@ -0,0 +1,103 @@
+import csv
+import io
+import json
+import logging
+import time
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Callable, Optional, Sequence
+
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database.database import AsyncSessionLocal
+from app.users.dto.user_dto import UserExportFormat
+from app.users.repositories.user_repository import USER_LIST_COLUMNS, UserRepository
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = [column.key for column in USER_LIST_COLUMNS]
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def encode_ndjson(rows: Sequence[Row]) -> str:
+    return "".join(
+        json.dumps(row._asdict(), ensure_ascii=False, default=_json_default) + "\n" for row in rows
+    )
+
+
+def encode_csv(rows: Sequence[Row], include_header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if include_header:
+        writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        writer.writerow(
+            "" if value is None else value.isoformat() if isinstance(value, datetime) else value
+            for value in row
+        )
+    return buffer.getvalue()
+
+
+class UserExportService:
+    """사용자 내보내기 비즈니스 로직을 담당하는 Service 클래스
+
+    요청 세션(get_db)은 응답 스트리밍 전에 닫히므로, 스트림마다 자체 세션을 엽니다.
+    서버 측 커서에서 chunk_rows개씩 읽어 응답 청크 하나로 인코딩하며, 클라이언트가 느리면
+    다음 청크를 요청하지 않으므로(ASGI send 대기) 메모리 사용량은 전체 행 수와 무관합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        chunk_rows: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.chunk_rows = max(1, chunk_rows or settings.USERS_EXPORT_CHUNK_ROWS)
+
+    async def export_users(self, export_format: UserExportFormat, compress: bool = False) -> AsyncIterator[bytes]:
+        """전체 사용자를 NDJSON/CSV 바이트 청크로 스트리밍합니다. compress=True이면 gzip으로 압축합니다."""
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+        started_at = time.perf_counter()
+        exported = 0
+
+        try:
+            async with self.session_factory() as session:
+                result = await UserRepository(session).stream_users_for_export(self.chunk_rows)
+                first_chunk = True
+                async for rows in result.partitions(self.chunk_rows):
+                    if export_format == "csv":
+                        text = encode_csv(rows, include_header=first_chunk)
+                    else:
+                        text = encode_ndjson(rows)
+                    first_chunk = False
+                    exported += len(rows)
+
+                    data = text.encode("utf-8")
+                    if compressor is not None:
+                        data = compressor.compress(data)
+                    if data:
+                        yield data
+
+                if first_chunk and export_format == "csv":
+                    data = encode_csv([], include_header=True).encode("utf-8")
+                    yield compressor.compress(data) if compressor is not None else data
+
+            if compressor is not None:
+                yield compressor.flush()
+        except Exception as e:
+            # 응답 헤더가 이미 전송되었으므로 상태 코드를 바꿀 수 없습니다. 스트림을 중단합니다.
+            logger.error(f"[ExportUsers] Error after {exported} rows: {str(e)}")
+            raise
+
+        logger.info(f"[ExportUsers] rows={exported} elapsed={time.perf_counter() - started_at:.3f}s")
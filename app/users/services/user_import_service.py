@@ -0,0 +1,208 @@
+import csv
+import json
+import logging
+import time
+from typing import AsyncIterator, List, Optional, Tuple, Union, get_args
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.count_cache import count_cache
+from app.core.errors import AppError, USERS_ERRORS
+from app.core.security import hash_passwords_async
+from app.users.dto.user_dto import (
+    UserCreateDto,
+    UserImportErrorDto,
+    UserImportFormat,
+    UserImportResultDto,
+)
+from app.users.repositories.user_repository import UserRepository
+from app.users.services.user_service import USERS_COUNT_CACHE_KEY
+
+logger = logging.getLogger(__name__)
+
+# Content-Type → 가져오기 형식
+IMPORT_CONTENT_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+}
+CSV_REQUIRED_COLUMNS = {"email", "password", "profile_name"}
+
+
+def resolve_import_format(explicit: Optional[str], content_type: Optional[str]) -> UserImportFormat:
+    """쿼리 파라미터 또는 Content-Type으로 가져오기 형식을 결정합니다."""
+    if explicit:
+        if explicit not in get_args(UserImportFormat):
+            raise AppError(USERS_ERRORS["INVALID_IMPORT_FORMAT"])
+        return explicit
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in IMPORT_CONTENT_TYPES:
+        raise AppError(USERS_ERRORS["INVALID_IMPORT_FORMAT"])
+    return IMPORT_CONTENT_TYPES[media_type]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """바이트 청크 스트림을 (줄 번호, 줄) 단위로 나눕니다. 빈 줄은 건너뜁니다."""
+    buffer = b""
+    line_number = 0
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw_line in lines:
+            line_number += 1
+            line = raw_line.decode("utf-8", errors="replace").rstrip("\r")
+            if line_number == 1:
+                line = line.lstrip("\ufeff")
+            if line.strip():
+                yield line_number, line
+
+    if buffer.strip():
+        line_number += 1
+        line = buffer.decode("utf-8", errors="replace").rstrip("\r")
+        yield line_number, line.lstrip("\ufeff") if line_number == 1 else line
+
+
+async def parse_records(
+    chunks: AsyncIterator[bytes], import_format: UserImportFormat
+) -> AsyncIterator[Tuple[int, Union[dict, str]]]:
+    """스트림을 (줄 번호, 레코드) 로 변환합니다. 파싱할 수 없는 줄은 레코드 대신 오류 메시지를 반환합니다.
+
+    CSV는 한 줄에 한 레코드여야 합니다. (따옴표 안 줄바꿈 미지원)
+    """
+    header: Optional[List[str]] = None
+
+    async for line_number, line in iter_lines(chunks):
+        if import_format == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield line_number, "JSON 형식이 올바르지 않습니다"
+                continue
+            yield line_number, record if isinstance(record, dict) else "JSON 객체가 아닙니다"
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            if not CSV_REQUIRED_COLUMNS.issubset(header):
+                raise AppError(USERS_ERRORS["INVALID_IMPORT_FORMAT"])
+            continue
+        if len(values) != len(header):
+            yield line_number, "컬럼 수가 헤더와 다릅니다"
+            continue
+        yield line_number, dict(zip(header, values))
+
+
+def _validation_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first["loc"])
+    return f"{field}: {first['msg']}" if field else first["msg"]
+
+
+class _ImportProgress:
+    """가져오기 진행 상황 (오류는 상한까지만 보관)"""
+
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.total = 0
+        self.created = 0
+        self.failed = 0
+        self.errors: List[UserImportErrorDto] = []
+
+    def fail(self, line: int, email: Optional[str], message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(UserImportErrorDto(line=line, email=email, message=message))
+
+
+class UserImportService:
+    """사용자 일괄 가져오기 비즈니스 로직을 담당하는 Service 클래스
+
+    배치마다 비밀번호를 해싱 풀에서 병렬로 해시화하고, COPY로 스테이징 테이블에 적재한 뒤
+    users/jwt_storage에 한 번에 병합합니다. 배치 단위로 커밋하므로 실패한 배치만 오류로 보고됩니다.
+    """
+
+    def __init__(self, db: AsyncSession, batch_size: Optional[int] = None, max_errors: Optional[int] = None):
+        self.db = db
+        self.user_repository = UserRepository(db)
+        self.batch_size = max(1, batch_size or settings.USERS_IMPORT_BATCH_SIZE)
+        self.max_errors = max_errors if max_errors is not None else settings.USERS_IMPORT_MAX_ERRORS
+
+    async def import_users(
+        self, chunks: AsyncIterator[bytes], import_format: UserImportFormat
+    ) -> UserImportResultDto:
+        """NDJSON/CSV 스트림에서 사용자를 일괄 생성합니다."""
+        started_at = time.perf_counter()
+        progress = _ImportProgress(self.max_errors)
+        seen_emails = set()
+        batch: List[Tuple[int, UserCreateDto]] = []
+
+        async for line_number, record in parse_records(chunks, import_format):
+            progress.total += 1
+            if isinstance(record, str):
+                progress.fail(line_number, None, record)
+                continue
+
+            try:
+                user_create = UserCreateDto.model_validate(record)
+            except ValidationError as e:
+                email = record.get("email")
+                progress.fail(line_number, email if isinstance(email, str) else None, _validation_message(e))
+                continue
+
+            if user_create.email in seen_emails:
+                progress.fail(line_number, user_create.email, "입력 데이터에 중복된 이메일입니다")
+                continue
+            seen_emails.add(user_create.email)
+
+            batch.append((line_number, user_create))
+            if len(batch) >= self.batch_size:
+                await self._import_batch(batch, progress)
+                batch = []
+
+        if batch:
+            await self._import_batch(batch, progress)
+
+        if progress.created:
+            count_cache.invalidate(USERS_COUNT_CACHE_KEY)
+
+        elapsed = time.perf_counter() - started_at
+        logger.info(
+            f"[ImportUsers] total={progress.total} created={progress.created} "
+            f"failed={progress.failed} elapsed={elapsed:.3f}s"
+        )
+        return UserImportResultDto(
+            total=progress.total,
+            created=progress.created,
+            failed=progress.failed,
+            errors=progress.errors,
+            errors_truncated=progress.failed > len(progress.errors),
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(progress.total / elapsed, 1) if elapsed > 0 else 0.0,
+        )
+
+    async def _import_batch(self, batch: List[Tuple[int, UserCreateDto]], progress: _ImportProgress) -> None:
+        try:
+            hashed_passwords = await hash_passwords_async([user_create.password for _, user_create in batch])
+            records = [
+                (line_number, user_create.email, hashed_password, user_create.profile_name)
+                for (line_number, user_create), hashed_password in zip(batch, hashed_passwords)
+            ]
+            rows = await self.user_repository.import_users(records)
+        except Exception as e:
+            logger.error(f"[ImportUsers] Batch error (lines {batch[0][0]}-{batch[-1][0]}): {str(e)}")
+            await self.db.rollback()
+            message = e.error_message if isinstance(e, AppError) else USERS_ERRORS["FAILED_IMPORT_USERS"]["message"]
+            for line_number, user_create in batch:
+                progress.fail(line_number, user_create.email, message)
+            return
+
+        for row in rows:
+            if row.user_id is None:
+                progress.fail(row.line, row.email, USERS_ERRORS["USER_EMAIL_ALREADY_EXIST"]["message"])
+            else:
+                progress.created += 1
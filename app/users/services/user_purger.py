@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database.database import AsyncSessionLocal
+from app.users.repositories.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+
+class UserPurger:
+    """삭제 처리된 사용자를 백그라운드에서 배치 단위로 실제 삭제합니다.
+
+    배치마다 짧은 트랜잭션으로 커밋하고 배치 사이에 쉬어 잠금 시간과 I/O를 제한합니다.
+    한 번의 실행에서 max_batches까지만 처리하고 나머지는 다음 주기로 넘깁니다.
+    여러 워커에서 동시에 실행되어도 SKIP LOCKED로 같은 행을 두 번 처리하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        retention_seconds: int,
+        interval_seconds: float,
+        batch_size: int,
+        batch_pause_seconds: float,
+        max_batches: int,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        self.retention = timedelta(seconds=retention_seconds)
+        self.interval_seconds = interval_seconds
+        self.batch_size = max(1, batch_size)
+        self.batch_pause_seconds = batch_pause_seconds
+        self.max_batches = max(1, max_batches)
+        self.session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+
+        # 메트릭
+        self.purged = 0
+        self.runs = 0
+        self.failures = 0
+        self.last_run_at: Optional[float] = None
+
+    async def purge_once(self) -> int:
+        """정리 대상이 없거나 max_batches에 도달할 때까지 배치 삭제를 반복합니다. 삭제한 행 수를 반환합니다."""
+        purged = 0
+        for batch in range(self.max_batches):
+            if batch:
+                await asyncio.sleep(self.batch_pause_seconds)
+            async with self.session_factory() as session:
+                deleted = await UserRepository(session).purge_deleted_users(self.retention, self.batch_size)
+            purged += deleted
+            if deleted < self.batch_size:
+                break
+
+        self.purged += purged
+        self.runs += 1
+        self.last_run_at = time.time()
+        if purged:
+            logger.info(f"[UserPurger] Purged {purged} deleted users")
+        return purged
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.purge_once()
+            except Exception as e:
+                self.failures += 1
+                logger.warning(f"[UserPurger] Error: {str(e) or type(e).__name__}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """백그라운드 정리 작업을 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 정리 작업을 중지합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "purged": self.purged,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_run_at": self.last_run_at,
+        }
+
+
+# 전역 삭제 사용자 정리 작업 인스턴스
+user_purger = UserPurger(
+    retention_seconds=settings.USER_PURGE_RETENTION_DAYS * 24 * 60 * 60,
+    interval_seconds=settings.USER_PURGE_INTERVAL_SECONDS,
+    batch_size=settings.USER_PURGE_BATCH_SIZE,
+    batch_pause_seconds=settings.USER_PURGE_BATCH_PAUSE_SECONDS,
+    max_batches=settings.USER_PURGE_MAX_BATCHES,
+)
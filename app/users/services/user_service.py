@@ -1,51 +1,63 @@
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.auth.repositories.jwt_repository import JwtRepository
 from app.users.models.user import User
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.core.errors import AppError, USERS_ERRORS
+from app.core.principal_cache import AuthenticatedUser, principal_cache
 from app.users.repositories.user_repository import UserRepository
-from app.users.dto.user_dto import UserCreateDto, UserUpdateDto, UserResponseDto, UserListResponseDto
+from app.users.dto.user_dto import CountStrategy, UserCreateDto, UserUpdateDto, UserResponseDto, UserListResponseDto
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.core.config import settings
+from app.core.count_cache import count_cache
+from app.core.database.database import AsyncSessionLocal
+from pydantic import TypeAdapter
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from typing import Callable, List, Optional, Sequence, Tuple, get_args
 import logging
 
 logger = logging.getLogger(__name__)
 
+USERS_COUNT_CACHE_KEY = "users:total_count"
+USERS_LIST_QUERY_MODES = ("sequential", "concurrent", "window")
+# 목록 행을 DTO 리스트로 한 번에 검증 (행마다 model_validate를 호출하지 않음)
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponseDto])
+
 class UserService:
     """사용자 비즈니스 로직을 담당하는 Service 클래스"""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, session_factory: Callable[[], AsyncSession] = AsyncSessionLocal):
         self.db = db
+        # 목록 조회 시 COUNT를 별도 커넥션에서 동시에 실행하기 위한 세션 팩토리
+        self.session_factory = session_factory
         self.user_repository = UserRepository(db)
         self.jwt_repository = JwtRepository(db)
     
     async def create_user(self, user_create: UserCreateDto) -> dict:
         """사용자를 생성합니다."""
         try:
-            # 이메일 중복 확인
-            existing_user = await self.user_repository.get_user_by_email(user_create.email)
-            if existing_user:
+            # 이미 사용 중인 이메일은 비밀번호를 해싱하기 전에 거절 (중복 가입 요청이 해싱 풀을 차지하지 않도록)
+            if await self.user_repository.email_exists(user_create.email):
                 raise AppError(USERS_ERRORS["USER_EMAIL_ALREADY_EXIST"])
             
             # 비밀번호 해시화
-            hashed_password = hash_password(user_create.password)
-            
-            # 사용자 생성
-            user_data = {
-                "email": user_create.email,
-                "password": hashed_password,
-                "profile_name": user_create.profile_name
-            }
-            
-            user = await self.user_repository.create_user(user_data)
+            hashed_password = await hash_password_async(user_create.password)
             
-            # JWT 저장소 생성
-            await self.jwt_repository.create_jwt_storage(user.id)
+            # 사용자와 JWT 저장소를 한 번에 생성 (확인 후 동시에 가입된 경우는 유일 인덱스로 확인)
+            created = await self.user_repository.create_user_with_jwt_storage(
+                user_create.email, hashed_password, user_create.profile_name
+            )
+            count_cache.invalidate(USERS_COUNT_CACHE_KEY)
             
-            logger.info(f"[CreateUser] Success: {user.email}")
+            logger.info(f"[CreateUser] Success: {user_create.email}")
             return {
-                "id": user.id,
+                "id": created.id,
                 "message": "success",
             }
         
+        except IntegrityError:
+            raise AppError(USERS_ERRORS["USER_EMAIL_ALREADY_EXIST"])
         except AppError:
             raise
         except Exception as e:
@@ -67,28 +79,129 @@ class UserService:
             logger.error(f"[GetUserById] Error: {str(e)}")
             raise AppError(USERS_ERRORS["FAILED_GET_USER_PROFILE"])
     
-    async def get_users_list(self, skip: int = 0, limit: int = 100) -> UserListResponseDto:
-        """사용자 목록을 조회합니다."""
+    def _resolve_count_strategy(self, strategy: Optional[CountStrategy]) -> CountStrategy:
+        strategy = strategy or settings.USERS_COUNT_STRATEGY
+        if strategy not in get_args(CountStrategy):
+            logger.warning(f"[GetUsersCount] Unknown strategy '{strategy}', using exact")
+            return "exact"
+        return strategy
+    
+    async def _get_total_count(
+        self,
+        strategy: Optional[CountStrategy] = None,
+        repository: Optional[UserRepository] = None,
+    ) -> Tuple[int, bool]:
+        """지정한 방식으로 전체 사용자 수를 구합니다. (count, 정확한 값 여부)를 반환합니다.
+        
+        추정치나 카운터를 사용할 수 없으면 정확한 COUNT로 대체합니다.
+        """
+        strategy = self._resolve_count_strategy(strategy)
+        repository = repository or self.user_repository
+        
+        if strategy == "cached":
+            count = await count_cache.get_or_load(USERS_COUNT_CACHE_KEY, repository.get_users_count)
+            return count, False
+        if strategy == "estimated":
+            estimate = await repository.get_users_count_estimate()
+            if estimate is not None:
+                return estimate, False
+        elif strategy == "counter":
+            count = await repository.get_users_count_from_counter()
+            if count is not None:
+                return count, True
+        
+        return await repository.get_users_count(), True
+    
+    async def _get_total_count_on_new_session(self, strategy: CountStrategy) -> Tuple[int, bool]:
+        """요청 세션과 별도의 세션(풀 커넥션)에서 전체 사용자 수를 구합니다."""
+        async with self.session_factory() as session:
+            return await self._get_total_count(strategy, UserRepository(session))
+    
+    async def _get_page(self, skip: int, limit: int, keyset: Optional[tuple]) -> Sequence[Row]:
+        if keyset is not None:
+            return await self.user_repository.get_users_after(keyset[0], keyset[1], limit)
+        return await self.user_repository.get_users_list(skip, limit)
+    
+    async def _get_page_and_count(
+        self, skip: int, limit: int, keyset: Optional[tuple], strategy: CountStrategy
+    ) -> Tuple[Sequence[Row], int, bool]:
+        """USERS_LIST_QUERY_MODE에 따라 페이지와 전체 개수를 조회합니다.
+        
+        window 방식은 OFFSET 페이지의 정확한 COUNT에만 적용되며, 그 외에는 concurrent로 처리합니다.
+        """
+        mode = settings.USERS_LIST_QUERY_MODE
+        if mode not in USERS_LIST_QUERY_MODES:
+            logger.warning(f"[GetUsersList] Unknown query mode '{mode}', using sequential")
+            mode = "sequential"
+        
+        if mode == "window" and keyset is None and strategy == "exact":
+            users, total_count = await self.user_repository.get_users_list_with_count(skip, limit)
+            if total_count is not None:
+                return users, total_count, True
+            # 범위를 벗어난 페이지는 개수를 알 수 없으므로 따로 집계
+            total_count, total_count_exact = await self._get_total_count(strategy)
+            return users, total_count, total_count_exact
+        
+        if mode == "sequential":
+            users = await self._get_page(skip, limit, keyset)
+            total_count, total_count_exact = await self._get_total_count(strategy)
+            return users, total_count, total_count_exact
+        
+        users, (total_count, total_count_exact) = await asyncio.gather(
+            self._get_page(skip, limit, keyset),
+            self._get_total_count_on_new_session(strategy),
+        )
+        return users, total_count, total_count_exact
+    
+    async def get_users_list(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None,
+    ) -> UserListResponseDto:
+        """사용자 목록을 조회합니다. cursor가 있으면 키셋 방식으로 다음 페이지를 조회합니다."""
         try:
-            users = await self.user_repository.get_users_list(skip, limit)
-            total_count = await self.user_repository.get_users_count()
+            keyset = None
+            if cursor:
+                try:
+                    keyset = decode_cursor(cursor)
+                except ValueError:
+                    raise AppError(USERS_ERRORS["INVALID_CURSOR"])
             
-            user_dto_list = [UserResponseDto.model_validate(user) for user in users]
+            # 다음 페이지 존재 여부 확인을 위해 limit + 1개 조회
+            users, total_count, total_count_exact = await self._get_page_and_count(
+                skip, limit + 1, keyset, self._resolve_count_strategy(count_strategy)
+            )
+            
+            has_more = len(users) > limit
+            user_dto_list = USER_LIST_ADAPTER.validate_python(users[:limit], from_attributes=True)
+            next_cursor = None
+            if has_more:
+                next_cursor = encode_cursor(user_dto_list[-1].created_at, user_dto_list[-1].id)
             
             return UserListResponseDto(
                 users=user_dto_list,
                 total_count=total_count,
+                total_count_exact=total_count_exact,
                 skip=skip,
-                limit=limit
+                limit=limit,
+                next_cursor=next_cursor
             )
         
+        except AppError:
+            raise
         except Exception as e:
             logger.error(f"[GetUsersList] Error: {str(e)}")
             raise AppError(USERS_ERRORS["FAILED_GET_USER_PROFILE"])
     
-    async def update_user(self, user: User, update_dto: UserUpdateDto) -> UserResponseDto:
+    async def update_user(self, current_user: AuthenticatedUser, update_dto: UserUpdateDto) -> UserResponseDto:
         """사용자 정보를 업데이트합니다."""
         try:
+            user = await self.user_repository.get_user_by_id(current_user.id, use_replica=False)
+            if not user:
+                raise AppError(USERS_ERRORS["NOT_EXIST_USER"])
+            
             if update_dto.profile_name is not None:
                 user.profile_name = update_dto.profile_name
             
@@ -96,6 +209,7 @@ class UserService:
                 user.role = update_dto.role
             
             updated_user = await self.user_repository.update_user(user)
+            principal_cache.invalidate(user.id)
             return UserResponseDto.model_validate(updated_user)
         
         except AppError:
@@ -104,11 +218,16 @@ class UserService:
             logger.error(f"[UpdateUser] Error: {str(e)}")
             raise AppError(USERS_ERRORS["FAILED_UPDATE_USER"])
     
-    async def delete_user(self, user: User) -> dict:
+    async def delete_user(self, current_user: AuthenticatedUser) -> dict:
         """사용자를 삭제합니다."""
         try:
-            await self.user_repository.delete_user(user)
-            logger.info(f"[DeleteUser] Success: {user.email}")
+            # deleted_at만 기록하고, 실제 삭제는 백그라운드 정리 작업(user_purger)이 수행합니다.
+            if not await self.user_repository.soft_delete_user(current_user.id):
+                raise AppError(USERS_ERRORS["NOT_EXIST_USER"])
+            
+            principal_cache.invalidate(current_user.id)
+            count_cache.invalidate(USERS_COUNT_CACHE_KEY)
+            logger.info(f"[DeleteUser] Success: {current_user.email}")
             return {"message": "success"}
         
         except AppError:
@@ -0,0 +1,22 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id) 정렬 키를 불투명한 커서 문자열로 인코딩합니다."""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (created_at, id)로 디코딩합니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        if not isinstance(row_id, int) or isinstance(row_id, bool):
+            raise ValueError
+        return datetime.fromisoformat(created_at), row_id
+    except (ValueError, TypeError, UnicodeDecodeError) as e:
+        raise ValueError("유효하지 않은 커서입니다.") from e
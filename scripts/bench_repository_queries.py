@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+리포지토리 핫 쿼리 Python 오버헤드 벤치마크
+
+매 호출마다 select()/update()를 새로 구성하는 기존 방식과, 모듈 로드 시 한 번 구성해 둔
+문장을 재사용하는 방식의 쿼리당 Python 비용을 비교합니다.
+DB 왕복 시간을 제외하기 위해 인메모리 SQLite에 대해 ORM 세션으로 실행합니다.
+사용자 목록(limit=100)은 ORM 엔티티 + 행별 model_validate와 컬럼 투영 + 일괄 검증도 비교합니다.
+
+사용법:
+  python scripts/bench_repository_queries.py                # 기본 5000회
+  python scripts/bench_repository_queries.py -n 20000       # 반복 횟수 지정
+"""
+
+import sys
+import argparse
+import timeit
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session
+
+from app.core.database.database_manager import Base
+from app.users.models.user import User
+from app.auth.models.jwt_storage import JwtStorage
+from app.users.repositories import user_repository
+from app.users.dto.user_dto import UserResponseDto
+from app.users.services.user_service import USER_LIST_ADAPTER
+from app.auth.repositories import jwt_repository
+
+USER_ID = 1
+EMAIL = "bench@example.com"
+PAGE_SIZE = 100
+
+
+def build_session() -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add(User(id=USER_ID, email=EMAIL, password="hashed", profile_name="bench", role="COMMON"))
+    session.add(JwtStorage(id=1, user_id=USER_ID))
+    for index in range(PAGE_SIZE):
+        session.add(User(email=f"user{index}@example.com", password="x" * 60, profile_name=f"user{index}", role="COMMON"))
+    session.commit()
+    return session
+
+
+def inline_queries(session: Session) -> dict:
+    """기존 방식: 호출마다 문장 구성"""
+    return {
+        "user by id": lambda: session.execute(select(User).where(User.id == USER_ID)).scalar_one_or_none(),
+        "user by email": lambda: session.execute(select(User).where(User.email == EMAIL)).scalar_one_or_none(),
+        "jwt by user id": lambda: session.execute(
+            select(JwtStorage).where(JwtStorage.user_id == USER_ID)
+        ).scalar_one_or_none(),
+        "refresh token update": lambda: session.execute(
+            update(JwtStorage)
+            .where(JwtStorage.user_id == USER_ID)
+            .values(refresh_token=None, refresh_token_fingerprint="f" * 64, refresh_token_expired_at=0)
+            .returning(JwtStorage.id)
+        ).scalar_one_or_none(),
+    }
+
+
+def prebuilt_queries(session: Session) -> dict:
+    """변경 후: 모듈 수준 문장 재사용"""
+    return {
+        "user by id": lambda: session.execute(
+            user_repository._SELECT_USER_BY_ID, {"user_id": USER_ID}
+        ).scalar_one_or_none(),
+        "user by email": lambda: session.execute(
+            user_repository._SELECT_USER_BY_EMAIL, {"email": EMAIL}
+        ).scalar_one_or_none(),
+        "jwt by user id": lambda: session.execute(
+            jwt_repository._SELECT_JWT_STORAGE_BY_USER_ID, {"target_user_id": USER_ID}
+        ).scalar_one_or_none(),
+        "refresh token update": lambda: session.execute(
+            jwt_repository._UPDATE_REFRESH_TOKEN,
+            {"target_user_id": USER_ID, "fingerprint": "f" * 64, "expired_at": 0},
+        ).scalar_one_or_none(),
+    }
+
+
+def list_queries(session: Session) -> dict:
+    """사용자 목록 한 페이지: ORM 엔티티 로드 vs 컬럼 투영"""
+
+    def orm_entities():
+        users = session.execute(
+            select(User).order_by(User.created_at.desc(), User.id.desc()).offset(0).limit(PAGE_SIZE)
+        ).scalars().all()
+        result = [UserResponseDto.model_validate(user) for user in users]
+        session.expunge_all()
+        return result
+
+    def projected_rows():
+        rows = session.execute(user_repository._SELECT_USERS_PAGE, {"skip": 0, "limit": PAGE_SIZE}).all()
+        return USER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+
+    return {"orm + model_validate": orm_entities, "columns + TypeAdapter": projected_rows}
+
+
+def _measure(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리포지토리 핫 쿼리 Python 오버헤드 벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=5000, help="반복 횟수")
+    args = parser.parse_args()
+
+    session = build_session()
+    inline = inline_queries(session)
+    prebuilt = prebuilt_queries(session)
+
+    print(f"🎯 쿼리당 소요 시간 (인메모리 SQLite, x {args.number})")
+    print(f"  {'query':<22} {'inline µs':>10} {'prebuilt µs':>12} {'speedup':>8}")
+    for name in inline:
+        inline_us = _measure(inline[name], args.number)
+        prebuilt_us = _measure(prebuilt[name], args.number)
+        print(f"  {name:<22} {inline_us:10.2f} {prebuilt_us:12.2f} {inline_us / prebuilt_us:7.2f}x")
+
+    listing = list_queries(session)
+    list_number = max(1, args.number // 20)
+    baseline_us = None
+    print(f"🎯 사용자 목록 {PAGE_SIZE}건 조회 + DTO 변환 (x {list_number})")
+    print(f"  {'path':<24} {'µs/page':>10} {'speedup':>8}")
+    for name, func in listing.items():
+        elapsed_us = _measure(func, list_number)
+        baseline_us = baseline_us or elapsed_us
+        print(f"  {name:<24} {elapsed_us:10.2f} {baseline_us / elapsed_us:7.2f}x")
+
+    session.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+JWT 코덱 마이크로벤치마크
+
+python-jose 경로(기존)와 HS256Codec 경로의 로그인/재발급 처리량을 비교합니다.
+
+사용법:
+  python scripts/bench_token_codec.py                # 기본 20000회
+  python scripts/bench_token_codec.py -n 100000      # 반복 횟수 지정
+"""
+
+import sys
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from jose import jwt
+
+from app.core.security import HS256Codec, _parse_expiration_time
+
+ACCESS_SECRET = "bench-access-secret"
+REFRESH_SECRET = "bench-refresh-secret"
+ACCESS_EXPIRATION = "3600s"
+REFRESH_EXPIRATION = "1209600s"
+
+
+def _jose_encode(data: dict, secret: str, expiration: str) -> str:
+    """기존 경로: 매 호출마다 만료 시간 파싱 + python-jose 인코딩"""
+    to_encode = data.copy()
+    expire = datetime.now(timezone.utc) + timedelta(seconds=_parse_expiration_time(expiration))
+    to_encode.update({"exp": expire})
+    return jwt.encode(to_encode, secret, algorithm="HS256")
+
+
+def jose_sign_in():
+    _jose_encode({"id": 1, "profile_name": "bench"}, ACCESS_SECRET, ACCESS_EXPIRATION)
+    refresh_token = _jose_encode({"id": 1}, REFRESH_SECRET, REFRESH_EXPIRATION)
+    jwt.decode(refresh_token, REFRESH_SECRET, algorithms=["HS256"])
+
+
+def jose_refresh(refresh_token: str):
+    jwt.decode(refresh_token, REFRESH_SECRET, algorithms=["HS256"])
+    _jose_encode({"id": 1, "profile_name": "bench"}, ACCESS_SECRET, ACCESS_EXPIRATION)
+
+
+access_codec = HS256Codec(ACCESS_SECRET, _parse_expiration_time(ACCESS_EXPIRATION))
+refresh_codec = HS256Codec(REFRESH_SECRET, _parse_expiration_time(REFRESH_EXPIRATION))
+
+
+def codec_sign_in():
+    access_codec.encode({"id": 1, "profile_name": "bench"})
+    refresh_token = refresh_codec.encode({"id": 1})
+    refresh_codec.decode(refresh_token)
+
+
+def codec_refresh(refresh_token: str):
+    refresh_codec.decode(refresh_token)
+    access_codec.encode({"id": 1, "profile_name": "bench"})
+
+
+def _run(label: str, func, number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=3))
+    ops = number / seconds
+    print(f"  {label:<24} {seconds / number * 1_000_000:8.2f} µs/op  {ops:12,.0f} ops/s")
+    return ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JWT 코덱 마이크로벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=20000, help="반복 횟수")
+    args = parser.parse_args()
+
+    refresh_token = refresh_codec.encode({"id": 1})
+
+    # 두 경로가 같은 토큰을 주고받을 수 있는지 먼저 확인
+    assert jwt.decode(refresh_token, REFRESH_SECRET, algorithms=["HS256"])["id"] == 1
+    assert refresh_codec.decode(_jose_encode({"id": 1}, REFRESH_SECRET, REFRESH_EXPIRATION))["id"] == 1
+
+    print(f"🎯 로그인 (access + refresh 발급, refresh 파싱) x {args.number}")
+    jose_ops = _run("python-jose", jose_sign_in, args.number)
+    codec_ops = _run("HS256Codec", codec_sign_in, args.number)
+    print(f"  ➜ {codec_ops / jose_ops:.1f}x")
+
+    print(f"🎯 재발급 (refresh 검증, access 발급) x {args.number}")
+    jose_ops = _run("python-jose", lambda: jose_refresh(refresh_token), args.number)
+    codec_ops = _run("HS256Codec", lambda: codec_refresh(refresh_token), args.number)
+    print(f"  ➜ {codec_ops / jose_ops:.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+사용자 목록 조회 지연 시간 벤치마크
+
+USERS_LIST_QUERY_MODE(sequential / concurrent / window)별로 UserService.get_users_list를
+반복 호출해 지연 시간을 비교합니다. 설정된 DATABASE_URL의 DB에 대해 실행하므로,
+DB와의 왕복 시간이 클수록(원격 DB) 모드 간 차이가 크게 나타납니다.
+
+사용법:
+  python scripts/bench_users_list.py                       # 기본 200회, 모든 모드
+  python scripts/bench_users_list.py -n 500 --limit 50     # 반복 횟수/페이지 크기 지정
+  python scripts/bench_users_list.py --modes sequential concurrent
+  python scripts/bench_users_list.py --count estimated     # total_count 집계 방식 지정
+"""
+
+import sys
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.core.database.database import AsyncSessionLocal, async_engine
+from app.users.services.user_service import UserService, USERS_LIST_QUERY_MODES
+
+
+async def measure(mode: str, number: int, skip: int, limit: int, count: str) -> list:
+    """지정한 모드로 목록 조회를 number회 실행하고 호출별 소요 시간(ms)을 반환합니다."""
+    settings.users_list_query_mode = mode
+    samples = []
+    for _ in range(number):
+        async with AsyncSessionLocal() as session:
+            started_at = time.perf_counter()
+            await UserService(session).get_users_list(skip, limit, count_strategy=count)
+            samples.append((time.perf_counter() - started_at) * 1000)
+    return sorted(samples)
+
+
+def _percentile(samples: list, ratio: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * ratio))]
+
+
+async def run(args) -> int:
+    # 커넥션 생성 비용이 측정에 섞이지 않도록 워밍업
+    await measure(args.modes[0], 5, args.skip, args.limit, args.count)
+
+    results = {}
+    for mode in args.modes:
+        results[mode] = await measure(mode, args.number, args.skip, args.limit, args.count)
+
+    baseline = _percentile(results[args.modes[0]], 0.50)
+    print(f"🎯 사용자 목록 조회 지연 시간 (skip={args.skip}, limit={args.limit}, count={args.count}, x {args.number})")
+    print(f"  {'mode':<12} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'vs ' + args.modes[0]:>16}")
+    for mode, samples in results.items():
+        p50 = _percentile(samples, 0.50)
+        print(
+            f"  {mode:<12} {p50:8.2f} {_percentile(samples, 0.95):8.2f} {samples[-1]:8.2f} "
+            f"{baseline / p50:15.2f}x"
+        )
+
+    await async_engine.dispose()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 목록 조회 지연 시간 벤치마크")
+    parser.add_argument("-n", "--number", type=int, default=200, help="모드별 반복 횟수")
+    parser.add_argument("--skip", type=int, default=0, help="OFFSET")
+    parser.add_argument("--limit", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--count", default="exact", help="total_count 집계 방식")
+    parser.add_argument("--modes", nargs="+", default=list(USERS_LIST_QUERY_MODES), choices=USERS_LIST_QUERY_MODES)
+    args = parser.parse_args()
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+비밀번호 해시 비용 보정 스크립트
+
+현재 호스트에서 해시 1회에 걸리는 시간을 측정하고, 목표 지연 시간에 맞는
+스킴/라운드를 추천합니다. 출력된 값을 env 파일에 설정하면 다음 로그인부터
+기존 해시가 백그라운드에서 새 정책으로 재해시됩니다.
+
+사용법:
+  python scripts/calibrate_password_hash.py                     # 목표 100ms, 모든 스킴
+  python scripts/calibrate_password_hash.py --target-ms 50      # 목표 지연 시간 지정
+  python scripts/calibrate_password_hash.py --scheme bcrypt     # 특정 스킴만 측정
+"""
+
+import sys
+import argparse
+import os
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from passlib.hash import bcrypt, sha256_crypt
+
+SAMPLE_PASSWORD = "calibration-password-123"
+
+# sha256_crypt: 비용이 라운드에 선형 비례
+SHA256_MIN_ROUNDS = 1000
+SHA256_MAX_ROUNDS = 999_999_999
+SHA256_PROBE_ROUNDS = 50_000
+
+# bcrypt: 비용이 2^rounds에 비례
+BCRYPT_MIN_ROUNDS = 4
+BCRYPT_MAX_ROUNDS = 31
+BCRYPT_PROBE_ROUNDS = 8
+
+
+def measure_ms(handler, samples: int) -> float:
+    """해시 1회의 중앙값 지연 시간(ms)을 측정합니다."""
+    timings = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        handler.hash(SAMPLE_PASSWORD)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def calibrate_sha256_crypt(target_ms: float, samples: int) -> tuple:
+    probe_ms = measure_ms(sha256_crypt.using(rounds=SHA256_PROBE_ROUNDS), samples)
+    rounds = int(SHA256_PROBE_ROUNDS * target_ms / probe_ms)
+    rounds = max(SHA256_MIN_ROUNDS, min(SHA256_MAX_ROUNDS, rounds))
+    return rounds, measure_ms(sha256_crypt.using(rounds=rounds), samples)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int) -> tuple:
+    probe_ms = measure_ms(bcrypt.using(rounds=BCRYPT_PROBE_ROUNDS), samples)
+    rounds = BCRYPT_PROBE_ROUNDS
+    # 목표를 넘지 않는 가장 큰 cost 선택
+    while rounds < BCRYPT_MAX_ROUNDS and probe_ms * 2 ** (rounds + 1 - BCRYPT_PROBE_ROUNDS) <= target_ms:
+        rounds += 1
+    while rounds > BCRYPT_MIN_ROUNDS and probe_ms * 2 ** (rounds - BCRYPT_PROBE_ROUNDS) > target_ms:
+        rounds -= 1
+    return rounds, measure_ms(bcrypt.using(rounds=rounds), samples)
+
+
+CALIBRATORS = {
+    "sha256_crypt": calibrate_sha256_crypt,
+    "bcrypt": calibrate_bcrypt,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비밀번호 해시 비용 보정 스크립트")
+    parser.add_argument(
+        "--target-ms", type=float, default=100.0, help="해시 1회 목표 지연 시간 (ms)"
+    )
+    parser.add_argument(
+        "--scheme",
+        choices=["all", *CALIBRATORS.keys()],
+        default="all",
+        help="측정할 해시 스킴",
+    )
+    parser.add_argument("--samples", type=int, default=5, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    schemes = list(CALIBRATORS.keys()) if args.scheme == "all" else [args.scheme]
+    cpu_count = os.cpu_count() or 1
+
+    print(f"🎯 목표 지연 시간: {args.target_ms:.0f}ms (CPU {cpu_count}개)")
+
+    results = {}
+    for scheme in schemes:
+        rounds, latency_ms = CALIBRATORS[scheme](args.target_ms, args.samples)
+        per_core = 1000 / latency_ms
+        results[scheme] = rounds
+        print(
+            f"  {scheme:<13} rounds={rounds:<10} {latency_ms:8.1f}ms/해시  "
+            f"코어당 {per_core:6.1f}회/s, 전체 {per_core * cpu_count:7.1f}회/s"
+        )
+
+    # bcrypt는 네이티브 구현이라 같은 지연 시간에서 공격자 비용이 더 크므로 우선 추천
+    scheme = "bcrypt" if "bcrypt" in results else schemes[0]
+    rounds = results[scheme]
+    print()
+    print("✅ 추천 설정 (env 파일에 추가):")
+    print(f"  PASSWORD_HASH_SCHEME={scheme}")
+    print(f"  PASSWORD_HASH_ROUNDS={rounds}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
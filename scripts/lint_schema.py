@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+DB 스키마 인덱스 린트
+
+모델 메타데이터(Base.metadata)에서 다음을 찾습니다.
+  - unindexed-fk: 인덱스가 없는 외래 키
+  - duplicate-index: 다른 인덱스/제약과 같은 인덱스
+  - redundant-index: 기본 키/다른 인덱스로 대신할 수 있는 인덱스
+--database를 지정하면 실제 DB와도 비교합니다.
+  - schema-drift: Alembic autogenerate 기준 모델과 DB의 인덱스 차이
+  - unused-index: 통계 초기화 이후 한 번도 사용되지 않은 인덱스 (운영 DB에서 확인)
+
+문제가 있으면 종료 코드 1을 반환하므로 CI에서 사용할 수 있습니다.
+
+사용법:
+  python scripts/lint_schema.py                 # 모델만 검사
+  python scripts/lint_schema.py --database      # 설정된 DB와 비교 (SSH 터널링 설정 시 사용)
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.database.database_manager import db_manager, Base
+from app.core.database.schema_lint import lint_database, lint_metadata
+
+# 모든 모델을 메타데이터에 등록
+from app.users.models.user import User  # noqa: F401
+from app.auth.models.jwt_storage import JwtStorage  # noqa: F401
+from app.core.models.row_count import table_row_counts  # noqa: F401
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 스키마 인덱스 린트")
+    parser.add_argument("--database", action="store_true", help="설정된 DB와 비교 (schema-drift, unused-index)")
+    args = parser.parse_args()
+
+    issues = lint_metadata(Base.metadata)
+
+    if args.database:
+        if not db_manager.initialize_database():
+            print("❌ 데이터베이스 연결에 실패했습니다.")
+            return 2
+        try:
+            with db_manager.engine.connect() as connection:
+                issues.extend(lint_database(connection, Base.metadata))
+        finally:
+            db_manager.cleanup()
+
+    if not issues:
+        print("✅ 스키마 린트 문제가 없습니다.")
+        return 0
+
+    print(f"❌ 스키마 린트 문제 {len(issues)}건")
+    for issue in issues:
+        print(f"  {issue}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+users 행 수 카운터 트리거 설치/제거 (USERS_COUNT_STRATEGY=counter용)
+
+트리거를 설치하면 모든 가입/삭제/수정 문장이 카운터 행 하나를 갱신하므로
+동시 쓰기가 그 행 잠금에서 직렬화됩니다. counter 방식을 쓰는 배포에서만 설치합니다.
+
+사용법:
+  python scripts/users_row_counter.py status    # 설치 여부 확인
+  python scripts/users_row_counter.py enable    # 트리거 설치 및 카운터 초기화 (users 쓰기를 잠시 잠금)
+  python scripts/users_row_counter.py disable   # 트리거 및 카운터 제거
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.database.database_manager import db_manager
+from app.core.database.row_counter import (
+    disable_users_row_counter,
+    enable_users_row_counter,
+    users_row_counter_enabled,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="users 행 수 카운터 트리거 설치/제거")
+    parser.add_argument("command", choices=["status", "enable", "disable"])
+    args = parser.parse_args()
+
+    if not db_manager.initialize_database():
+        print("❌ 데이터베이스 연결에 실패했습니다.")
+        return 2
+    try:
+        with db_manager.engine.begin() as connection:
+            if args.command == "enable":
+                count = enable_users_row_counter(connection)
+                print(f"✅ 카운터 트리거를 설치했습니다. (users: {count})")
+            elif args.command == "disable":
+                disable_users_row_counter(connection)
+                print("✅ 카운터 트리거를 제거했습니다.")
+            else:
+                enabled = users_row_counter_enabled(connection)
+                print(f"카운터 트리거: {'설치됨' if enabled else '없음'}")
+    finally:
+        db_manager.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -195,4 +195,42 @@ class TestAuthRouterHeaders:
                     headers={"Authorization": "Bearer test_token"}
                 )
                 
-                assert response.status_code == 200
\ No newline at end of file
+                assert response.status_code == 200
+
+class TestIntrospectRouter:
+    @pytest.mark.asyncio
+    async def test_introspect_requires_key_when_configured(self, client: AsyncClient):
+        with patch("app.auth.routers.auth_router.settings") as mock_settings:
+            mock_settings.INTROSPECTION_API_KEY = "gateway-key"
+
+            response = await client.post("/api/v1/auth/introspect", json={"tokens": ["a"]})
+            assert response.status_code == 401
+
+            with patch.object(AuthService, "introspect_tokens", AsyncMock(return_value={"results": [{"active": False}]})):
+                response = await client.post(
+                    "/api/v1/auth/introspect",
+                    json={"tokens": ["a"]},
+                    headers={"X-Introspection-Key": "gateway-key"},
+                )
+            assert response.status_code == 200
+            assert response.json()["results"][0]["active"] is False
+
+    @pytest.mark.asyncio
+    async def test_introspect_disabled_without_key(self, client: AsyncClient):
+        with patch("app.auth.routers.auth_router.settings") as mock_settings:
+            mock_settings.INTROSPECTION_API_KEY = None
+
+            with patch.object(AuthService, "introspect_tokens", AsyncMock()) as introspect_tokens:
+                response = await client.post(
+                    "/api/v1/auth/introspect",
+                    json={"tokens": ["a"]},
+                    headers={"X-Introspection-Key": ""},
+                )
+
+        assert response.status_code == 503
+        introspect_tokens.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_introspect_rejects_empty_batch(self, client: AsyncClient):
+        response = await client.post("/api/v1/auth/introspect", json={"tokens": []})
+        assert response.status_code == 422
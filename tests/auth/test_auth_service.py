@@ -0,0 +1,177 @@
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Update
+from sqlalchemy.sql.selectable import Select
+from app.auth.dto.auth import AuthRequest
+from app.auth.services.auth_service import AuthService
+from app.core.errors import AppError, AUTH_ERRORS
+from app.core.principal_cache import AuthenticatedUser, principal_cache
+from app.core.security import create_access_token, create_refresh_token, fingerprint_refresh_token, verify_access_token
+from app.core.token_denylist import TokenDenylist
+from tests.factories import UserFactory
+
+
+def _mock_db(*scalars):
+    """execute() 호출마다 주어진 값을 scalar_one_or_none()으로 돌려주는 세션"""
+    results = []
+    for value in scalars:
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = value
+        results.append(result)
+
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=results)
+    db.commit = AsyncMock()
+    return db
+
+
+def _statements(db):
+    return [call.args[0] for call in db.execute.await_args_list]
+
+
+def _user(user_id=1, jwt_storage=None):
+    user = MagicMock()
+    user.id = user_id
+    user.profile_name = "tester"
+    user.password = "hashed"
+    user.jwt_storage = jwt_storage
+    return user
+
+
+class TestAuthServiceStatementCount:
+    """인증 흐름별 DB 왕복 횟수"""
+
+    @pytest.mark.asyncio
+    async def test_login_uses_select_and_update_returning(self):
+        db = _mock_db(_user(), 1)
+
+        with patch("app.auth.services.auth_service.verify_password_async", AsyncMock(return_value=True)), \
+                patch("app.auth.services.auth_service.needs_rehash", return_value=False):
+            response = await AuthService(db).login(AuthRequest(email="test@example.com", password="password123"))
+
+        statements = _statements(db)
+        assert len(statements) == 2
+        assert isinstance(statements[0], Select)
+        assert isinstance(statements[1], Update)
+        assert statements[1]._returning
+        assert response.refresh_token
+
+    @pytest.mark.asyncio
+    async def test_login_without_jwt_storage(self):
+        db = _mock_db(_user(), None)
+
+        with patch("app.auth.services.auth_service.verify_password_async", AsyncMock(return_value=True)), \
+                patch("app.auth.services.auth_service.needs_rehash", return_value=False):
+            with pytest.raises(AppError) as exc_info:
+                await AuthService(db).login(AuthRequest(email="test@example.com", password="password123"))
+
+        assert exc_info.value.error_code == AUTH_ERRORS["NOT_EXIST_JWT_STORAGE"]["errorCode"]
+        assert db.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_single_joined_select(self):
+        refresh_token = create_refresh_token({"id": 1})
+        jwt_storage = MagicMock(refresh_token_fingerprint=fingerprint_refresh_token(refresh_token))
+        db = _mock_db(_user(jwt_storage=jwt_storage))
+
+        response = await AuthService(db).refresh_access_token(refresh_token)
+
+        statements = _statements(db)
+        assert len(statements) == 1
+        assert "JOIN jwt_storage" in str(statements[0])
+        assert response.access_token
+
+    @pytest.mark.asyncio
+    async def test_logout_uses_single_update_returning(self):
+        db = _mock_db(1)
+        user = AuthenticatedUser(id=1, email="test@example.com", profile_name="tester", role="COMMON", is_active=True)
+
+        await AuthService(db).logout(user)
+
+        statements = _statements(db)
+        assert len(statements) == 1
+        assert isinstance(statements[0], Update)
+        assert statements[0]._returning
+
+    @pytest.mark.asyncio
+    async def test_logout_without_jwt_storage(self):
+        db = _mock_db(None)
+        user = AuthenticatedUser(id=1, email="test@example.com", profile_name="tester", role="COMMON", is_active=True)
+
+        with pytest.raises(AppError) as exc_info:
+            await AuthService(db).logout(user)
+
+        assert exc_info.value.error_code == AUTH_ERRORS["NOT_EXIST_JWT_STORAGE"]["errorCode"]
+
+    @pytest.mark.asyncio
+    async def test_logout_revokes_access_token(self):
+        db = _mock_db(1)
+        user = AuthenticatedUser(id=1, email="test@example.com", profile_name="tester", role="COMMON", is_active=True)
+        denylist = TokenDenylist()
+        exp = time.time() + 300
+
+        with patch("app.auth.services.auth_service.token_denylist", denylist):
+            await AuthService(db).logout(user, {"id": 1, "jti": "jti-1", "exp": exp})
+
+        assert denylist.is_revoked("jti-1", exp)
+        assert db.execute.await_count == 1
+
+
+class TestIntrospectTokens:
+    """토큰 일괄 검사"""
+
+    def _db_returning_users(self, users):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = users
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        return db
+
+    @pytest.mark.asyncio
+    async def test_resolves_users_with_single_query(self):
+        principal_cache.clear()
+        users = [UserFactory(id=1), UserFactory(id=2)]
+        db = self._db_returning_users(users)
+        tokens = [
+            create_access_token({"id": 1}),
+            create_access_token({"id": 2}),
+            create_access_token({"id": 1}),
+            "invalid-token",
+        ]
+
+        response = await AuthService(db).introspect_tokens(tokens)
+
+        assert [result.active for result in response.results] == [True, True, True, False]
+        assert [result.id for result in response.results[:3]] == [1, 2, 1]
+        assert db.execute.await_count == 1
+        assert "= ANY" in str(_statements(db)[0].compile(dialect=postgresql.dialect()))
+        principal_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_unknown_and_revoked_tokens_are_inactive(self):
+        principal_cache.clear()
+        db = self._db_returning_users([])
+        revoked = create_access_token({"id": 3})
+        payload = verify_access_token(revoked)
+        denylist = TokenDenylist()
+        await denylist.revoke(payload["jti"], payload["exp"])
+
+        with patch("app.auth.services.auth_service.token_denylist", denylist):
+            response = await AuthService(db).introspect_tokens([create_access_token({"id": 99}), revoked])
+
+        assert [result.active for result in response.results] == [False, False]
+        principal_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_cached_users_skip_database(self):
+        principal_cache.clear()
+        principal_cache.put(AuthenticatedUser.from_user(UserFactory(id=5)))
+        db = self._db_returning_users([])
+
+        response = await AuthService(db).introspect_tokens([create_access_token({"id": 5})])
+
+        assert response.results[0].active
+        db.execute.assert_not_awaited()
+        principal_cache.clear()
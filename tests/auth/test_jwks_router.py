@@ -0,0 +1,22 @@
+import pytest
+from httpx import AsyncClient
+
+
+class TestJwksRouter:
+    @pytest.mark.asyncio
+    async def test_get_jwks(self, client: AsyncClient):
+        response = await client.get("/.well-known/jwks.json")
+
+        assert response.status_code == 200
+        assert "keys" in response.json()
+        assert "max-age=" in response.headers["cache-control"]
+        assert response.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_get_jwks_not_modified(self, client: AsyncClient):
+        etag = (await client.get("/.well-known/jwks.json")).headers["etag"]
+
+        response = await client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
@@ -12,6 +12,7 @@ class TestSettingsInitialization:
         assert settings.aws_region == "ap-northeast-2"
         assert settings.ssh_remote_port == 5432
         assert settings.ssh_local_port == 5432
+        assert settings.users_list_query_mode == "sequential"
 
     def test_settings_with_env_vars(self):
         with patch.dict(os.environ, {
@@ -72,6 +73,39 @@ class TestRedisUrlGeneration:
         with pytest.raises(ValueError, match="REDIS_URL이 설정되지 않았습니다."):
             _ = settings.REDIS_URL
 
+class TestRefreshTokenHmacSecret:
+    def test_dedicated_secret(self):
+        settings = Settings(jwt_refresh_token_hmac_secret="hmac_secret", jwt_refresh_secret="refresh_secret")
+        assert settings.JWT_REFRESH_TOKEN_HMAC_SECRET == "hmac_secret"
+
+    def test_falls_back_to_refresh_secret(self):
+        settings = Settings(jwt_refresh_token_hmac_secret=None, jwt_refresh_secret="refresh_secret")
+        assert settings.JWT_REFRESH_TOKEN_HMAC_SECRET == "refresh_secret"
+
+    def test_not_set(self):
+        settings = Settings(jwt_refresh_token_hmac_secret=None, jwt_refresh_secret=None)
+        with pytest.raises(ValueError, match="JWT_REFRESH_TOKEN_HMAC_SECRET이 설정되지 않았습니다."):
+            _ = settings.JWT_REFRESH_TOKEN_HMAC_SECRET
+
+class TestQueryBudgets:
+    def test_query_budgets_parsing(self):
+        settings = Settings(db_query_budgets="GET  /api/v1/users/=3, GET /api/v1/users/{user_id}=2,")
+        assert settings.DB_QUERY_BUDGETS == {"GET /api/v1/users/": 3, "GET /api/v1/users/{user_id}": 2}
+
+    def test_query_budgets_not_set(self):
+        assert Settings().DB_QUERY_BUDGETS == {}
+
+class TestDbInstrumentation:
+    @pytest.mark.parametrize("environment,mode", [("local", "warn"), ("test", "warn"), ("staging", "off"), ("prod", "off")])
+    def test_mode_defaults_by_environment(self, environment, mode):
+        assert Settings(environment=environment, db_instrumentation_mode=None).DB_INSTRUMENTATION_MODE == mode
+
+    def test_explicit_mode(self):
+        assert Settings(environment="prod", db_instrumentation_mode="warn").DB_INSTRUMENTATION_MODE == "warn"
+
+    def test_server_timing_header_off_by_default(self):
+        assert Settings().DB_SERVER_TIMING_HEADER is False
+
 class TestSshConfiguration:
     def test_ssh_remote_host_from_database_url(self):
         settings = Settings(
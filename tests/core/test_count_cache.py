@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from app.core.count_cache import CountCache
+
+
+class TestCountCache:
+    """집계 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self):
+        cache = CountCache(ttl_seconds=30)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(cache.get_or_load("users", loader) for _ in range(10)))
+
+        assert results == [42] * 10
+        assert calls == 1
+        assert cache.get_stats()["loads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reloads_after_ttl(self):
+        cache = CountCache(ttl_seconds=30)
+        values = iter([1, 2])
+
+        async def loader():
+            return next(values)
+
+        with patch("app.core.count_cache.time.monotonic", return_value=100.0):
+            assert await cache.get_or_load("users", loader) == 1
+            assert await cache.get_or_load("users", loader) == 1
+        with patch("app.core.count_cache.time.monotonic", return_value=131.0):
+            assert await cache.get_or_load("users", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        cache = CountCache(ttl_seconds=30)
+        values = iter([1, 2])
+
+        async def loader():
+            return next(values)
+
+        await cache.get_or_load("users", loader)
+        cache.invalidate("users")
+
+        assert await cache.get_or_load("users", loader) == 2
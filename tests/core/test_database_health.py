@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, patch
+from app.core.database.health import DatabaseHealthProbe
+
+
+def _probe(**kwargs):
+    options = {"interval_seconds": 5, "timeout_seconds": 0.05, "max_staleness_seconds": 15}
+    options.update(kwargs)
+    return DatabaseHealthProbe(**options)
+
+
+class TestDatabaseHealthProbe:
+    def test_not_ready_before_first_probe(self):
+        probe = _probe()
+
+        status = probe.get_status()
+
+        assert status["status"] == "starting"
+        assert status["ready"] is False
+        assert "saturated" in status["pool"]
+
+    @pytest.mark.asyncio
+    async def test_probe_success(self):
+        probe = _probe()
+
+        with patch.object(probe, "_ping", AsyncMock()):
+            result = await probe.probe_once()
+
+        assert result["status"] == "connected"
+        assert result["latency_ms"] >= 0
+        assert probe.is_ready()
+
+    @pytest.mark.asyncio
+    async def test_probe_failure_and_timeout(self):
+        probe = _probe()
+
+        with patch.object(probe, "_ping", AsyncMock(side_effect=ConnectionRefusedError("refused"))):
+            await probe.probe_once()
+        assert probe.get_status()["status"] == "error"
+
+        async def slow_ping():
+            await asyncio.sleep(1)
+
+        with patch.object(probe, "_ping", slow_ping):
+            await probe.probe_once()
+
+        status = probe.get_status()
+        assert status["ready"] is False
+        assert status["consecutive_failures"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_result_is_not_ready(self):
+        probe = _probe(max_staleness_seconds=0)
+
+        with patch.object(probe, "_ping", AsyncMock()):
+            await probe.probe_once()
+
+        with patch("app.core.database.health.time.time", return_value=probe._checked_at + 1):
+            assert probe.is_ready() is False
+
+    @pytest.mark.asyncio
+    async def test_background_loop(self):
+        probe = _probe(interval_seconds=0.01)
+        ping = AsyncMock()
+
+        with patch.object(probe, "_ping", ping):
+            probe.start()
+            await asyncio.sleep(0.05)
+            await probe.stop()
+
+        assert ping.await_count >= 2
+
+
+class TestHealthCheckEndpoints:
+    @pytest.mark.asyncio
+    async def test_liveness(self, client: AsyncClient):
+        response = await client.get("/health-check/live")
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_readiness_reflects_probe(self, client: AsyncClient):
+        probe = _probe()
+
+        with patch("app.main.database_health_probe", probe):
+            response = await client.get("/health-check/ready")
+            assert response.status_code == 503
+
+            with patch.object(probe, "_ping", AsyncMock()):
+                await probe.probe_once()
+            response = await client.get("/health-check/ready")
+            assert response.status_code == 200
+            assert response.json()["status"] == "connected"
@@ -0,0 +1,130 @@
+import asyncio
+import time
+import pytest
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, patch
+from app.core import security
+from app.core.errors import AppError
+from app.core.password_hasher import PasswordHasher, PasswordHasherBusy
+from app.core.security import hash_password, verify_password
+
+
+class TestPasswordHasher:
+    @pytest.mark.asyncio
+    async def test_process_pool_hash_and_verify(self):
+        hasher = PasswordHasher(max_workers=1, max_concurrency=1, max_queue=4)
+        try:
+            hashed = await hasher.run(hash_password, "test_password")
+            assert await hasher.run(verify_password, "test_password", hashed) is True
+            assert await hasher.run(verify_password, "wrong_password", hashed) is False
+        finally:
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self):
+        hasher = PasswordHasher(max_workers=0, max_concurrency=1, max_queue=0)
+        try:
+            running = asyncio.create_task(hasher.run(time.sleep, 0.2))
+            await asyncio.sleep(0.01)
+
+            with pytest.raises(PasswordHasherBusy):
+                await hasher.run(time.sleep, 0)
+
+            await running
+            stats = hasher.get_stats()
+            assert stats["rejected"] == 1
+            assert stats["completed"] == 1
+        finally:
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_metrics(self):
+        hasher = PasswordHasher(max_workers=0, max_concurrency=1, max_queue=2)
+        try:
+            tasks = [asyncio.create_task(hasher.run(time.sleep, 0.05)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            stats = hasher.get_stats()
+            assert stats["in_flight"] == 1
+            assert stats["queue_depth"] == 2
+
+            await asyncio.gather(*tasks)
+            stats = hasher.get_stats()
+            assert stats["queue_depth"] == 0
+            assert stats["max_queue_depth"] == 2
+            assert stats["completed"] == 3
+        finally:
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint(self, client: AsyncClient):
+        hasher = PasswordHasher(max_workers=0, max_concurrency=2, max_queue=3)
+
+        with patch("app.main.password_hasher", hasher):
+            response = await client.get("/health-check/auth")
+
+        assert response.status_code == 200
+        stats = response.json()["password_hasher"]
+        assert stats["max_queue"] == 3
+        assert stats["queue_depth"] == 0
+
+
+class TestHashPasswordsAsync:
+    @pytest.mark.asyncio
+    async def test_slices_and_keeps_order(self):
+        hasher = PasswordHasher(max_workers=0, max_concurrency=2, max_queue=0)
+        hasher.run = AsyncMock(side_effect=lambda func, chunk: [f"h:{p}" for p in chunk])
+        passwords = [f"pw{index}" for index in range(7)]
+
+        hashed = await security.hash_passwords_async(passwords, hasher=hasher, slice_size=2)
+
+        assert hashed == [f"h:{p}" for p in passwords]
+        assert hasher.run.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_submits_at_most_concurrency_slices(self):
+        hasher = PasswordHasher(max_workers=0, max_concurrency=2, max_queue=0)
+        try:
+            with patch.object(security, "hash_passwords", lambda chunk: time.sleep(0.02) or list(chunk)):
+                task = asyncio.create_task(
+                    security.hash_passwords_async([f"pw{index}" for index in range(10)], hasher=hasher, slice_size=1)
+                )
+                await asyncio.sleep(0.01)
+                stats = hasher.get_stats()
+                assert stats["in_flight"] == 2
+                assert stats["queue_depth"] == 0
+
+                assert len(await task) == 10
+            assert hasher.get_stats()["rejected"] == 0
+        finally:
+            hasher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_stops_remaining_slices_on_failure(self):
+        hasher = PasswordHasher(max_workers=0, max_concurrency=1, max_queue=0)
+        hasher.run = AsyncMock(side_effect=PasswordHasherBusy())
+
+        with pytest.raises(AppError):
+            await security.hash_passwords_async([f"pw{index}" for index in range(5)], hasher=hasher, slice_size=1)
+
+        assert hasher.run.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sign_in_hashing_during_import(self):
+        interactive = PasswordHasher(max_workers=0, max_concurrency=1, max_queue=0)
+        bulk = PasswordHasher(max_workers=0, max_concurrency=1, max_queue=0)
+        try:
+            with patch.object(security, "password_hasher", interactive), \
+                    patch.object(security, "bulk_password_hasher", bulk), \
+                    patch.object(security, "hash_passwords", lambda chunk: time.sleep(0.05) or list(chunk)):
+                importing = asyncio.create_task(security.hash_passwords_async(["a", "b", "c"], slice_size=1))
+                await asyncio.sleep(0.01)
+                assert bulk.get_stats()["in_flight"] == 1
+
+                hashed = await security.hash_password_async("sign_in_password")
+                assert verify_password("sign_in_password", hashed) is True
+
+                assert await importing == ["a", "b", "c"]
+            assert interactive.get_stats()["rejected"] == 0
+        finally:
+            interactive.shutdown()
+            bulk.shutdown()
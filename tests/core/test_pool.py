@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+from app.core.database.pool import (
+    PoolStats,
+    instrumented_pool_class,
+    pool_status,
+    psycopg2_connect_args,
+    asyncpg_connect_args,
+)
+
+
+def _pool(stats, **kwargs):
+    pool_class = instrumented_pool_class(QueuePool, stats)
+    return pool_class(MagicMock, **kwargs)
+
+
+class TestInstrumentedPool:
+    def test_records_checkouts(self):
+        stats = PoolStats("test")
+        pool = _pool(stats, pool_size=2, max_overflow=0)
+
+        first = pool.connect()
+        second = pool.connect()
+
+        snapshot = stats.snapshot()
+        assert snapshot["checkouts"] == 2
+        assert snapshot["timeouts"] == 0
+        assert pool.checkedout() == 2
+        first.close()
+        second.close()
+
+    def test_records_timeouts(self):
+        stats = PoolStats("test")
+        pool = _pool(stats, pool_size=1, max_overflow=0, timeout=0.01)
+
+        connection = pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+
+        snapshot = stats.snapshot()
+        assert snapshot["timeouts"] == 1
+        assert snapshot["wait_ms"]["max"] >= 10
+        connection.close()
+
+    def test_stats_survive_recreate(self):
+        stats = PoolStats("test")
+        pool = _pool(stats, pool_size=1, max_overflow=0)
+        pool.connect().close()
+
+        recreated = pool.recreate()
+        recreated.connect().close()
+
+        assert stats.snapshot()["checkouts"] == 2
+
+    def test_pool_status(self):
+        stats = PoolStats("test")
+        engine = MagicMock()
+        engine.pool = _pool(stats, pool_size=2, max_overflow=3)
+        connection = engine.pool.connect()
+
+        status = pool_status(engine, stats)
+
+        assert status["size"] == 2
+        assert status["max_overflow"] == 3
+        assert status["checked_out"] == 1
+        assert status["utilization"] == 0.2
+        assert pool_status(None, stats)["initialized"] is False
+        connection.close()
+
+
+class TestConnectArgs:
+    def test_jit_off(self):
+        with patch("app.core.database.pool.settings") as mock_settings:
+            mock_settings.DB_APPLICATION_NAME = "api"
+            mock_settings.DB_JIT = False
+            mock_settings.DB_PREPARED_STATEMENT_CACHE_SIZE = 0
+            mock_settings.DB_STATEMENT_CACHE_SIZE = 0
+
+            assert asyncpg_connect_args() == {
+                "server_settings": {"application_name": "api", "jit": "off"},
+                "prepared_statement_cache_size": 0,
+                "statement_cache_size": 0,
+            }
+            assert psycopg2_connect_args() == {"application_name": "api", "options": "-c jit=off"}
+
+    def test_jit_default(self):
+        with patch("app.core.database.pool.settings") as mock_settings:
+            mock_settings.DB_APPLICATION_NAME = "api"
+            mock_settings.DB_JIT = None
+
+            assert psycopg2_connect_args() == {"application_name": "api"}
@@ -0,0 +1,80 @@
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.security import HTTPAuthorizationCredentials
+from app.core.dependencies import get_current_user, get_access_token_payload
+from app.core.principal_cache import AuthenticatedUser, PrincipalCache, principal_cache
+from app.core.security import create_access_token
+from app.users.repositories.user_repository import UserRepository
+from tests.factories import UserFactory
+
+
+def _principal(user_id: int = 1) -> AuthenticatedUser:
+    return AuthenticatedUser(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        profile_name="Test User",
+        role="COMMON",
+        is_active=True,
+    )
+
+
+class TestPrincipalCache:
+    def test_put_and_get(self):
+        cache = PrincipalCache(enabled=True, ttl_seconds=30, max_size=10)
+        cache.put(_principal(1))
+        assert cache.get(1) == _principal(1)
+        assert cache.hits == 1
+
+    def test_ttl_expiry(self):
+        cache = PrincipalCache(enabled=True, ttl_seconds=30, max_size=10)
+        cache.put(_principal(1))
+        with patch("app.core.principal_cache.time.monotonic", return_value=time.monotonic() + 60):
+            assert cache.get(1) is None
+
+    def test_invalidate(self):
+        cache = PrincipalCache(enabled=True, ttl_seconds=30, max_size=10)
+        cache.put(_principal(1))
+        cache.invalidate(1)
+        assert cache.get(1) is None
+        assert cache.invalidations == 1
+
+    def test_lru_eviction(self):
+        cache = PrincipalCache(enabled=True, ttl_seconds=30, max_size=2)
+        cache.put(_principal(1))
+        cache.put(_principal(2))
+        cache.get(1)
+        cache.put(_principal(3))
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+
+    def test_disabled(self):
+        cache = PrincipalCache(enabled=False, ttl_seconds=30, max_size=10)
+        cache.put(_principal(1))
+        assert cache.get(1) is None
+
+    def test_snapshot_from_user(self):
+        user = UserFactory(id=7)
+        principal = AuthenticatedUser.from_user(user)
+        assert principal.id == 7
+        assert principal.email == user.email
+        assert not hasattr(principal, "password")
+
+
+class TestGetCurrentUserCache:
+    @pytest.mark.asyncio
+    async def test_second_call_skips_database(self):
+        principal_cache.clear()
+        user = UserFactory(id=42)
+        token = create_access_token({"id": 42})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        payload = await get_access_token_payload(credentials)
+
+        with patch.object(UserRepository, "get_user_by_id", AsyncMock(return_value=user)) as mock_get:
+            first = await get_current_user(payload, AsyncMock())
+            second = await get_current_user(payload, AsyncMock())
+
+        assert first == second
+        assert first.id == 42
+        mock_get.assert_awaited_once_with(42)
+        principal_cache.clear()
@@ -0,0 +1,198 @@
+import pytest
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.orm import Session
+from app.core.database.query_stats import (
+    QueryGuard,
+    QueryGuardError,
+    QueryStats,
+    QueryStatsMiddleware,
+    current_query_stats,
+    track_queries,
+)
+from app.auth.models.jwt_storage import JwtStorage
+from app.users.models.user import User
+
+
+def _guard(mode="warn", **kwargs):
+    options = {"slow_query_seconds": 10.0, "n_plus_one_threshold": 3}
+    options.update(kwargs)
+    return QueryGuard(mode=mode, **options)
+
+
+def _engine(guard):
+    engine = create_engine("sqlite://")
+    guard.instrument_engine(engine)
+    return engine
+
+
+def _session_class(guard):
+    class GuardedSession(Session):
+        pass
+
+    guard.instrument_session(GuardedSession)
+    return GuardedSession
+
+
+class TestQueryStats:
+    def test_record_keeps_slowest(self):
+        stats = QueryStats(slowest_size=2)
+        for seconds, statement in [(0.1, "a"), (0.3, "b"), (0.2, "c"), (0.05, "a")]:
+            stats.record(statement, seconds)
+
+        assert stats.count == 4
+        assert stats.total_seconds == pytest.approx(0.65)
+        assert stats.slowest == [(0.3, "b"), (0.2, "c")]
+        assert stats.repeated(2) == [("a", 2)]
+
+    def test_track_queries_counts_statements(self):
+        guard = _guard()
+        engine = _engine(guard)
+
+        with track_queries() as stats:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 3"))
+
+        assert stats.count == 2
+        assert current_query_stats() is None
+
+    def test_off_mode_does_not_record(self):
+        guard = _guard(mode="off")
+        engine = _engine(guard)
+
+        with track_queries() as stats:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        assert stats.count == 0
+
+    def test_off_mode_registers_no_listeners(self):
+        guard = _guard(mode="off")
+        engine = _engine(guard)
+        session_class = _session_class(guard)
+
+        assert not event.contains(engine, "before_cursor_execute", guard._before_cursor_execute)
+        assert not event.contains(engine, "after_cursor_execute", guard._after_cursor_execute)
+        assert not event.contains(session_class, "do_orm_execute", guard._do_orm_execute)
+
+
+class TestQueryGuardCheck:
+    def _repeated_stats(self, times):
+        stats = QueryStats()
+        for user_id in range(times):
+            stats.record("SELECT * FROM jwt_storage WHERE user_id = ?", 0.001)
+        return stats
+
+    def test_n_plus_one_warns(self):
+        guard = _guard()
+
+        problems = guard.check(self._repeated_stats(3), "GET /api/v1/users/")
+
+        assert len(problems) == 1 and problems[0].startswith("N+1 suspected, 3x")
+        assert guard.get_stats()["n_plus_one"] == 1
+
+    def test_n_plus_one_raises(self):
+        with pytest.raises(QueryGuardError, match="N\\+1"):
+            _guard(mode="raise").check(self._repeated_stats(3), "GET /api/v1/users/")
+
+    def test_route_budget(self):
+        guard = _guard(n_plus_one_threshold=0, default_budget=10, budgets={"GET /api/v1/users/{user_id}": 1})
+        stats = self._repeated_stats(2)
+
+        assert guard.check(stats, "GET /api/v1/users/") == []
+        assert guard.check(stats, "GET /api/v1/users/{user_id}") == ["2 queries exceed budget of 1"]
+        assert guard.get_stats()["budget_exceeded"] == 1
+
+
+class TestLazyLoadDetection:
+    @pytest.fixture
+    def setup(self):
+        guard = _guard()
+        engine = _engine(guard)
+        User.metadata.create_all(engine, tables=[User.__table__, JwtStorage.__table__])
+        with Session(engine) as session:
+            user = User(email="lazy@example.com", password="x", profile_name="lazy")
+            user.jwt_storage = JwtStorage()
+            session.add(user)
+            session.commit()
+        return guard, engine, _session_class(guard)
+
+    def test_lazy_load_is_reported(self, setup):
+        guard, engine, session_class = setup
+
+        with track_queries() as stats, session_class(engine) as session:
+            user = session.scalars(select(User)).one()
+            assert user.jwt_storage is not None
+
+        assert stats.lazy_loads == ["User.jwt_storage"]
+        assert guard.check(stats, "GET /api/v1/users/{user_id}") == ["lazy load of User.jwt_storage"]
+
+    def test_lazy_load_raises(self, setup):
+        guard, engine, session_class = setup
+        guard.mode = "raise"
+
+        with session_class(engine) as session:
+            user = session.scalars(select(User)).one()
+            with pytest.raises(QueryGuardError, match="User.jwt_storage"):
+                user.jwt_storage
+
+
+class TestQueryStatsMiddleware:
+    async def _call(self, guard, inner, scope=None):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = scope or {"type": "http", "method": "GET", "path": "/api/v1/users/1"}
+        await QueryStatsMiddleware(inner, guard=guard)(scope, None, send)
+        return messages
+
+    @pytest.mark.asyncio
+    async def test_server_timing_header(self):
+        guard = _guard(server_timing=True)
+        engine = _engine(guard)
+
+        async def inner(scope, receive, send):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        messages = await self._call(guard, inner)
+
+        headers = dict(messages[0]["headers"])
+        assert headers[b"server-timing"].startswith(b"db;dur=")
+        assert headers[b"server-timing"].endswith(b'desc="1 queries"')
+        assert guard.get_stats()["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_server_timing_header_by_default(self):
+        guard = _guard()
+
+        async def inner(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        messages = await self._call(guard, inner)
+
+        assert messages[0]["headers"] == []
+        assert guard.get_stats()["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_exceeded_raises_after_response(self):
+        guard = _guard(mode="raise", budgets={"GET /api/v1/users/{user_id}": 1})
+        engine = _engine(guard)
+
+        class Route:
+            path = "/api/v1/users/{user_id}"
+
+        async def inner(scope, receive, send):
+            scope["route"] = Route()
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        with pytest.raises(QueryGuardError, match="exceed budget of 1"):
+            await self._call(guard, inner)
@@ -0,0 +1,188 @@
+import time
+import pytest
+from types import SimpleNamespace
+from httpx import AsyncClient
+from starlette.datastructures import Headers
+from unittest.mock import patch
+from app.auth.services.login_throttle import LoginThrottle
+from app.core.errors import AppError
+from app.core.rate_limit import MemoryRateLimitBackend, RedisRateLimitBackend, SLIDING_WINDOW, TOKEN_BUCKET
+
+
+class TestMemorySlidingWindow:
+    @pytest.mark.asyncio
+    async def test_allows_up_to_limit(self):
+        backend = MemoryRateLimitBackend()
+        results = [await backend.hit("key", 3, 60, SLIDING_WINDOW) for _ in range(4)]
+        assert results == [True, True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_window_slides(self):
+        backend = MemoryRateLimitBackend()
+        with patch("app.core.rate_limit.time.monotonic", return_value=1000.0):
+            assert await backend.hit("key", 1, 60, SLIDING_WINDOW) is True
+            assert await backend.hit("key", 1, 60, SLIDING_WINDOW) is False
+        with patch("app.core.rate_limit.time.monotonic", return_value=1061.0):
+            assert await backend.hit("key", 1, 60, SLIDING_WINDOW) is True
+
+    @pytest.mark.asyncio
+    async def test_max_keys(self):
+        backend = MemoryRateLimitBackend(max_keys=2)
+        for key in ("a", "b", "c"):
+            await backend.hit(key, 1, 60, SLIDING_WINDOW)
+        assert await backend.hit("a", 1, 60, SLIDING_WINDOW) is True
+
+
+class TestMemoryTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_then_refill(self):
+        backend = MemoryRateLimitBackend()
+        with patch("app.core.rate_limit.time.monotonic", return_value=1000.0):
+            results = [await backend.hit("key", 2, 60, TOKEN_BUCKET) for _ in range(3)]
+        assert results == [True, True, False]
+
+        # 30초마다 토큰 1개 충전 (2개 / 60초)
+        with patch("app.core.rate_limit.time.monotonic", return_value=1030.0):
+            assert await backend.hit("key", 2, 60, TOKEN_BUCKET) is True
+            assert await backend.hit("key", 2, 60, TOKEN_BUCKET) is False
+
+
+class TestRedisRateLimitBackend:
+    """Lua 스크립트를 fakeredis(lupa)로 실행해 검증합니다."""
+
+    @pytest.fixture
+    def redis_client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        return fakeredis.aioredis.FakeRedis()
+
+    @pytest.fixture
+    def backend(self, redis_client):
+        with patch("app.core.rate_limit.aioredis.from_url", return_value=redis_client):
+            return RedisRateLimitBackend("redis://localhost:6379")
+
+    @pytest.mark.asyncio
+    async def test_sliding_window(self, backend, redis_client):
+        # fakeredis도 time.time으로 키 만료를 판단하므로 현재 시각을 기준으로 고정
+        now = time.time()
+        redis_key = "rate_limit:sliding_window:key"
+        with patch("app.core.rate_limit.time.time", return_value=now):
+            results = [await backend.hit("key", 3, 60, SLIDING_WINDOW) for _ in range(4)]
+            assert results == [True, True, True, False]
+
+            # 거절된 시도는 기록하지 않고, 키는 window 동안만 유지
+            assert await redis_client.zcard(redis_key) == 3
+            assert 0 < await redis_client.pttl(redis_key) <= 60_000
+
+        with patch("app.core.rate_limit.time.time", return_value=now + 30):
+            assert await backend.hit("key", 3, 60, SLIDING_WINDOW) is False
+        with patch("app.core.rate_limit.time.time", return_value=now + 59):
+            await redis_client.zadd(redis_key, {"old": now - 1})
+            assert await backend.hit("key", 3, 60, SLIDING_WINDOW) is False
+            # window 밖의 기록은 스크립트가 정리
+            assert await redis_client.zscore(redis_key, "old") is None
+
+    @pytest.mark.asyncio
+    async def test_token_bucket(self, backend, redis_client):
+        now = time.time()
+        redis_key = "rate_limit:token_bucket:key"
+        with patch("app.core.rate_limit.time.time", return_value=now):
+            results = [await backend.hit("key", 2, 60, TOKEN_BUCKET) for _ in range(3)]
+            assert results == [True, True, False]
+
+            state = await redis_client.hgetall(redis_key)
+            assert float(state[b"tokens"]) == pytest.approx(0, abs=1e-3)
+            assert float(state[b"ts"]) == pytest.approx(now)
+            # 버킷이 가득 찰 때까지(capacity / rate = window)만 유지
+            assert 0 < await redis_client.pttl(redis_key) <= 60_000
+
+        # 30초마다 토큰 1개 충전 (2개 / 60초, 스크립트가 시각을 유효 숫자 14자리로 저장하므로 여유를 둠)
+        with patch("app.core.rate_limit.time.time", return_value=now + 31):
+            assert await backend.hit("key", 2, 60, TOKEN_BUCKET) is True
+            assert await backend.hit("key", 2, 60, TOKEN_BUCKET) is False
+
+    @pytest.mark.asyncio
+    async def test_keys_are_independent(self, backend):
+        assert await backend.hit("a", 1, 60, SLIDING_WINDOW) is True
+        assert await backend.hit("b", 1, 60, SLIDING_WINDOW) is True
+        assert await backend.hit("a", 1, 60, SLIDING_WINDOW) is False
+
+
+def _request(host, forwarded_for=None):
+    headers = {"x-forwarded-for": forwarded_for} if forwarded_for else {}
+    return SimpleNamespace(client=SimpleNamespace(host=host), headers=Headers(headers))
+
+
+class TestLoginThrottleClientIp:
+    def test_direct_connection_ignores_forwarded_header(self):
+        throttle = LoginThrottle(MemoryRateLimitBackend(), SLIDING_WINDOW, ip_limit=1, email_limit=1, window_seconds=60)
+
+        assert throttle.client_ip(_request("203.0.113.7", "198.51.100.1")) == "203.0.113.7"
+
+    def test_trusted_proxy_uses_forwarded_client(self):
+        throttle = LoginThrottle(
+            MemoryRateLimitBackend(), SLIDING_WINDOW, ip_limit=1, email_limit=1, window_seconds=60,
+            trusted_proxies=["10.0.0.0/8"],
+        )
+
+        # 클라이언트가 넣은 왼쪽 값은 무시하고, 신뢰하는 프록시 직전 주소를 사용
+        request = _request("10.0.0.2", "1.2.3.4, 198.51.100.1, 10.0.0.1")
+        assert throttle.client_ip(request) == "198.51.100.1"
+        assert throttle.client_ip(_request("10.0.0.2")) == "10.0.0.2"
+
+
+class TestLoginThrottle:
+    @pytest.mark.asyncio
+    async def test_rejects_by_email(self):
+        throttle = LoginThrottle(MemoryRateLimitBackend(), SLIDING_WINDOW, ip_limit=100, email_limit=2, window_seconds=60)
+        await throttle.check("10.0.0.1", "test@example.com")
+        await throttle.check("10.0.0.2", "TEST@example.com")
+
+        with pytest.raises(AppError) as exc_info:
+            await throttle.check("10.0.0.3", "test@example.com")
+
+        assert exc_info.value.status_code == 429
+        assert throttle.get_stats()["rejected_by_email"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_by_ip(self):
+        throttle = LoginThrottle(MemoryRateLimitBackend(), SLIDING_WINDOW, ip_limit=2, email_limit=100, window_seconds=60)
+        await throttle.check("10.0.0.1", "a@example.com")
+        await throttle.check("10.0.0.1", "b@example.com")
+
+        with pytest.raises(AppError):
+            await throttle.check("10.0.0.1", "c@example.com")
+
+        stats = throttle.get_stats()
+        assert stats["rejected_by_ip"] == 1
+        assert stats["allowed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_backend_error_fails_open(self):
+        class BrokenBackend(MemoryRateLimitBackend):
+            async def hit(self, *args, **kwargs):
+                raise ConnectionError("redis down")
+
+        throttle = LoginThrottle(BrokenBackend(), SLIDING_WINDOW, ip_limit=1, email_limit=1, window_seconds=60)
+        await throttle.check("10.0.0.1", "test@example.com")
+        assert throttle.get_stats()["backend_errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        throttle = LoginThrottle(None, SLIDING_WINDOW, ip_limit=0, email_limit=0, window_seconds=60)
+        await throttle.check("10.0.0.1", "test@example.com")
+
+    @pytest.mark.asyncio
+    async def test_stats_endpoint(self, client: AsyncClient):
+        throttle = LoginThrottle(MemoryRateLimitBackend(), SLIDING_WINDOW, ip_limit=1, email_limit=100, window_seconds=60)
+        await throttle.check("10.0.0.1", "a@example.com")
+        with pytest.raises(AppError):
+            await throttle.check("10.0.0.1", "b@example.com")
+
+        with patch("app.main.login_throttle", throttle):
+            response = await client.get("/health-check/auth")
+
+        assert response.status_code == 200
+        stats = response.json()["login_throttle"]
+        assert stats["rejected_by_ip"] == 1
+        assert stats["rejected"] == 1
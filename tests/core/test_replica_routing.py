@@ -0,0 +1,152 @@
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine, insert, select, update
+from app.core.database.routing import (
+    REPLICA_READ,
+    ReadYourWritesMiddleware,
+    Replica,
+    ReplicaSet,
+    RoutingSession,
+    _routing_state,
+    has_dml_cte,
+    mark_primary_write,
+    primary_required,
+)
+from app.users.models.user import User
+from app.users.repositories import user_repository
+
+
+def _replica_set(*healthy):
+    replicas = ReplicaSet([], max_lag_seconds=5, check_interval_seconds=5)
+    for index, is_healthy in enumerate(healthy):
+        replica = Replica(f"replica-{index}", MagicMock())
+        replica.healthy = is_healthy
+        replicas.replicas.append(replica)
+    return replicas
+
+
+@pytest.fixture
+def primary():
+    return create_engine("sqlite://")
+
+
+class TestRoutingSession:
+    def test_replica_read(self, primary):
+        replicas = _replica_set(True)
+        session = RoutingSession(bind=primary)
+
+        with patch("app.core.database.routing.replica_set", replicas):
+            bind = session.get_bind(clause=select(User).execution_options(**REPLICA_READ))
+
+        assert bind is replicas.replicas[0].engine.sync_engine
+        assert replicas.get_stats()["replica_reads"] == 1
+
+    def test_unmarked_select_uses_primary(self, primary):
+        session = RoutingSession(bind=primary)
+
+        with patch("app.core.database.routing.replica_set", _replica_set(True)):
+            assert session.get_bind(clause=select(User)) is primary
+
+    def test_reads_after_write_use_primary(self, primary):
+        session = RoutingSession(bind=primary)
+
+        with patch("app.core.database.routing.replica_set", _replica_set(True)):
+            assert session.get_bind(clause=update(User).values(is_active=False)) is primary
+            assert session.get_bind(clause=select(User).execution_options(**REPLICA_READ)) is primary
+
+    def test_select_with_dml_cte_is_write(self, primary):
+        session = RoutingSession(bind=primary)
+        state = {"sticky": False, "wrote": False}
+        token = _routing_state.set(state)
+
+        try:
+            with patch("app.core.database.routing.replica_set", _replica_set(True)):
+                assert session.get_bind(clause=user_repository._CREATE_USER_WITH_JWT_STORAGE) is primary
+                assert session.get_bind(clause=select(User).execution_options(**REPLICA_READ)) is primary
+        finally:
+            _routing_state.reset(token)
+
+        assert session.info["wrote"] is True
+        assert state["wrote"] is True
+
+    def test_dml_cte_detection(self):
+        inserted = insert(User).values(email="a@example.com").returning(User.id).cte("inserted")
+
+        assert has_dml_cte(select(inserted.c.id)) is True
+        assert has_dml_cte(select(User).execution_options(**REPLICA_READ)) is False
+        assert has_dml_cte(select(User.id).where(User.id.in_(select(inserted.c.id)))) is True
+
+    def test_users_count_estimate_is_replica_read(self, primary):
+        replicas = _replica_set(True)
+        session = RoutingSession(bind=primary)
+
+        with patch("app.core.database.routing.replica_set", replicas):
+            bind = session.get_bind(clause=user_repository._ESTIMATE_USERS)
+
+        assert bind is replicas.replicas[0].engine.sync_engine
+        assert not session.info.get("wrote")
+
+    def test_for_update_uses_primary(self, primary):
+        session = RoutingSession(bind=primary)
+
+        with patch("app.core.database.routing.replica_set", _replica_set(True)):
+            stmt = select(User).with_for_update().execution_options(**REPLICA_READ)
+            assert session.get_bind(clause=stmt) is primary
+
+    def test_fallback_when_no_healthy_replica(self, primary):
+        replicas = _replica_set(False)
+        session = RoutingSession(bind=primary)
+
+        with patch("app.core.database.routing.replica_set", replicas):
+            assert session.get_bind(clause=select(User).execution_options(**REPLICA_READ)) is primary
+
+        assert replicas.get_stats()["primary_fallbacks"] == 1
+
+    def test_round_robin(self):
+        replicas = _replica_set(True, False, True)
+
+        chosen = [replicas.choose().name for _ in range(4)]
+
+        assert chosen == ["replica-0", "replica-2", "replica-0", "replica-2"]
+
+
+class TestReadYourWritesMiddleware:
+    async def _call(self, inner, headers=()):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        middleware = ReadYourWritesMiddleware(inner, sticky_seconds=5)
+        scope = {"type": "http", "headers": list(headers)}
+        with patch("app.core.database.routing.replica_set", _replica_set(True)):
+            await middleware(scope, None, send)
+        return messages
+
+    @pytest.mark.asyncio
+    async def test_sets_cookie_after_write(self):
+        async def inner(scope, receive, send):
+            assert not primary_required()
+            mark_primary_write()
+            assert primary_required()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        messages = await self._call(inner)
+
+        headers = dict(messages[0]["headers"])
+        assert headers[b"set-cookie"].startswith(b"db_primary_until=")
+
+    @pytest.mark.asyncio
+    async def test_sticky_cookie_forces_primary(self):
+        seen = {}
+
+        async def inner(scope, receive, send):
+            seen["primary"] = primary_required()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        cookie = f"other=1; db_primary_until={int(time.time()) + 60}".encode()
+        messages = await self._call(inner, headers=[(b"cookie", cookie)])
+
+        assert seen["primary"] is True
+        assert messages[0]["headers"] == []
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+from app.core.database.row_counter import (
+    USERS_ROW_COUNT_TRIGGERS,
+    disable_users_row_counter,
+    enable_users_row_counter,
+    users_row_counter_enabled,
+)
+
+
+def _connection():
+    connection = MagicMock()
+    connection.execute.return_value.scalar_one.return_value = 42
+    return connection
+
+
+def _statements(connection):
+    return [" ".join(str(call.args[0]).split()) for call in connection.execute.call_args_list]
+
+
+class TestUsersRowCounter:
+    def test_enable_installs_triggers_under_lock(self):
+        connection = _connection()
+
+        assert enable_users_row_counter(connection) == 42
+
+        statements = _statements(connection)
+        assert statements[0] == "LOCK TABLE users IN SHARE ROW EXCLUSIVE MODE"
+        created = [statement for statement in statements if statement.startswith("CREATE TRIGGER")]
+        assert len(created) == len(USERS_ROW_COUNT_TRIGGERS)
+        assert "AFTER UPDATE ON users REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows" in created[2]
+        assert statements[-1].startswith("INSERT INTO table_row_counts")
+        assert "WHERE deleted_at IS NULL" in statements[-1]
+
+    def test_disable_drops_triggers_and_counter(self):
+        connection = _connection()
+
+        disable_users_row_counter(connection)
+
+        statements = _statements(connection)
+        assert [s for s in statements if s.startswith("DROP TRIGGER")] == [
+            f"DROP TRIGGER IF EXISTS {name} ON users" for name, _, _ in USERS_ROW_COUNT_TRIGGERS
+        ]
+        assert statements[-1] == "DELETE FROM table_row_counts WHERE table_name = 'users'"
+
+    def test_enabled_requires_all_triggers(self):
+        connection = _connection()
+        names = [name for name, _, _ in USERS_ROW_COUNT_TRIGGERS]
+
+        connection.execute.return_value.scalars.return_value.all.return_value = names
+        assert users_row_counter_enabled(connection) is True
+
+        connection.execute.return_value.scalars.return_value.all.return_value = names[:1]
+        assert users_row_counter_enabled(connection) is False
@@ -0,0 +1,87 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, MetaData, String, Table, text
+from app.core.database.database_manager import Base
+from app.core.database.schema_lint import lint_metadata
+
+
+def _rules(metadata):
+    return sorted((issue.rule, issue.table, issue.message.split(" ")[0]) for issue in lint_metadata(metadata))
+
+
+class TestSchemaLint:
+    """스키마 인덱스 린트 테스트"""
+
+    def test_unindexed_foreign_key(self):
+        metadata = MetaData()
+        Table("parents", metadata, Column("id", Integer, primary_key=True))
+        Table(
+            "children",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", Integer, ForeignKey("parents.id")),
+        )
+
+        assert _rules(metadata) == [("unindexed-fk", "children", "foreign")]
+
+    def test_foreign_key_covered_by_leading_column(self):
+        metadata = MetaData()
+        Table("parents", metadata, Column("id", Integer, primary_key=True))
+        children = Table(
+            "children",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", Integer, ForeignKey("parents.id")),
+            Column("name", String),
+        )
+        Index("idx_children_parent_name", children.c.parent_id, children.c.name)
+
+        assert _rules(metadata) == []
+
+    def test_partial_index_does_not_cover_foreign_key(self):
+        metadata = MetaData()
+        Table("parents", metadata, Column("id", Integer, primary_key=True))
+        children = Table(
+            "children",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", Integer, ForeignKey("parents.id")),
+            Column("deleted_at", Integer),
+        )
+        Index("idx_children_parent", children.c.parent_id, postgresql_where=text("deleted_at IS NULL"))
+
+        assert _rules(metadata) == [("unindexed-fk", "children", "foreign")]
+
+    def test_duplicate_and_redundant_indexes(self):
+        metadata = MetaData()
+        users = Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True, index=True),
+            Column("email", String, unique=True, index=True),
+            Column("name", String),
+        )
+        Index("idx_users_email", users.c.email, unique=True)
+        Index("idx_users_name", users.c.name)
+        Index("idx_users_name_email", users.c.name, users.c.email)
+
+        assert _rules(metadata) == [
+            ("duplicate-index", "users", "ix_users_email"),
+            ("redundant-index", "users", "idx_users_name"),
+            ("redundant-index", "users", "ix_users_id"),
+        ]
+
+    def test_partial_indexes_are_compared_with_same_predicate(self):
+        metadata = MetaData()
+        users = Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("email", String),
+            Column("deleted_at", Integer),
+        )
+        Index("uq_users_email_active", users.c.email, unique=True, postgresql_where=text("deleted_at IS NULL"))
+        Index("idx_users_email", users.c.email)
+
+        assert _rules(metadata) == []
+
+    def test_application_schema_is_clean(self):
+        assert lint_metadata(Base.metadata) == []
@@ -1,13 +1,22 @@
 import pytest
+import time
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from jose import jwt
 from app.core.security import (
     hash_password,
     verify_password,
     create_access_token,
     create_refresh_token,
     verify_token,
+    fingerprint_refresh_token,
+    verify_refresh_token_fingerprint,
+    HS256Codec,
+    AsymmetricJWTCodec,
+    needs_rehash,
     _parse_expiration_time,
 )
+from passlib.context import CryptContext
 from app.core.config import settings
 
 class TestPasswordHashing:
@@ -33,6 +42,42 @@ class TestPasswordHashing:
         hashed = hash_password(password)
         assert verify_password("", hashed) is False
 
+class TestPasswordRehash:
+    def test_current_hash_does_not_need_rehash(self):
+        assert needs_rehash(hash_password("test_password")) is False
+
+    def test_other_scheme_needs_rehash(self):
+        legacy_hash = CryptContext(schemes=["bcrypt"]).hash("test_password")
+        assert needs_rehash(legacy_hash) is True
+        assert verify_password("test_password", legacy_hash) is True
+
+    def test_other_rounds_need_rehash(self):
+        with patch("app.core.security.settings.password_hash_rounds", 5000):
+            from app.core.security import _build_pwd_context
+            context = _build_pwd_context()
+        assert context.needs_update(hash_password("test_password")) is True
+
+    def test_unknown_hash(self):
+        assert needs_rehash("not-a-hash") is False
+
+class TestRefreshTokenFingerprint:
+    def test_fingerprint_is_fixed_size(self):
+        token = create_refresh_token({"id": 1})
+        fingerprint = fingerprint_refresh_token(token)
+        assert len(fingerprint) == 64
+        assert fingerprint == fingerprint_refresh_token(token)
+
+    def test_verify_fingerprint_correct(self):
+        token = create_refresh_token({"id": 1})
+        fingerprint = fingerprint_refresh_token(token)
+        assert verify_refresh_token_fingerprint(token, fingerprint) is True
+
+    def test_verify_fingerprint_incorrect(self):
+        token = create_refresh_token({"id": 1})
+        other_token = create_refresh_token({"id": 2})
+        fingerprint = fingerprint_refresh_token(token)
+        assert verify_refresh_token_fingerprint(other_token, fingerprint) is False
+
 class TestExpirationTimeParsing:
     def test_parse_expiration_time_with_seconds(self):
         result = _parse_expiration_time("3600s")
@@ -164,4 +209,105 @@ class TestTokenDataIntegrity:
         
         assert payload is not None
         assert "exp" in payload
-        assert len(payload) == 1  # exp만 포함되어야 함
\ No newline at end of file
+        assert set(payload) == {"exp", "jti"}  # exp와 jti만 포함되어야 함
+
+class TestHS256Codec:
+    def test_encode_matches_jose_byte_for_byte(self):
+        codec = HS256Codec("secret", expires_in=3600)
+        now = 1700000000
+        claims = {"id": 1, "profile_name": "테스트"}
+
+        with patch("app.core.security.time.time", return_value=now + 0.5):
+            token = codec.encode(claims)
+
+        expected = jwt.encode({**claims, "exp": now + 3600}, "secret", algorithm="HS256")
+        assert token == expected
+
+    def test_decode_jose_issued_token(self):
+        codec = HS256Codec("secret")
+        token = jwt.encode({"id": 1, "exp": int(time.time()) + 60}, "secret", algorithm="HS256")
+        payload = codec.decode(token)
+        assert payload["id"] == 1
+
+    def test_decode_expired_token(self):
+        codec = HS256Codec("secret")
+        token = jwt.encode({"id": 1, "exp": int(time.time()) - 60}, "secret", algorithm="HS256")
+        assert codec.decode(token) is None
+
+    def test_decode_tampered_token(self):
+        codec = HS256Codec("secret")
+        header, payload, signature = codec.encode({"id": 1}).split(".")
+        forged = jwt.encode({"id": 2, "exp": int(time.time()) + 60}, "other", algorithm="HS256").split(".")[1]
+        assert codec.decode(f"{header}.{forged}.{signature}") is None
+
+    def test_decode_non_standard_header_falls_back_to_jose(self):
+        codec = HS256Codec("secret")
+        token = jwt.encode({"id": 1}, "secret", algorithm="HS256", headers={"kid": "k1"})
+        assert codec.decode(token) == {"id": 1}
+
+    def test_decode_rejects_other_algorithms(self):
+        codec = HS256Codec("secret")
+        token = jwt.encode({"id": 1}, "secret", algorithm="HS512")
+        assert codec.decode(token) is None
+
+
+class TestAsymmetricJWTCodec:
+    @pytest.fixture(scope="class")
+    def rsa_key(self):
+        rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    @pytest.fixture(scope="class")
+    def ed25519_key(self):
+        ed25519 = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ed25519")
+        return ed25519.Ed25519PrivateKey.generate()
+
+    def test_rs256_roundtrip_and_jose_interop(self, rsa_key):
+        from cryptography.hazmat.primitives import serialization
+        codec = AsymmetricJWTCodec("RS256", rsa_key, kid="key-1")
+        token = codec.encode({"id": 1})
+
+        assert codec.decode(token)["id"] == 1
+        assert jwt.get_unverified_header(token)["kid"] == "key-1"
+
+        public_pem = rsa_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        assert jwt.decode(token, public_pem.decode(), algorithms=["RS256"])["id"] == 1
+
+    def test_eddsa_roundtrip(self, ed25519_key):
+        codec = AsymmetricJWTCodec("EdDSA", ed25519_key)
+        token = codec.encode({"id": 1})
+
+        assert codec.decode(token)["id"] == 1
+        assert codec.decode(token[:-4] + "AAAA") is None
+
+    def test_rejects_expired_and_hs256_tokens(self, rsa_key):
+        codec = AsymmetricJWTCodec("RS256", rsa_key)
+
+        assert codec.decode(codec.encode({"id": 1}, expires_in=-10)) is None
+        assert codec.decode(jwt.encode({"id": 1}, "secret", algorithm="HS256")) is None
+
+    def test_rotation_verifies_previous_key(self, rsa_key):
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        new_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        old_codec = AsymmetricJWTCodec("RS256", rsa_key)
+        new_codec = AsymmetricJWTCodec("RS256", new_key, verification_keys=[rsa_key.public_key()])
+
+        assert new_codec.decode(old_codec.encode({"id": 1}))["id"] == 1
+        assert [jwk["kid"] for jwk in new_codec.jwks()["keys"]] == [new_codec.kid, old_codec.kid]
+
+    def test_jwks(self, rsa_key, ed25519_key):
+        rsa_jwk = AsymmetricJWTCodec("RS256", rsa_key).jwks()["keys"][0]
+        ed_jwk = AsymmetricJWTCodec("EdDSA", ed25519_key).jwks()["keys"][0]
+
+        assert rsa_jwk["kty"] == "RSA" and rsa_jwk["e"] == "AQAB" and rsa_jwk["alg"] == "RS256"
+        assert ed_jwk["kty"] == "OKP" and ed_jwk["crv"] == "Ed25519" and ed_jwk["alg"] == "EdDSA"
+        assert "d" not in rsa_jwk and "d" not in ed_jwk
+
+    def test_rejects_mismatched_key(self, rsa_key):
+        with pytest.raises(ValueError):
+            AsymmetricJWTCodec("EdDSA", rsa_key)
+
+    def test_hs256_codec_publishes_no_keys(self):
+        assert HS256Codec("secret").jwks() == {"keys": []}
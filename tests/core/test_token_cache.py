@@ -0,0 +1,71 @@
+import time
+import pytest
+from unittest.mock import patch
+from app.core.token_cache import VerifiedTokenCache, access_token_cache
+from app.core.security import create_access_token, verify_access_token
+
+
+class TestVerifiedTokenCache:
+    def test_put_and_get(self):
+        cache = VerifiedTokenCache(max_size=10)
+        payload = {"id": 1, "exp": time.time() + 60}
+        cache.put("token", payload)
+
+        assert cache.get("token") == payload
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_miss(self):
+        cache = VerifiedTokenCache(max_size=10)
+        assert cache.get("unknown") is None
+        assert cache.misses == 1
+
+    def test_expired_entry_is_dropped(self):
+        cache = VerifiedTokenCache(max_size=10)
+        cache.put("token", {"id": 1, "exp": time.time() + 60})
+
+        with patch("app.core.token_cache.time.time", return_value=time.time() + 120):
+            assert cache.get("token") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_payload_without_exp_is_not_cached(self):
+        cache = VerifiedTokenCache(max_size=10)
+        cache.put("token", {"id": 1})
+        assert cache.get("token") is None
+
+    def test_lru_eviction(self):
+        cache = VerifiedTokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.put("a", {"exp": exp})
+        cache.put("b", {"exp": exp})
+        cache.get("a")
+        cache.put("c", {"exp": exp})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.evictions == 1
+
+    def test_disabled_cache(self):
+        cache = VerifiedTokenCache(max_size=0)
+        cache.put("token", {"exp": time.time() + 60})
+        assert cache.get("token") is None
+
+
+class TestVerifyAccessToken:
+    def test_valid_token_is_cached(self):
+        access_token_cache.clear()
+        token = create_access_token({"id": 1})
+
+        assert verify_access_token(token)["id"] == 1
+        with patch("app.core.security.verify_token") as mock_verify:
+            assert verify_access_token(token)["id"] == 1
+            mock_verify.assert_not_called()
+
+    def test_invalid_token_is_not_cached(self):
+        access_token_cache.clear()
+        assert verify_access_token("invalid.token.here") is None
+        assert access_token_cache.get_stats()["size"] == 0
+
+    def test_empty_token(self):
+        assert verify_access_token("") is None
@@ -0,0 +1,163 @@
+import asyncio
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from fastapi.security import HTTPAuthorizationCredentials
+from app.core.dependencies import get_access_token_payload
+from app.core.errors import AppError
+from app.core.security import create_access_token, verify_access_token
+from app.core.token_denylist import RedisDenylistSync, TokenDenylist
+
+
+class TestTokenDenylist:
+    """액세스 토큰 폐기 목록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_revoke(self):
+        denylist = TokenDenylist(bucket_seconds=60)
+        exp = time.time() + 300
+
+        await denylist.revoke("jti-1", exp)
+
+        assert denylist.is_revoked("jti-1", exp)
+        assert not denylist.is_revoked("jti-2", exp)
+        assert denylist.get_stats()["revoked"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ignores_expired_and_legacy_tokens(self):
+        denylist = TokenDenylist(bucket_seconds=60)
+
+        await denylist.revoke("jti-1", time.time() - 1)
+        await denylist.revoke(None, time.time() + 300)
+
+        assert len(denylist) == 0
+        assert not denylist.is_revoked(None, time.time() + 300)
+
+    def test_drops_expired_buckets(self):
+        denylist = TokenDenylist(bucket_seconds=60)
+        now = 1_000_020.0
+
+        with patch("app.core.token_denylist.time.time", return_value=now):
+            denylist.add("short", now + 30)
+            denylist.add("long", now + 600)
+        assert denylist.get_stats()["buckets"] == 2
+
+        with patch("app.core.token_denylist.time.time", return_value=now + 120):
+            assert not denylist.is_revoked("short", now + 30)
+            assert denylist.is_revoked("long", now + 600)
+        assert denylist.get_stats()["buckets"] == 1
+
+
+class _FakePubSub:
+    def __init__(self, messages, error=None):
+        self.messages = messages
+        self.error = error
+
+    async def subscribe(self, channel):
+        pass
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        if self.error is not None:
+            raise self.error
+        await asyncio.Event().wait()
+
+    async def aclose(self):
+        pass
+
+
+class _FakeRedis:
+    def __init__(self, pubsubs):
+        self.pubsubs = iter(pubsubs)
+        self.loads = 0
+
+    def pubsub(self):
+        return next(self.pubsubs)
+
+    async def scan_iter(self, **kwargs):
+        self.loads += 1
+        return
+        yield
+
+    async def aclose(self):
+        pass
+
+
+class TestRedisDenylistSync:
+    """폐기 목록 워커 간 동기화 구독 테스트"""
+
+    @staticmethod
+    def _sync(client):
+        with patch("app.core.token_denylist.aioredis", MagicMock(from_url=MagicMock(return_value=client))):
+            return RedisDenylistSync("redis://localhost:6379", reconnect_min_seconds=0.01)
+
+    @pytest.mark.asyncio
+    async def test_skips_malformed_messages(self):
+        exp = int(time.time()) + 300
+        client = _FakeRedis([_FakePubSub([
+            {"type": "subscribe", "data": 1},
+            {"type": "message", "data": "jti-1:not-a-number"},
+            {"type": "message", "data": None},
+            {"type": "message", "data": f"jti-2:{exp}"},
+        ])])
+        sync = self._sync(client)
+        denylist = TokenDenylist(bucket_seconds=60, sync=sync)
+
+        await sync.start(denylist)
+        await asyncio.sleep(0.01)
+
+        assert denylist.is_revoked("jti-2", exp)
+        stats = denylist.get_stats()["sync"]
+        assert stats["listening"] is True
+        assert stats["connected"] is True
+        assert stats["malformed_messages"] == 2
+        await sync.close()
+
+    @pytest.mark.asyncio
+    async def test_resubscribes_after_connection_error(self):
+        exp = int(time.time()) + 300
+        client = _FakeRedis([
+            _FakePubSub([], error=ConnectionError("redis down")),
+            _FakePubSub([{"type": "message", "data": f"jti-1:{exp}"}]),
+        ])
+        sync = self._sync(client)
+        denylist = TokenDenylist(bucket_seconds=60, sync=sync)
+
+        await sync.start(denylist)
+        await asyncio.sleep(0.05)
+
+        assert denylist.is_revoked("jti-1", exp)
+        stats = sync.get_stats()
+        assert stats["connected"] is True
+        assert stats["reconnects"] == 1
+        assert stats["last_error"] is None
+        # 다시 구독하면 끊긴 동안의 폐기 내역을 다시 불러옴
+        assert client.loads == 2
+
+        await sync.close()
+        assert sync.get_stats()["listening"] is False
+
+
+class TestAccessTokenRevocation:
+    """get_access_token_payload의 폐기 토큰 처리"""
+
+    def test_access_tokens_have_unique_jti(self):
+        first = verify_access_token(create_access_token({"id": 1}))
+        second = verify_access_token(create_access_token({"id": 1}))
+
+        assert first["jti"] and second["jti"]
+        assert first["jti"] != second["jti"]
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_rejected_even_when_cached(self):
+        denylist = TokenDenylist(bucket_seconds=60)
+        token = create_access_token({"id": 1})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("app.core.dependencies.token_denylist", denylist):
+            payload = await get_access_token_payload(credentials)
+            await denylist.revoke(payload["jti"], payload["exp"])
+
+            with pytest.raises(AppError):
+                await get_access_token_payload(credentials)
@@ -116,4 +116,9 @@ class TestUserTimestamps:
         # 삭제된 사용자 시뮬레이션
         deleted_user = UserFactory(deleted_at=datetime.now(timezone.utc))
         assert deleted_user.deleted_at is not None
-        assert isinstance(deleted_user.deleted_at, datetime)
\ No newline at end of file
+        assert isinstance(deleted_user.deleted_at, datetime)
+    def test_user_created_at_not_nullable(self):
+        # 키셋 페이지네이션 정렬 키이므로 NULL을 허용하지 않음
+        column = User.__table__.c.created_at
+        assert column.nullable is False
+        assert column.server_default is not None
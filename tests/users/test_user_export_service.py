@@ -0,0 +1,95 @@
+import csv
+import gzip
+import io
+import json
+import pytest
+from collections import namedtuple
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from app.users.services.user_export_service import EXPORT_COLUMNS, UserExportService
+
+ExportRow = namedtuple("ExportRow", EXPORT_COLUMNS)
+CREATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _rows(count):
+    return [
+        ExportRow(index, f"user{index}@example.com", f"user,{index}", "COMMON", True, CREATED_AT, None)
+        for index in range(1, count + 1)
+    ]
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+        self.fetched = 0
+
+    async def partitions(self, size):
+        for start in range(0, len(self.rows), size):
+            self.fetched += 1
+            yield self.rows[start:start + size]
+
+
+def _service(rows, chunk_rows=2):
+    result = _FakeResult(rows)
+    session = MagicMock()
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    service = UserExportService(session_factory=factory, chunk_rows=chunk_rows)
+    return service, result
+
+
+async def _export(service, result, export_format, compress=False):
+    with patch(
+        "app.users.services.user_export_service.UserRepository.stream_users_for_export",
+        return_value=result,
+    ):
+        return [chunk async for chunk in service.export_users(export_format, compress)]
+
+
+class TestUserExportService:
+    @pytest.mark.asyncio
+    async def test_ndjson_one_chunk_per_partition(self):
+        service, result = _service(_rows(5))
+
+        chunks = await _export(service, result, "ndjson")
+
+        assert len(chunks) == 3
+        lines = b"".join(chunks).decode().splitlines()
+        assert len(lines) == 5
+        first = json.loads(lines[0])
+        assert first["email"] == "user1@example.com"
+        assert first["created_at"] == CREATED_AT.isoformat()
+        assert "password" not in first
+
+    @pytest.mark.asyncio
+    async def test_csv_header_once(self):
+        service, result = _service(_rows(3))
+
+        chunks = await _export(service, result, "csv")
+
+        rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+        assert rows[0] == EXPORT_COLUMNS
+        assert rows[1][2] == "user,1"
+        assert rows[1][6] == ""
+        assert len(rows) == 4
+
+    @pytest.mark.asyncio
+    async def test_csv_empty_has_header(self):
+        service, result = _service([])
+
+        chunks = await _export(service, result, "csv")
+
+        assert b"".join(chunks).decode().splitlines() == [",".join(EXPORT_COLUMNS)]
+
+    @pytest.mark.asyncio
+    async def test_gzip(self):
+        service, result = _service(_rows(4))
+
+        chunks = await _export(service, result, "ndjson", compress=True)
+
+        assert len(gzip.decompress(b"".join(chunks)).decode().splitlines()) == 4
@@ -0,0 +1,130 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.core.errors import AppError, USERS_ERRORS
+from app.users.services.user_import_service import (
+    UserImportService,
+    parse_records,
+    resolve_import_format,
+)
+
+
+async def _stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(chunks, import_format):
+    return [item async for item in parse_records(_stream(*chunks), import_format)]
+
+
+async def _fake_hash(passwords):
+    return [f"hashed:{password}" for password in passwords]
+
+
+def _service(batch_size=1000, max_errors=1000):
+    service = UserImportService(MagicMock(rollback=AsyncMock()), batch_size=batch_size, max_errors=max_errors)
+    service.user_repository = MagicMock()
+
+    async def import_users(records):
+        return [
+            SimpleNamespace(line=line, email=email, user_id=None if email.startswith("taken") else line)
+            for line, email, _, _ in records
+        ]
+
+    service.user_repository.import_users = AsyncMock(side_effect=import_users)
+    return service
+
+
+class TestParseRecords:
+    @pytest.mark.asyncio
+    async def test_ndjson_split_across_chunks(self):
+        records = await _collect(
+            [b'{"email": "a@example.com"}\n{"em', b'ail": "b@example.com"}\n\n[1]\nnot json'],
+            "ndjson",
+        )
+
+        assert records == [
+            (1, {"email": "a@example.com"}),
+            (2, {"email": "b@example.com"}),
+            (4, "JSON 객체가 아닙니다"),
+            (5, "JSON 형식이 올바르지 않습니다"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_csv(self):
+        records = await _collect(
+            ["﻿email,password,profile_name\r\n".encode(), b'a@example.com,"pa,ss",A\r\nb@example.com,x\r\n'],
+            "csv",
+        )
+
+        assert records == [
+            (2, {"email": "a@example.com", "password": "pa,ss", "profile_name": "A"}),
+            (3, "컬럼 수가 헤더와 다릅니다"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_csv_missing_columns(self):
+        with pytest.raises(AppError) as exc_info:
+            await _collect([b"email,password\n"], "csv")
+
+        assert exc_info.value.error_code == USERS_ERRORS["INVALID_IMPORT_FORMAT"]["errorCode"]
+
+    def test_resolve_format(self):
+        assert resolve_import_format(None, "application/x-ndjson; charset=utf-8") == "ndjson"
+        assert resolve_import_format(None, "text/csv") == "csv"
+        assert resolve_import_format("csv", "application/json") == "csv"
+        with pytest.raises(AppError):
+            resolve_import_format(None, "application/json")
+
+
+class TestUserImportService:
+    @pytest.mark.asyncio
+    async def test_reports_per_row_errors(self):
+        service = _service(batch_size=2)
+        body = (
+            b'{"email": "a@example.com", "password": "secret1", "profile_name": "A"}\n'
+            b'{"email": "invalid", "password": "secret1", "profile_name": "B"}\n'
+            b'{"email": "taken@example.com", "password": "secret1", "profile_name": "C"}\n'
+            b'{"email": "a@example.com", "password": "secret1", "profile_name": "D"}\n'
+            b'{"email": "e@example.com", "password": "secret1", "profile_name": "E"}\n'
+        )
+
+        with patch("app.users.services.user_import_service.hash_passwords_async", side_effect=_fake_hash):
+            result = await service.import_users(_stream(body), "ndjson")
+
+        assert (result.total, result.created, result.failed) == (5, 2, 3)
+        assert [(error.line, error.email) for error in result.errors] == [
+            (2, "invalid"),
+            (3, "taken@example.com"),
+            (4, "a@example.com"),
+        ]
+        assert result.errors[1].message == USERS_ERRORS["USER_EMAIL_ALREADY_EXIST"]["message"]
+        assert result.rows_per_second > 0
+        assert service.user_repository.import_users.await_count == 2
+        first_batch = service.user_repository.import_users.await_args_list[0].args[0]
+        assert first_batch[0] == (1, "a@example.com", "hashed:secret1", "A")
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_reported(self):
+        service = _service()
+        service.user_repository.import_users = AsyncMock(side_effect=RuntimeError("copy failed"))
+        body = b'email,password,profile_name\na@example.com,secret1,A\nb@example.com,secret1,B\n'
+
+        with patch("app.users.services.user_import_service.hash_passwords_async", side_effect=_fake_hash):
+            result = await service.import_users(_stream(body), "csv")
+
+        assert (result.created, result.failed) == (0, 2)
+        assert result.errors[0].message == USERS_ERRORS["FAILED_IMPORT_USERS"]["message"]
+        service.db.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_errors_truncated(self):
+        service = _service(max_errors=1)
+        body = b"not json\nnot json\n"
+
+        result = await service.import_users(_stream(body), "ndjson")
+
+        assert result.failed == 2
+        assert len(result.errors) == 1
+        assert result.errors_truncated is True
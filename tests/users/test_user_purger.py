@@ -0,0 +1,82 @@
+import pytest
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from app.users.repositories import user_repository
+from app.users.services.user_purger import UserPurger, user_purger
+
+
+def _purger(max_batches=5):
+    @asynccontextmanager
+    async def factory():
+        yield MagicMock()
+
+    return UserPurger(
+        retention_seconds=3600,
+        interval_seconds=60,
+        batch_size=2,
+        batch_pause_seconds=0,
+        max_batches=max_batches,
+        session_factory=factory,
+    )
+
+
+class TestUserPurger:
+    @pytest.mark.asyncio
+    async def test_purges_until_batch_is_short(self):
+        purger = _purger()
+        purge = AsyncMock(side_effect=[2, 2, 1])
+
+        with patch.object(user_repository.UserRepository, "purge_deleted_users", purge):
+            assert await purger.purge_once() == 5
+
+        assert purge.await_count == 3
+        purge.assert_awaited_with(timedelta(hours=1), 2)
+        assert purger.get_stats()["purged"] == 5
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_batches(self):
+        purger = _purger(max_batches=2)
+        purge = AsyncMock(return_value=2)
+
+        with patch.object(user_repository.UserRepository, "purge_deleted_users", purge):
+            assert await purger.purge_once() == 4
+
+        assert purge.await_count == 2
+
+    def test_default_retention_is_days(self):
+        assert user_purger.retention == timedelta(days=30)
+
+
+class TestSoftDeleteQueries:
+    def _sql(self, statement):
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.parametrize("statement", [
+        "_SELECT_USER_BY_ID",
+        "_SELECT_USER_BY_ID_WITH_JWT",
+        "_SELECT_USERS_BY_IDS",
+        "_SELECT_USER_BY_EMAIL",
+        "_EMAIL_EXISTS",
+        "_SELECT_USERS_PAGE",
+        "_SELECT_USERS_AFTER",
+        "_SELECT_USERS_PAGE_WITH_COUNT",
+        "_SELECT_USERS_EXPORT",
+        "_COUNT_USERS",
+    ])
+    def test_reads_exclude_deleted(self, statement):
+        assert "users.deleted_at IS NULL" in self._sql(getattr(user_repository, statement))
+
+    def test_soft_delete_only_sets_deleted_at(self):
+        sql = self._sql(user_repository._SOFT_DELETE_USER)
+
+        assert sql.startswith("UPDATE users SET")
+        assert "deleted_at=now()" in sql
+
+    def test_purge_batches_with_skip_locked(self):
+        sql = self._sql(user_repository._PURGE_DELETED_USERS)
+
+        assert sql.startswith("DELETE FROM users WHERE users.id IN (SELECT users.id")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "LIMIT" in sql
@@ -69,7 +69,7 @@ class TestGetUsers:
                 assert data["skip"] == 0
                 assert data["limit"] == 100
                 
-                mock_get_users.assert_called_once_with(0, 100)
+                mock_get_users.assert_called_once_with(0, 100, None, None)
 
     @pytest.mark.asyncio
     async def test_get_users_with_pagination(self, client: AsyncClient):
@@ -89,7 +89,7 @@ class TestGetUsers:
                 response = await client.get("/users/?skip=10&limit=5")
                 
                 assert response.status_code == 200
-                mock_get_users.assert_called_once_with(10, 5)
+                mock_get_users.assert_called_once_with(10, 5, None, None)
 
     @pytest.mark.asyncio
     async def test_get_users_unauthorized(self, client: AsyncClient):
@@ -0,0 +1,370 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import create_engine, literal, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+from app.core.count_cache import CountCache
+from app.core.errors import AppError, USERS_ERRORS
+from app.users.repositories import user_repository
+from app.users.dto.user_dto import UserCreateDto
+from app.users.services.user_service import USER_LIST_ADAPTER, UserService
+from app.utils.cursor import decode_cursor, encode_cursor
+from tests.factories import UserFactory
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _users(count):
+    return [UserFactory(id=100 - index, created_at=BASE_TIME - timedelta(minutes=index)) for index in range(count)]
+
+
+def _count_session_factory(count=50):
+    """별도 세션에서 실행되는 COUNT 쿼리용 가짜 세션 팩토리"""
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock(scalar=MagicMock(return_value=count)))
+
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    factory.session = session
+    return factory
+
+
+def _service():
+    service = UserService(MagicMock(), session_factory=_count_session_factory())
+    service.user_repository = MagicMock()
+    service.user_repository.get_users_count = AsyncMock(return_value=50)
+    service.user_repository.email_exists = AsyncMock(return_value=False)
+    return service
+
+
+def _with_mode(mode):
+    return patch("app.users.services.user_service.settings", MagicMock(
+        USERS_LIST_QUERY_MODE=mode, USERS_COUNT_STRATEGY="exact"
+    ))
+
+
+class TestGetUsersListPagination:
+    @pytest.mark.asyncio
+    async def test_first_page_returns_next_cursor(self):
+        service = _service()
+        users = _users(3)
+        service.user_repository.get_users_list = AsyncMock(return_value=users)
+
+        response = await service.get_users_list(0, 2)
+
+        service.user_repository.get_users_list.assert_awaited_once_with(0, 3)
+        assert [user.id for user in response.users] == [100, 99]
+        assert decode_cursor(response.next_cursor) == (users[1].created_at, 99)
+
+    @pytest.mark.asyncio
+    async def test_cursor_uses_keyset_query(self):
+        service = _service()
+        users = _users(2)
+        service.user_repository.get_users_after = AsyncMock(return_value=users)
+        cursor = encode_cursor(BASE_TIME, 101)
+
+        response = await service.get_users_list(0, 2, cursor)
+
+        service.user_repository.get_users_after.assert_awaited_once_with(BASE_TIME, 101, 3)
+        assert len(response.users) == 2
+        assert response.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self):
+        service = _service()
+
+        with pytest.raises(AppError) as exc_info:
+            await service.get_users_list(0, 2, "invalid")
+
+        assert exc_info.value.error_code == USERS_ERRORS["INVALID_CURSOR"]["errorCode"]
+
+    def test_keyset_query_uses_row_comparison(self):
+        sql = str(user_repository._SELECT_USERS_AFTER.compile(dialect=postgresql.dialect()))
+
+        assert "(users.created_at, users.id) < (" in sql
+        assert "ORDER BY users.created_at DESC, users.id DESC" in sql
+        assert "OFFSET" not in sql
+
+
+class TestGetUsersCount:
+    @pytest.mark.asyncio
+    async def test_exact(self):
+        service = _service()
+
+        assert await service._get_total_count("exact") == (50, True)
+
+    @pytest.mark.asyncio
+    async def test_cached(self):
+        service = _service()
+
+        with patch("app.users.services.user_service.count_cache", CountCache(ttl_seconds=30)):
+            assert await service._get_total_count("cached") == (50, False)
+            assert await service._get_total_count("cached") == (50, False)
+
+        service.user_repository.get_users_count.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_estimated(self):
+        service = _service()
+        service.user_repository.get_users_count_estimate = AsyncMock(return_value=48)
+
+        assert await service._get_total_count("estimated") == (48, False)
+        service.user_repository.get_users_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_estimated_without_statistics_falls_back(self):
+        service = _service()
+        service.user_repository.get_users_count_estimate = AsyncMock(return_value=None)
+
+        assert await service._get_total_count("estimated") == (50, True)
+
+    @pytest.mark.asyncio
+    async def test_counter(self):
+        service = _service()
+        service.user_repository.get_users_count_from_counter = AsyncMock(return_value=51)
+
+        assert await service._get_total_count("counter") == (51, True)
+        service.user_repository.get_users_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_default_from_settings(self):
+        service = _service()
+        service.user_repository.get_users_count_from_counter = AsyncMock(return_value=None)
+
+        with patch("app.users.services.user_service.settings") as mock_settings:
+            mock_settings.USERS_COUNT_STRATEGY = "counter"
+            assert await service._get_total_count() == (50, True)
+
+        service.user_repository.get_users_count_from_counter.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_list_reports_exactness(self):
+        service = _service()
+        service.user_repository.get_users_list = AsyncMock(return_value=_users(1))
+        service.user_repository.get_users_count_estimate = AsyncMock(return_value=48)
+
+        with _with_mode("sequential"):
+            response = await service.get_users_list(0, 2, count_strategy="estimated")
+
+        assert response.total_count == 48
+        assert response.total_count_exact is False
+
+
+class TestGetUsersListQueryMode:
+    @pytest.mark.asyncio
+    async def test_sequential_uses_request_session(self):
+        service = _service()
+        service.user_repository.get_users_list = AsyncMock(return_value=_users(1))
+
+        with _with_mode("sequential"):
+            response = await service.get_users_list(0, 2)
+
+        assert response.total_count == 50
+        service.user_repository.get_users_count.assert_awaited_once()
+        service.session_factory.session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_count_on_separate_session(self):
+        service = _service()
+        started = []
+        both_started = asyncio.Event()
+
+        async def slow_page(skip, limit):
+            started.append("page")
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+            return _users(1)
+
+        async def slow_execute(stmt):
+            started.append("count")
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), 1)
+            return MagicMock(scalar=MagicMock(return_value=77))
+
+        service.user_repository.get_users_list = slow_page
+        service.session_factory.session.execute = slow_execute
+
+        with _with_mode("concurrent"):
+            response = await service.get_users_list(0, 2)
+
+        assert sorted(started) == ["count", "page"]
+        assert response.total_count == 77
+        service.user_repository.get_users_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_window_single_query(self):
+        service = _service()
+        service.user_repository.get_users_list_with_count = AsyncMock(return_value=(_users(2), 60))
+
+        with _with_mode("window"):
+            response = await service.get_users_list(10, 2)
+
+        service.user_repository.get_users_list_with_count.assert_awaited_once_with(10, 3)
+        assert response.total_count == 60
+        assert response.total_count_exact is True
+        service.user_repository.get_users_count.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_window_empty_page_counts_separately(self):
+        service = _service()
+        service.user_repository.get_users_list_with_count = AsyncMock(return_value=([], None))
+
+        with _with_mode("window"):
+            response = await service.get_users_list(1000, 2)
+
+        assert response.users == []
+        assert response.total_count == 50
+
+    @pytest.mark.asyncio
+    async def test_window_with_cursor_runs_concurrently(self):
+        service = _service()
+        service.user_repository.get_users_after = AsyncMock(return_value=_users(1))
+        service.user_repository.get_users_list_with_count = AsyncMock()
+
+        with _with_mode("window"):
+            response = await service.get_users_list(0, 2, encode_cursor(BASE_TIME, 101))
+
+        service.user_repository.get_users_list_with_count.assert_not_awaited()
+        service.session_factory.session.execute.assert_awaited_once()
+        assert response.total_count == 50
+
+    def test_window_query(self):
+        sql = str(user_repository._SELECT_USERS_PAGE_WITH_COUNT.compile(dialect=postgresql.dialect()))
+
+        assert "count(*) OVER () AS total_count" in sql
+        assert "LIMIT" in sql and "OFFSET" in sql
+
+
+class TestUserListProjection:
+    @pytest.mark.parametrize("statement", ["_SELECT_USERS_PAGE", "_SELECT_USERS_AFTER", "_SELECT_USERS_PAGE_WITH_COUNT"])
+    def test_list_queries_skip_password(self, statement):
+        sql = str(getattr(user_repository, statement).compile(dialect=postgresql.dialect()))
+        selected_columns = sql.split("FROM")[0]
+
+        assert "users.password" not in sql
+        assert "users.deleted_at" not in selected_columns
+        assert "users.email" in selected_columns
+
+    def test_rows_validate_in_bulk(self):
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            rows = connection.execute(
+                select(
+                    literal(1).label("id"),
+                    literal("a@example.com").label("email"),
+                    literal("a").label("profile_name"),
+                    literal("ADMIN").label("role"),
+                    literal(True).label("is_active"),
+                    literal(BASE_TIME).label("created_at"),
+                    literal(None).label("updated_at"),
+                )
+            ).all()
+
+        users = USER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+
+        assert users[0].email == "a@example.com"
+        assert users[0].role == "ADMIN"
+
+
+class TestCreateUser:
+    def _dto(self):
+        return UserCreateDto(email="new@example.com", password="secret1", profile_name="New")
+
+    @pytest.mark.asyncio
+    async def test_single_statement(self):
+        service = _service()
+        service.user_repository.create_user_with_jwt_storage = AsyncMock(
+            return_value=SimpleNamespace(id=7, created_at=BASE_TIME)
+        )
+
+        with patch("app.users.services.user_service.hash_password_async", AsyncMock(return_value="hashed")):
+            result = await service.create_user(self._dto())
+
+        assert result == {"id": 7, "message": "success"}
+        service.user_repository.create_user_with_jwt_storage.assert_awaited_once_with("new@example.com", "hashed", "New")
+        service.user_repository.email_exists.assert_awaited_once_with("new@example.com")
+        service.user_repository.get_user_by_email.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_count(self):
+        service = _service()
+        service.user_repository.create_user_with_jwt_storage = AsyncMock(
+            return_value=SimpleNamespace(id=7, created_at=BASE_TIME)
+        )
+        cache = CountCache(ttl_seconds=30)
+
+        with patch("app.users.services.user_service.count_cache", cache):
+            assert await service._get_total_count("cached") == (50, False)
+            with patch("app.users.services.user_service.hash_password_async", AsyncMock(return_value="hashed")):
+                await service.create_user(self._dto())
+            service.user_repository.get_users_count.return_value = 51
+            assert await service._get_total_count("cached") == (51, False)
+
+        assert cache.loads == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_email(self):
+        service = _service()
+        service.user_repository.create_user_with_jwt_storage = AsyncMock(
+            side_effect=IntegrityError("INSERT", {}, Exception("duplicate key"))
+        )
+
+        with patch("app.users.services.user_service.hash_password_async", AsyncMock(return_value="hashed")):
+            with pytest.raises(AppError) as exc_info:
+                await service.create_user(self._dto())
+
+        assert exc_info.value.error_code == USERS_ERRORS["USER_EMAIL_ALREADY_EXIST"]["errorCode"]
+
+    @pytest.mark.asyncio
+    async def test_existing_email_rejected_before_hashing(self):
+        service = _service()
+        service.user_repository.email_exists = AsyncMock(return_value=True)
+        service.user_repository.create_user_with_jwt_storage = AsyncMock()
+        hash_password = AsyncMock(return_value="hashed")
+
+        with patch("app.users.services.user_service.hash_password_async", hash_password):
+            with pytest.raises(AppError) as exc_info:
+                await service.create_user(self._dto())
+
+        assert exc_info.value.error_code == USERS_ERRORS["USER_EMAIL_ALREADY_EXIST"]["errorCode"]
+        hash_password.assert_not_awaited()
+        service.user_repository.create_user_with_jwt_storage.assert_not_awaited()
+
+    def test_email_exists_reads_index_only(self):
+        sql = str(user_repository._EMAIL_EXISTS.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("SELECT EXISTS (SELECT *")
+        assert "users.password" not in sql
+
+    def test_user_and_jwt_storage_in_one_statement(self):
+        sql = str(user_repository._CREATE_USER_WITH_JWT_STORAGE.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("WITH inserted_user AS \n(INSERT INTO users")
+        assert "RETURNING users.id, users.created_at" in sql
+        assert "INSERT INTO jwt_storage (user_id, created_at, updated_at) SELECT inserted_user.id" in sql
+
+
+class TestDeleteUser:
+    @pytest.mark.asyncio
+    async def test_invalidates_cached_count(self):
+        service = _service()
+        service.user_repository.soft_delete_user = AsyncMock(return_value=True)
+        cache = CountCache(ttl_seconds=30)
+        current_user = SimpleNamespace(id=7, email="old@example.com")
+
+        with patch("app.users.services.user_service.count_cache", cache):
+            await service._get_total_count("cached")
+            assert cache.get_stats()["size"] == 1
+
+            assert await service.delete_user(current_user) == {"message": "success"}
+
+        assert cache.get_stats()["size"] == 0
+        service.user_repository.soft_delete_user.assert_awaited_once_with(7)
@@ -0,0 +1,18 @@
+import pytest
+from datetime import datetime, timezone
+from app.utils.cursor import encode_cursor, decode_cursor
+
+
+class TestCursor:
+    def test_roundtrip(self):
+        created_at = datetime(2025, 7, 15, 20, 5, 14, 548736, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(created_at, 42)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, 42)
+
+    @pytest.mark.parametrize("cursor", ["", "not-base64!", "WyJ4IiwxXQ", "WyIyMDI1LTA3LTE1IiwiMSJd"])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)